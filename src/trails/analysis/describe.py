@@ -1,7 +1,44 @@
 """Functions for describing and analyzing data columns."""
 
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import ExitStack
+
+import numpy as np
 import pandas as pd
 
+# With use_processes=True, object columns longer than this are described in worker processes
+PROCESS_POOL_MIN_ROWS = 1_000_000
+
+# Upper bound on worker processes used by describe_dataframe
+MAX_PROCESS_WORKERS = 4
+
+
+def _top_k_indices(counts: np.ndarray, k: int) -> np.ndarray:
+    """Return indices of the k largest counts, most frequent first.
+
+    Uses partial selection so high-cardinality columns avoid a full sort.
+    Ties are broken by position, i.e. order of first appearance.
+
+    Args:
+        counts: Occurrence count per unique value
+        k: Number of indices to return
+
+    Returns:
+        Array of at most k indices into counts
+    """
+    k = min(k, len(counts))
+    if k == 0:
+        return np.empty(0, dtype=np.intp)
+
+    # Everything strictly above the k-th largest count is in; fill the rest
+    # with the earliest values that tie with the threshold
+    threshold = counts[np.argpartition(-counts, k - 1)[k - 1]]
+    above = np.flatnonzero(counts > threshold)
+    ties = np.flatnonzero(counts == threshold)[: k - len(above)]
+    selected = np.concatenate([above, ties])
+
+    return selected[np.argsort(-counts[selected], kind="stable")]
+
 
 def describe_column(series: pd.Series, name: str | None = None) -> str:
     """Generate a detailed text description of a pandas Series/column.
@@ -43,9 +80,17 @@ def describe_column(series: pd.Series, name: str | None = None) -> str:
     # Header line
     lines.append(f"{col_name} [{dtype_str}]:")
 
+    # Hash the column once; null count, unique count, min/max and their
+    # frequencies are all read off the codes instead of rescanning the column.
+    # Nulls get code -1, so shifting by one puts their count in slot 0 and
+    # no null-free copy of the column is needed.
+    codes, uniques = pd.factorize(series, sort=False)
+    counts_with_null = np.bincount(codes + 1, minlength=len(uniques) + 1)
+    counts = counts_with_null[1:]
+
     # Non-null count
-    non_null = series.notna().sum()
     total = len(series)
+    non_null = total - counts_with_null[0]
     pct_complete = (non_null / total * 100) if total > 0 else 0
     lines.append(f"  Non-null: {non_null}/{total} ({pct_complete:.1f}% complete)")
 
@@ -53,43 +98,44 @@ def describe_column(series: pd.Series, name: str | None = None) -> str:
     if non_null == 0:
         return "\n".join(lines)
 
-    # Get non-null values for further analysis
-    valid_series = series.dropna()
-
     # Unique values count
-    n_unique = valid_series.nunique()
+    n_unique = len(uniques)
     lines.append(f"  Unique values: {n_unique}")
 
     # Is unique check
     is_unique = n_unique == non_null
     lines.append(f"  Is unique: {is_unique}")
 
-    # Type-specific statistics
-    if pd.api.types.is_datetime64_any_dtype(series):
+    # Type-specific statistics, dispatched on the dtype kind character
+    # ("M" datetime, "f" float, "b"/"i"/"u"/"c" other numeric), which also
+    # covers nullable extension dtypes such as Int64, Float64 and tz-aware datetimes
+    kind = series.dtype.kind
+    is_float = kind == "f"
+    if kind == "M":
         # Datetime statistics with counts
-        min_val = valid_series.min()
-        max_val = valid_series.max()
-        min_count = (valid_series == min_val).sum()
-        max_count = (valid_series == max_val).sum()
+        min_pos = int(uniques.argmin())
+        max_pos = int(uniques.argmax())
+        min_val, min_count = uniques[min_pos], counts[min_pos]
+        max_val, max_count = uniques[max_pos], counts[max_pos]
         lines.append(f"  Min: {min_val} ({min_count})")
         lines.append(f"  Max: {max_val} ({max_count})")
 
-    elif pd.api.types.is_numeric_dtype(series):
+    elif kind in "biufc":
         # Numeric statistics with counts for min/max
-        min_val = valid_series.min()
-        max_val = valid_series.max()
-        min_count = (valid_series == min_val).sum()
-        max_count = (valid_series == max_val).sum()
+        min_pos = int(uniques.argmin())
+        max_pos = int(uniques.argmax())
+        min_val, min_count = uniques[min_pos], counts[min_pos]
+        max_val, max_count = uniques[max_pos], counts[max_pos]
 
-        if pd.api.types.is_float_dtype(series):
+        if is_float:
             lines.append(f"  Min: {min_val:.2f} ({min_count})")
             lines.append(f"  Max: {max_val:.2f} ({max_count})")
         else:
             lines.append(f"  Min: {min_val} ({min_count})")
             lines.append(f"  Max: {max_val} ({max_count})")
 
-        median_val = valid_series.median()
-        if pd.api.types.is_float_dtype(series):
+        median_val = series.median()
+        if is_float:
             lines.append(f"  Median: {median_val:.2f}")
         else:
             # For integer types, check if median is a whole number
@@ -98,27 +144,44 @@ def describe_column(series: pd.Series, name: str | None = None) -> str:
             else:
                 lines.append(f"  Median: {median_val:.2f}")
 
-        lines.append(f"  Mean: {valid_series.mean():.2f}")
+        lines.append(f"  Mean: {series.mean():.2f}")
 
     # String/object type
-    value_counts = valid_series.value_counts()
-
     if n_unique < 5:
-        # Show all values with counts
+        # Show all values with counts (most frequent first, ties in order of appearance)
         values_list = []
-        for value, count in value_counts.items():
-            values_list.append(f"{value} ({count})")
+        for i in np.argsort(-counts, kind="stable"):
+            values_list.append(f"{uniques[i]} ({counts[i]})")
         lines.append(f"  Values: {values_list}")
     else:
         # Show top 5 values
         lines.append("  Top 5 values:")
-        for value, count in value_counts.head(5).items():
-            lines.append(f"    - {value}: {count}")
+        for i in _top_k_indices(counts, 5):
+            lines.append(f"    - {uniques[i]}: {counts[i]}")
 
     return "\n".join(lines)
 
 
-def describe_dataframe(df: pd.DataFrame, columns: list[str] | None = None, sort_by_completeness: bool = True) -> str:
+def _describe_values(values: np.ndarray, name: str) -> str:
+    """Describe a raw column array (picklable entry point for worker processes).
+
+    Args:
+        values: Column values
+        name: Column name to display
+
+    Returns:
+        Formatted string description of the column
+    """
+    return describe_column(pd.Series(values, dtype=values.dtype, name=name), name)
+
+
+def describe_dataframe(
+    df: pd.DataFrame,
+    columns: list[str] | None = None,
+    sort_by_completeness: bool = True,
+    max_workers: int | None = None,
+    use_processes: bool = False,
+) -> str:
     """Generate descriptions for multiple columns in a DataFrame.
 
     Columns can be sorted by completeness (highest first) to show the most
@@ -128,6 +191,11 @@ def describe_dataframe(df: pd.DataFrame, columns: list[str] | None = None, sort_
         df: The DataFrame to describe
         columns: List of column names to describe (None for all columns)
         sort_by_completeness: If True, sort columns by completeness (default True)
+        max_workers: Number of threads used to describe columns (None for the executor default)
+        use_processes: If True, describe object columns of frames with more than
+            PROCESS_POOL_MIN_ROWS rows in worker processes. Their values are copied to
+            the workers, and process pools can misbehave under notebooks or in threaded
+            programs, so this is off by default (default False).
 
     Returns:
         Formatted string with descriptions of all requested columns
@@ -135,20 +203,36 @@ def describe_dataframe(df: pd.DataFrame, columns: list[str] | None = None, sort_
     if columns is None:
         columns = df.columns.tolist()
 
-    # Calculate completeness for each valid column
-    valid_columns = []
-    for col in columns:
-        if col in df.columns:
-            completeness = df[col].notna().sum() / len(df) * 100 if len(df) > 0 else 0
-            valid_columns.append((col, completeness))
+    # Keep only columns present in the DataFrame
+    ordered_columns = [col for col in columns if col in df.columns]
 
-    # Sort by completeness if requested
+    # Sort by completeness if requested (highest first, ties keep their order)
     if sort_by_completeness:
-        valid_columns.sort(key=lambda x: x[1], reverse=True)
+        completeness = df[ordered_columns].notna().sum(axis=0).to_numpy()
+        order = np.argsort(-completeness, kind="stable")
+        ordered_columns = [ordered_columns[i] for i in order]
+
+    # Hashing Python strings holds the GIL, so on request huge object columns go to
+    # worker processes (only their values are pickled); everything else runs on threads
+    # since the heavy lifting happens in pandas/NumPy kernels that release the GIL
+    process_columns: set[str] = set()
+    if use_processes and len(df) > PROCESS_POOL_MIN_ROWS:
+        process_columns = {col for col in ordered_columns if df[col].dtype == object}
+
+    with ExitStack() as stack:
+        threads = stack.enter_context(ThreadPoolExecutor(max_workers=max_workers))
+        futures: list[Future[str]]
+        if process_columns:
+            processes = stack.enter_context(ProcessPoolExecutor(max_workers=min(MAX_PROCESS_WORKERS, len(process_columns))))
+            futures = [
+                processes.submit(_describe_values, df[col].to_numpy(), col)
+                if col in process_columns
+                else threads.submit(describe_column, df[col], col)
+                for col in ordered_columns
+            ]
+        else:
+            futures = [threads.submit(describe_column, df[col], col) for col in ordered_columns]
 
-    # Generate descriptions in order
-    descriptions = []
-    for col, _ in valid_columns:
-        descriptions.append(describe_column(df[col], col))
+        descriptions = [future.result() for future in futures]
 
     return "\n\n".join(descriptions)
@@ -2,25 +2,147 @@
 
 import hashlib
 import json
+import os
 import pickle
+import shutil
+import tempfile
+import time
+from collections import OrderedDict
+from collections.abc import Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
 from datetime import datetime
 from pathlib import Path
 from typing import Any, NamedTuple
 
+import geopandas as gpd
+import numpy as np
+import pandas as pd
+import pyarrow.parquet as pq
 import requests
 
+# Read size for streamed downloads; large chunks keep per-chunk Python overhead negligible
+DOWNLOAD_CHUNK_SIZE = 1 << 20  # 1 MiB
+
+# Minimum time between progress updates in seconds
+PROGRESS_INTERVAL = 0.25
+
+# Suffix of in-progress cache files, moved into place once fully written
+TEMP_SUFFIX = ".tmp"
+
+
+# Umask assumed where the process umask cannot be read without changing it
+DEFAULT_UMASK = 0o022
+
+
+def _current_umask() -> int:
+    """Read the process umask from /proc/self/status, or assume DEFAULT_UMASK where it is unavailable.
+
+    os.umask can only read the umask by setting it, which would briefly change it for every
+    thread of the process.
+    """
+    try:
+        with open("/proc/self/status") as f:
+            for line in f:
+                if line.startswith("Umask:"):
+                    return int(line.split()[1], 8)
+    except OSError:
+        pass
+    return DEFAULT_UMASK
+
+
+# Mode of cache files, as a plain open() would create them; mkstemp creates them as 0600
+FILE_MODE = 0o666 & ~_current_umask()
+
+# Mode of directories written next to their target and moved into place; mkdtemp creates them as 0700
+DIR_MODE = 0o777 & ~_current_umask()
+
+# Datetime units Parquet stores as is; coarser units come back as milliseconds
+PARQUET_DATETIME_UNITS = ("ns", "us")
+
+# Single background writer for Object.save(async_save=True); one thread keeps
+# saves to the same key in submission order
+_SAVE_EXECUTOR = ThreadPoolExecutor(max_workers=1, thread_name_prefix="trails-cache-save")
+
+
+def _round_trips_through_parquet(values: pd.Series | pd.Index) -> bool:
+    """Check whether a column or index comes back from Parquet unchanged.
+
+    Only dtypes known to round-trip exactly qualify: numeric, bool, geometry,
+    Python-backed string with NA, ns/us datetimes and categoricals with string
+    categories. Object columns qualify only when they hold strings with None for
+    missing values; lists, tuples, mixed types or NaN would come back changed.
+    Other categoricals, second/millisecond datetimes and pyarrow-backed or
+    NaN-backed strings come back with a different dtype.
+
+    Args:
+        values: Column or index to check
+
+    Returns:
+        True if the values are stored and restored exactly
+    """
+    dtype = values.dtype
+    if isinstance(dtype, pd.CategoricalDtype):
+        # Categories of any other dtype are restored as plain values of that dtype
+        return pd.api.types.is_object_dtype(dtype.categories) and _round_trips_through_parquet(dtype.categories)
+    if isinstance(dtype, pd.StringDtype):
+        return dtype.storage == "python" and dtype.na_value is pd.NA
+    if isinstance(dtype, gpd.array.GeometryDtype) or pd.api.types.is_bool_dtype(dtype):
+        return True
+    if pd.api.types.is_datetime64_any_dtype(dtype):
+        unit = dtype.unit if isinstance(dtype, pd.DatetimeTZDtype) else np.datetime_data(str(dtype))[0]
+        return unit in PARQUET_DATETIME_UNITS
+    if pd.api.types.is_numeric_dtype(dtype):
+        return dtype.kind != "c"
+    if pd.api.types.is_object_dtype(dtype) and pd.api.types.infer_dtype(values, skipna=True) == "string":
+        return all(value is None for value in values[pd.isna(values)])
+    return False
+
 
 class Object:
-    """Cache for Python objects using pickle serialization."""
+    """Cache for Python objects.
+
+    DataFrames and GeoDataFrames are stored as (Geo)Parquet, which is columnar,
+    compressed and much faster to load than pickled Shapely objects. Everything
+    else, including frames whose columns would not come back from Parquet
+    unchanged, falls back to pickle.
+    """
+
+    # Data file suffixes in probe order
+    DATA_SUFFIXES = (".parquet", ".pkl")
 
-    def __init__(self, cache_dir: str = ".cache/objects"):
+    # Suffix of directory entries from get_dir_path; delete() and clear() remove no other directories
+    DIR_SUFFIX = ".dir"
+
+    def __init__(self, cache_dir: str = ".cache/objects", memory_cache_size: int = 0):
         """Initialize cache with specified directory.
 
         Args:
             cache_dir: Directory to store cached files
+            memory_cache_size: Number of loaded objects kept in memory and returned as the
+                same object on repeated loads; 0 (default) disables this, so every load
+                returns a fresh object
         """
         self.cache_dir = Path(cache_dir)
         self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.memory_cache_size = memory_cache_size
+        # key -> ((suffix, mtime_ns, size) of the data file, loaded object), LRU order
+        self._memcache: OrderedDict[str, tuple[tuple[str, int, int], Any]] = OrderedDict()
+
+    def _find_data_file(self, key: str) -> Path | None:
+        """Find the data file for a cache key, whatever its format.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Path to the data file if it exists, None otherwise
+        """
+        for suffix in self.DATA_SUFFIXES:
+            data_file = self.cache_dir / f"{key}{suffix}"
+            if data_file.exists():
+                return data_file
+        return None
 
     def exists(self, key: str) -> bool:
         """Check if cache key exists.
@@ -29,30 +151,120 @@ class Object:
             key: Cache key to check
 
         Returns:
-            True if cached data exists
+            True if cached data or a directory entry from get_dir_path(key) exists
+        """
+        return self._find_data_file(key) is not None or self.get_dir_path(key).is_dir()
+
+    def save(self, key: str, data: Any, metadata: dict | None = None, async_save: bool = False) -> Future[None] | None:
+        """Save data to cache.
+
+        Files are written to a temporary file first and moved into place with
+        os.replace, so readers never see a partially written entry.
+
+        Args:
+            key: Cache key for the data
+            data: Data to cache (DataFrame/GeoDataFrame or anything pickleable)
+            metadata: Optional metadata about the cached data
+            async_save: Write in a background thread and return immediately. The
+                data must not be modified until the returned future is done.
+
+        Returns:
+            Future of the background write if async_save is True, None otherwise
         """
-        return (self.cache_dir / f"{key}.pkl").exists()
+        self._memcache.pop(key, None)
 
-    def save(self, key: str, data: Any, metadata: dict | None = None) -> None:
-        """Save data to cache using pickle.
+        if async_save:
+            return _SAVE_EXECUTOR.submit(self._save, key, data, metadata)
+
+        self._save(key, data, metadata)
+        return None
+
+    def _save(self, key: str, data: Any, metadata: dict | None) -> None:
+        """Write the data and metadata files of a cache entry.
 
         Args:
             key: Cache key for the data
-            data: Data to cache (must be pickleable)
+            data: Data to cache
             metadata: Optional metadata about the cached data
         """
-        # Save data with pickle
-        with open(self.cache_dir / f"{key}.pkl", "wb") as f:
-            pickle.dump(data, f)
+        data_file = self.cache_dir / f"{key}.parquet"
+        if not (isinstance(data, pd.DataFrame) and self._is_parquet_safe(data) and self._save_parquet(data_file, data)):
+            # Save data with pickle; protocol 5 streams large NumPy buffers
+            # (e.g. geometry and column arrays) to the file without extra copies
+            data_file = self.cache_dir / f"{key}.pkl"
+            with self._atomic_path(data_file) as tmp_path, open(tmp_path, "wb") as f:
+                pickle.dump(data, f, protocol=pickle.HIGHEST_PROTOCOL)
+
+        # Remove a previous entry that may have been stored in another format
+        for suffix in self.DATA_SUFFIXES:
+            if suffix != data_file.suffix:
+                (self.cache_dir / f"{key}{suffix}").unlink(missing_ok=True)
 
         # Save metadata if provided
         if metadata is not None:
-            metadata["cached_at"] = datetime.now().isoformat()
-            with open(self.cache_dir / f"{key}.meta.json", "w") as f:
+            # A new dict, as the caller may still be using theirs while a background save runs
+            metadata = {**metadata, "cached_at": datetime.now().isoformat()}
+            with self._atomic_path(self.cache_dir / f"{key}.meta.json") as tmp_path, open(tmp_path, "w") as f:
                 json.dump(metadata, f, indent=2)
 
+    def _is_parquet_safe(self, data: pd.DataFrame) -> bool:
+        """Check whether a DataFrame can be stored as Parquet without changing its values.
+
+        Args:
+            data: DataFrame or GeoDataFrame to store
+
+        Returns:
+            True if every column and the index round-trip exactly through Parquet
+        """
+        if isinstance(data.index, pd.MultiIndex) or not _round_trips_through_parquet(data.index):
+            return False
+        return all(_round_trips_through_parquet(column) for _, column in data.items())
+
+    def _save_parquet(self, parquet_file: Path, data: pd.DataFrame) -> bool:
+        """Save a DataFrame or GeoDataFrame as Parquet.
+
+        Args:
+            parquet_file: Target Parquet file
+            data: DataFrame or GeoDataFrame to store
+
+        Returns:
+            True if written, False if the frame cannot be represented in Parquet
+            (e.g. mixed-type object columns)
+        """
+        try:
+            with self._atomic_path(parquet_file) as tmp_path:
+                data.to_parquet(tmp_path, compression="zstd")
+        except (ValueError, TypeError, NotImplementedError):
+            return False
+        return True
+
+    @contextmanager
+    def _atomic_path(self, target: Path) -> Iterator[Path]:
+        """Provide a temporary path that replaces target once the block succeeds.
+
+        Args:
+            target: Final file path
+
+        Yields:
+            Temporary file path in the cache directory to write to
+        """
+        fd, tmp_name = tempfile.mkstemp(dir=self.cache_dir, prefix=f".{target.name}.", suffix=TEMP_SUFFIX)
+        os.close(fd)
+        tmp_path = Path(tmp_name)
+        try:
+            yield tmp_path
+            os.chmod(tmp_path, FILE_MODE)
+            os.replace(tmp_path, target)
+        finally:
+            tmp_path.unlink(missing_ok=True)
+
     def load(self, key: str) -> Any:
-        """Load data from cache using pickle.
+        """Load data from cache.
+
+        With memory_cache_size > 0, recently loaded objects are kept in memory and
+        returned directly as long as their data file is unchanged on disk. Repeated
+        loads of the same key then return the same object; copy it before modifying
+        it in place. By default every load returns a fresh object.
 
         Args:
             key: Cache key to load
@@ -63,10 +275,43 @@ class Object:
         Raises:
             FileNotFoundError: If cache key doesn't exist
         """
-        cache_file = self.cache_dir / f"{key}.pkl"
-        if not cache_file.exists():
+        cache_file = self._find_data_file(key)
+        if cache_file is None:
             raise FileNotFoundError(f"Cache key '{key}' not found")
 
+        stat = cache_file.stat()
+        stamp = (cache_file.suffix, stat.st_mtime_ns, stat.st_size)
+        cached = self._memcache.get(key)
+        if cached is not None and cached[0] == stamp:
+            self._memcache.move_to_end(key)
+            return cached[1]
+
+        data = self._read_data_file(cache_file)
+
+        if self.memory_cache_size > 0:
+            self._memcache[key] = (stamp, data)
+            self._memcache.move_to_end(key)
+            while len(self._memcache) > self.memory_cache_size:
+                self._memcache.popitem(last=False)
+
+        return data
+
+    def _read_data_file(self, cache_file: Path) -> Any:
+        """Read a data file in the format given by its suffix.
+
+        Args:
+            cache_file: Parquet or pickle data file
+
+        Returns:
+            Deserialized data
+        """
+        if cache_file.suffix == ".parquet":
+            # GeoParquet files carry "geo" metadata; plain frames are read by pandas
+            schema_metadata = pq.read_schema(cache_file).metadata or {}
+            if b"geo" in schema_metadata:
+                return gpd.read_parquet(cache_file)
+            return pd.read_parquet(cache_file)
+
         with open(cache_file, "rb") as f:
             return pickle.load(f)
 
@@ -96,16 +341,41 @@ class Object:
         """
         return self.cache_dir / key
 
+    def get_dir_path(self, key: str) -> Path:
+        """Get path for a directory entry, e.g. a directory of Parquet files.
+
+        Unlike paths from get_path, directory entries belong to the cache and are
+        covered by exists(), delete() and clear().
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Path object for the directory
+        """
+        return self.cache_dir / f"{key}{self.DIR_SUFFIX}"
+
+    def _delete_data_files(self, key: str) -> None:
+        """Delete the data files of a cache entry in all formats.
+
+        Args:
+            key: Cache key to delete
+        """
+        for suffix in self.DATA_SUFFIXES:
+            (self.cache_dir / f"{key}{suffix}").unlink(missing_ok=True)
+
     def delete(self, key: str) -> None:
-        """Delete a specific cache entry.
+        """Delete a specific cache entry, including its directory entry from get_dir_path(key).
 
         Args:
             key: Cache key to delete
         """
         # Delete data file
-        pkl_file = self.cache_dir / f"{key}.pkl"
-        if pkl_file.exists():
-            pkl_file.unlink()
+        self._memcache.pop(key, None)
+        self._delete_data_files(key)
+        dir_path = self.get_dir_path(key)
+        if dir_path.is_dir():
+            shutil.rmtree(dir_path)
 
         # Delete metadata file
         meta_file = self.cache_dir / f"{key}.meta.json"
@@ -122,11 +392,16 @@ class Object:
             # Clear specific key (backwards compatibility)
             self.delete(key)
         else:
-            # Clear all cache files
-            for file in self.cache_dir.glob("*.pkl"):
-                file.unlink()
-            for file in self.cache_dir.glob("*.meta.json"):
-                file.unlink()
+            # Clear all cache files in a single directory scan
+            self._memcache.clear()
+            # Temporary files are left alone: a background save may still be writing one
+            cache_suffixes = (*self.DATA_SUFFIXES, ".meta.json")
+            with os.scandir(self.cache_dir) as entries:
+                for entry in entries:
+                    if entry.name.endswith(cache_suffixes) and entry.is_file():
+                        os.unlink(entry.path)
+                    elif entry.name.endswith(self.DIR_SUFFIX) and entry.is_dir():
+                        shutil.rmtree(entry.path)
 
 
 class DownloadResult(NamedTuple):
@@ -182,7 +457,7 @@ class Download:
 
         if needs_download:
             print(f"Downloading from {url}...")
-            self._download_file(url, file_path)
+            checksum = self._download_file(url, file_path)
 
             # Save metadata
             metadata = {
@@ -190,6 +465,7 @@ class Download:
                 "version": version,
                 "downloaded_at": datetime.now().isoformat(),
                 "file_size": file_path.stat().st_size,
+                "blake2b": checksum,
             }
             with open(meta_path, "w") as f:
                 json.dump(metadata, f, indent=2)
@@ -207,12 +483,18 @@ class Download:
 
             return DownloadResult(path=file_path, was_downloaded=False, version=cached_version)
 
-    def _download_file(self, url: str, target_path: Path) -> None:
+    def _download_file(self, url: str, target_path: Path) -> str:
         """Download file with progress indicator.
 
+        The content checksum is computed on the fly from the chunks being
+        written, so the file never has to be read back for hashing.
+
         Args:
             url: URL to download
             target_path: Where to save the file
+
+        Returns:
+            BLAKE2b hex digest (128 bit) of the downloaded content
         """
         response = requests.get(url, stream=True)
         response.raise_for_status()
@@ -220,21 +502,29 @@ class Download:
         total_size = int(response.headers.get("content-length", 0))
         downloaded = 0
         last_progress = -1
+        last_print = 0.0
+        hasher = hashlib.blake2b(digest_size=16)
 
         with open(target_path, "wb") as f:
-            for chunk in response.iter_content(chunk_size=8192):
+            for chunk in response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
                 if chunk:
                     f.write(chunk)
+                    hasher.update(chunk)
                     downloaded += len(chunk)
                     if total_size > 0:
                         progress = int((downloaded / total_size) * 100)
-                        # Only update display when progress changes by at least 1%
-                        if progress != last_progress:
+                        # Only update display when progress changes, at most every
+                        # PROGRESS_INTERVAL seconds (the final 100% always shows)
+                        now = time.monotonic()
+                        if progress != last_progress and (now - last_print >= PROGRESS_INTERVAL or downloaded >= total_size):
                             print(f"\rProgress: {progress}%", end="", flush=True)
                             last_progress = progress
+                            last_print = now
 
         print()  # New line after progress
 
+        return hasher.hexdigest()
+
     def get_cached_file(self, filename: str) -> Path | None:
         """Get path to cached file if it exists.
 
@@ -10,6 +10,7 @@ from .area_selector import (
 )
 from .gpx import (
     export_to_gpx,
+    export_to_gpx_fast,
     export_to_gpx_single_track,
     export_to_gpx_zip,
     export_to_gpx_zip_smart,
@@ -20,6 +21,7 @@ from .gpx import (
 __all__ = [
     # GPX export
     "export_to_gpx",
+    "export_to_gpx_fast",
     "export_to_gpx_single_track",
     "export_to_gpx_zip",
     "export_to_gpx_zip_smart",
@@ -7,8 +7,11 @@ from typing import Any
 
 import folium
 import geopandas as gpd
+import numpy as np
+import shapely
 from folium import plugins
 from folium.plugins import Geocoder
+from shapely.geometry import mapping
 
 try:
     import ipyleaflet
@@ -18,6 +21,42 @@ try:
 except ImportError:
     IPYLEAFLET_AVAILABLE = False
 
+# Style for the greyed-out trails shown as context on selection maps
+CONTEXT_TRAIL_STYLE = {
+    "color": "gray",
+    "weight": 1,
+    "opacity": 0.5,
+}
+
+# Instructions overlay shown on selection maps
+SELECTION_INSTRUCTIONS_HTML = """
+<div style='position: fixed; top: 80px; right: 10px; width: 320px;
+            background-color: white; padding: 15px; border: 2px solid gray;
+            border-radius: 5px; z-index: 1000; font-size: 14px;'>
+    <h4 style="margin-top: 0;">Area Selection Instructions</h4>
+
+    <p style="margin: 10px 0;"><b>🔍 Search for a City:</b></p>
+    <ul style="margin: 5px 0; padding-left: 20px;">
+        <li>Use the search box (top-left) to find any Norwegian city</li>
+        <li>Type city name and press Enter</li>
+        <li>Map will zoom to that location</li>
+    </ul>
+
+    <p style="margin: 10px 0;"><b>📍 Select Area:</b></p>
+    <ol style="margin: 5px 0; padding-left: 20px;">
+        <li>After zooming to your city, click the square icon (□)</li>
+        <li>Draw a rectangle around your desired area</li>
+        <li>Or click on map to see coordinates</li>
+    </ol>
+
+    <p style="margin: 10px 0; color: #666;">
+        <b>Example bounds:</b><br>
+        (min_lon, min_lat, max_lon, max_lat)<br>
+        (8.5, 58.8, 9.2, 59.2)
+    </p>
+</div>
+"""
+
 
 def create_selection_map(
     gdf: gpd.GeoDataFrame,
@@ -63,16 +102,15 @@ def create_selection_map(
     sample_size = min(1000, len(gdf_wgs))
     sampled = gdf_wgs.sample(n=sample_size) if len(gdf_wgs) > sample_size else gdf_wgs
 
-    for _, trail in sampled.iterrows():
-        if trail.geometry:
-            folium.GeoJson(
-                trail.geometry.__geo_interface__,
-                style_function=lambda x: {
-                    "color": "gray",
-                    "weight": 1,
-                    "opacity": 0.5,
-                },
-            ).add_to(trail_group)
+    # Add all sampled trails as one FeatureCollection instead of one layer per trail
+    features = [
+        {"type": "Feature", "properties": {}, "geometry": mapping(geom)} for geom in sampled.geometry if geom is not None and not geom.is_empty
+    ]
+    if features:
+        folium.GeoJson(
+            {"type": "FeatureCollection", "features": features},
+            style_function=lambda x: CONTEXT_TRAIL_STYLE,
+        ).add_to(trail_group)
 
     trail_group.add_to(m)
 
@@ -106,34 +144,7 @@ def create_selection_map(
     Geocoder(position="topleft", collapsed=False, placeholder="Search for a city...", error_message="Nothing found").add_to(m)
 
     # Add instructions
-    instructions = """
-    <div style='position: fixed; top: 80px; right: 10px; width: 320px;
-                background-color: white; padding: 15px; border: 2px solid gray;
-                border-radius: 5px; z-index: 1000; font-size: 14px;'>
-        <h4 style="margin-top: 0;">Area Selection Instructions</h4>
-
-        <p style="margin: 10px 0;"><b>🔍 Search for a City:</b></p>
-        <ul style="margin: 5px 0; padding-left: 20px;">
-            <li>Use the search box (top-left) to find any Norwegian city</li>
-            <li>Type city name and press Enter</li>
-            <li>Map will zoom to that location</li>
-        </ul>
-
-        <p style="margin: 10px 0;"><b>📍 Select Area:</b></p>
-        <ol style="margin: 5px 0; padding-left: 20px;">
-            <li>After zooming to your city, click the square icon (□)</li>
-            <li>Draw a rectangle around your desired area</li>
-            <li>Or click on map to see coordinates</li>
-        </ol>
-
-        <p style="margin: 10px 0; color: #666;">
-            <b>Example bounds:</b><br>
-            (min_lon, min_lat, max_lon, max_lat)<br>
-            (8.5, 58.8, 9.2, 59.2)
-        </p>
-    </div>
-    """
-    m.get_root().html.add_child(folium.Element(instructions))  # type: ignore[attr-defined]
+    m.get_root().html.add_child(folium.Element(SELECTION_INSTRUCTIONS_HTML))  # type: ignore[attr-defined]
 
     # Add layer control
     folium.LayerControl().add_to(m)
@@ -162,17 +173,30 @@ def parse_drawn_bounds(drawn_features: str) -> tuple[float, float, float, float]
         geometry = feature.get("geometry", {})
 
         if geometry.get("type") == "Polygon":
-            coords = geometry.get("coordinates", [[]])[0]
-            if len(coords) >= 4:
-                lons = [c[0] for c in coords]
-                lats = [c[1] for c in coords]
-                return (min(lons), min(lats), max(lons), max(lats))
-    except (json.JSONDecodeError, KeyError, IndexError):
+            coords = np.asarray(geometry.get("coordinates", [[]])[0], dtype=np.float64)
+            if coords.ndim == 2 and coords.shape[0] >= 4:
+                return _ring_bounds(coords)
+    except (json.JSONDecodeError, KeyError, IndexError, ValueError):
         pass
 
     return None
 
 
+def _ring_bounds(coords: Any) -> tuple[float, float, float, float]:
+    """Compute the bounding box of a polygon ring.
+
+    Args:
+        coords: Ring coordinates as (lon, lat) pairs (list or array)
+
+    Returns:
+        Bounding box as (minx, miny, maxx, maxy)
+    """
+    arr = np.asarray(coords, dtype=np.float64)[:, :2]
+    min_lon, min_lat = arr.min(axis=0)
+    max_lon, max_lat = arr.max(axis=0)
+    return (float(min_lon), float(min_lat), float(max_lon), float(max_lat))
+
+
 def export_trails_for_area(
     trails_gdf: gpd.GeoDataFrame,
     bounds: tuple[float, float, float, float],
@@ -331,17 +355,20 @@ def create_interactive_selection_map(
     sample_size = min(1000, len(gdf_wgs))
     sampled = gdf_wgs.sample(n=sample_size) if len(gdf_wgs) > sample_size else gdf_wgs
 
-    # Add trail lines for context
-    for _, trail in sampled.iterrows():
-        if trail.geometry and trail.geometry.geom_type == "LineString":
-            coords = [[lat, lon] for lon, lat in trail.geometry.coords]
-            polyline = ipyleaflet.Polyline(
-                locations=coords,
-                color="gray",
-                weight=1,
-                opacity=0.5,
-            )
-            m.add_layer(polyline)
+    # Add trail lines for context as a single GeoJSON layer; coordinates of all
+    # lines are extracted in one call and split per line by their index.
+    # get_coordinates yields (lon, lat), which is already GeoJSON axis order.
+    lines = sampled.geometry[sampled.geom_type == "LineString"].to_numpy()
+    coords, line_index = shapely.get_coordinates(lines, return_index=True)
+    if len(coords):
+        # line_index is sorted, so line boundaries are where it changes
+        bounds = [0, *(np.flatnonzero(np.diff(line_index)) + 1).tolist(), len(coords)]
+        coord_list = coords.tolist()
+        features = [
+            {"type": "Feature", "properties": {}, "geometry": {"type": "LineString", "coordinates": coord_list[start:end]}}
+            for start, end in zip(bounds[:-1], bounds[1:], strict=True)
+        ]
+        m.add_layer(ipyleaflet.GeoJSON(data={"type": "FeatureCollection", "features": features}, style=CONTEXT_TRAIL_STYLE))
 
     # Container to store bounds (mutable object to allow updates)
     bounds_container: dict[str, Any] = {"bounds": None, "rectangle": None}
@@ -373,12 +400,9 @@ def create_interactive_selection_map(
         if action == "created" and geo_json["geometry"]["type"] == "Polygon":
             # Extract coordinates from the drawn rectangle
             coords = geo_json["geometry"]["coordinates"][0]
-            lons = [c[0] for c in coords]
-            lats = [c[1] for c in coords]
 
             # Calculate bounds
-            min_lon, max_lon = min(lons), max(lons)
-            min_lat, max_lat = min(lats), max(lats)
+            min_lon, min_lat, max_lon, max_lat = _ring_bounds(coords)
             bounds_container["bounds"] = (min_lon, min_lat, max_lon, max_lat)
 
             # Remove previous rectangle if exists
@@ -1,41 +1,112 @@
 """GPX export functionality for trail data."""
 
+import gzip
+import io
+import os
+import re
+import time
 import zipfile
-from datetime import datetime
+from collections import deque
+from collections.abc import Callable, Iterator
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import contextmanager
+from functools import lru_cache, partial
 from pathlib import Path
-from typing import Any
+from typing import IO, Any, BinaryIO, NamedTuple
+from xml.sax.saxutils import escape
 
 import geopandas as gpd
+import numpy as np
 import pandas as pd
+import shapely
+from geopandas.sindex import SpatialIndex
 from lxml import etree
-from shapely.geometry import LineString, MultiLineString
+from pyproj import Transformer
+from shapely import GeometryType
+from shapely.geometry import LineString, MultiLineString, Polygon
+
+# Fixed-precision format for track point coordinates (7 decimals is about 1 cm)
+COORDINATE_FORMAT = "%.7f"
+TRKPT_TEMPLATE = f'<trkpt lat="{COORDINATE_FORMAT}" lon="{COORDINATE_FORMAT}"/>'
+
+# UTC timestamp formats for GPX metadata and ZIP manifests
+GPX_TIME_FORMAT = "%Y-%m-%dT%H:%M:%SZ"
+MANIFEST_TIME_FORMAT = "%Y-%m-%d %H:%M:%S UTC"
+
+# Format of dates in track descriptions of smart ZIP exports
+DESC_DATE_FORMAT = "%Y-%m-%d"
+
+# Simplify tracks with plain Douglas-Peucker: GPX tracks may self-intersect, and skipping
+# GEOS' topology-preserving simplifier is several times faster
+SIMPLIFY_PRESERVE_TOPOLOGY = False
+
+# Shapely type ids of geometries exported as track segments
+LINE_TYPE_IDS = (GeometryType.LINESTRING, GeometryType.LINEARRING, GeometryType.MULTILINESTRING)
+
+# Buffer size of uncompressed export file handles
+WRITE_BUFFER_SIZE = 1 << 20
+
+# Fast gzip level for compressed exports, so compression costs less than the disk writes it saves
+GZIP_COMPRESS_LEVEL = 1
+
+# Fast deflate level for ZIP exports; GPX XML is repetitive enough that higher levels barely shrink it further
+ZIP_COMPRESS_LEVEL = 1
+
+# Number of trails per chunk handed to a worker thread by export_to_gpx or a worker process by export_to_gpx_zip
+TRACK_CHUNK_SIZE = 256
+
+# ZIP exports with fewer trails than this render their GPX files in-process, as starting workers would cost more
+ZIP_PROCESS_POOL_MIN_TRAILS = 10_000
+
+# Characters not allowed in file names inside ZIP exports
+UNSAFE_FILENAME_CHARS = re.compile(r'[<>:"/\\|?*]')
+
+# Characters XML 1.0 does not allow in text, such as control characters other than tab and newlines
+XML_INVALID_CHARS = re.compile("[^\t\n\r\x20-\ud7ff\ue000-\ufffd\U00010000-\U0010ffff]")
+
+# Attributes and namespaces of the GPX root element
+GPX_ATTRIB = {
+    "version": "1.1",
+    "creator": "trails-analysis",
+    "{http://www.w3.org/2001/XMLSchema-instance}schemaLocation": "http://www.topografix.com/GPX/1/1 http://www.topografix.com/GPX/1/1/gpx.xsd",
+}
+GPX_NSMAP = {
+    None: "http://www.topografix.com/GPX/1/1",
+    "xsi": "http://www.w3.org/2001/XMLSchema-instance",
+}
 
 
 def create_gpx_document() -> etree.Element:
     """Create a GPX document with proper namespace and schema."""
-    gpx = etree.Element(
-        "gpx",
-        attrib={
-            "version": "1.1",
-            "creator": "trails-analysis",
-            "{http://www.w3.org/2001/XMLSchema-instance}schemaLocation": (
-                "http://www.topografix.com/GPX/1/1 http://www.topografix.com/GPX/1/1/gpx.xsd"
-            ),
-        },
-        nsmap={
-            None: "http://www.topografix.com/GPX/1/1",
-            "xsi": "http://www.w3.org/2001/XMLSchema-instance",
-        },
-    )
+    gpx = etree.Element("gpx", attrib=GPX_ATTRIB, nsmap=GPX_NSMAP)
+    gpx.append(create_gpx_metadata())
+    return gpx
 
-    # Add metadata
-    metadata = etree.SubElement(gpx, "metadata")
+
+def create_gpx_metadata() -> etree.Element:
+    """Create the GPX metadata element with export name, description and time."""
+    metadata = etree.Element("metadata")
     etree.SubElement(metadata, "name").text = "Norwegian Trails Export"
     etree.SubElement(metadata, "desc").text = "Trail data from Geonorge"
     time_elem = etree.SubElement(metadata, "time")
-    time_elem.text = datetime.utcnow().strftime("%Y-%m-%dT%H:%M:%SZ")
+    time_elem.text = time.strftime(GPX_TIME_FORMAT, time.gmtime())
+    return metadata
 
-    return gpx
+
+@contextmanager
+def _gpx_writer(target: IO[bytes], pretty_print: bool = False, metadata: etree.Element | None = None) -> Iterator[Any]:
+    """Stream a GPX document to a binary file, yielding the incremental writer inside the root element.
+
+    Elements written to the yielded writer are serialized immediately, so the document is never held in memory.
+    Exports writing many documents can pass one prebuilt metadata element to share between them.
+    """
+    with etree.xmlfile(target, encoding="UTF-8") as xf:
+        xf.write_declaration()
+        with xf.element("gpx", attrib=GPX_ATTRIB, nsmap=GPX_NSMAP):
+            if pretty_print:
+                xf.write("\n")
+            xf.write(create_gpx_metadata() if metadata is None else metadata, pretty_print=pretty_print)
+            yield xf
 
 
 def linestring_to_track_segment(geometry: LineString, simplify_tolerance: float | None = None) -> etree.Element:
@@ -48,21 +119,22 @@ def linestring_to_track_segment(geometry: LineString, simplify_tolerance: float
     Returns:
         GPX track segment element
     """
-    trkseg = etree.Element("trkseg")
-
     # Optionally simplify geometry
     if simplify_tolerance:
-        geometry = geometry.simplify(simplify_tolerance, preserve_topology=True)  # type: ignore[assignment]
+        geometry = shapely.simplify(geometry, simplify_tolerance, preserve_topology=SIMPLIFY_PRESERVE_TOPOLOGY)
+
+    # Parse the whole segment in one call instead of creating each point element from Python
+    coords = shapely.get_coordinates(geometry)
+    trkpts = _trkpt_markup(coords[:, ::-1].ravel().tolist(), 0, len(coords))
+    return etree.fromstring(f"<trkseg>{trkpts}</trkseg>")
 
-    # Extract coordinates
-    coords = list(geometry.coords)
 
-    for lon, lat in coords:
-        etree.SubElement(trkseg, "trkpt", attrib={"lat": str(lat), "lon": str(lon)})
-        # Could add elevation here if available
-        # etree.SubElement(trkpt, "ele").text = str(elevation)
+def _trkpt_markup(latlons: list[float], start: int, stop: int) -> str:
+    """Format points start to stop of a flat [lat, lon, lat, lon, ...] list as <trkpt> elements.
 
-    return trkseg
+    A single %-format over the repeated template formats every point in C, without a Python-level loop.
+    """
+    return (TRKPT_TEMPLATE * (stop - start)) % tuple(latlons[2 * start : 2 * stop])
 
 
 def trail_to_track(
@@ -79,43 +151,264 @@ def trail_to_track(
         desc_fields: Fields to include in description
         simplify_tolerance: Optional tolerance for geometry simplification
 
+    Returns:
+        GPX track element
+    """
+    name = trail.get(name_field, f"Trail {trail.name if hasattr(trail, 'name') else 'Unknown'}")
+
+    desc_parts = []
+    for field in desc_fields or []:
+        if field in trail and pd.notna(trail[field]):
+            desc_parts.append(f"{field}: {trail[field]}")
+
+    trail_type = trail["type"] if "type" in trail else None
+
+    return build_track(
+        name=name if pd.notna(name) else None,
+        desc=" | ".join(desc_parts) or None,
+        trail_type=trail_type if pd.notna(trail_type) else None,
+        geometry=trail.geometry,
+        simplify_tolerance=simplify_tolerance,
+    )
+
+
+def build_track(
+    name: Any,
+    desc: str | None,
+    trail_type: Any,
+    geometry: LineString | MultiLineString | None,
+    simplify_tolerance: float | None = None,
+) -> etree.Element:
+    """Build a GPX track from plain attribute values.
+
+    Args:
+        name: Track name, or None to omit it
+        desc: Track description, or None to omit it
+        trail_type: Track type, or None to omit it
+        geometry: LineString or MultiLineString geometry in WGS84
+        simplify_tolerance: Optional tolerance for geometry simplification
+
     Returns:
         GPX track element
     """
     trk = etree.Element("trk")
 
-    # Add name
-    name = trail.get(name_field, f"Trail {trail.name if hasattr(trail, 'name') else 'Unknown'}")
-    if pd.notna(name):
+    if name is not None:
         etree.SubElement(trk, "name").text = str(name)
-
-    # Add description
-    if desc_fields:
-        desc_parts = []
-        for field in desc_fields:
-            if field in trail and pd.notna(trail[field]):
-                desc_parts.append(f"{field}: {trail[field]}")
-        if desc_parts:
-            etree.SubElement(trk, "desc").text = " | ".join(desc_parts)
-
-    # Add type if available
-    if "type" in trail and pd.notna(trail["type"]):
-        etree.SubElement(trk, "type").text = str(trail["type"])
-
-    # Handle geometry
-    geometry = trail.geometry
-
-    if isinstance(geometry, LineString):
-        trkseg = linestring_to_track_segment(geometry, simplify_tolerance)
-        trk.append(trkseg)
-    elif isinstance(geometry, MultiLineString):
-        for linestring in geometry.geoms:
+    if desc:
+        etree.SubElement(trk, "desc").text = desc
+    if trail_type is not None:
+        etree.SubElement(trk, "type").text = str(trail_type)
+
+    # One segment per LineString part
+    if shapely.get_type_id(geometry) in LINE_TYPE_IDS:
+        for linestring in shapely.get_parts(geometry):
             trkseg = linestring_to_track_segment(linestring, simplify_tolerance)
             trk.append(trkseg)
 
     return trk
 
 
+def _column_values(gdf: gpd.GeoDataFrame, column: str, prefix: str = "", formatter: Callable[[Any], str] = str) -> np.ndarray | None:
+    """Return a column as an object array of text with missing values as None, or None if the column does not exist.
+
+    Trail attributes are mostly low-cardinality, so each distinct value is converted to text only once.
+    """
+    if column not in gdf.columns:
+        return None
+    codes, uniques = pd.factorize(gdf[column])
+    # Missing values have code -1, which picks the trailing None
+    lookup = np.array([f"{prefix}{formatter(value)}" for value in uniques] + [None], dtype=object)
+    array: np.ndarray = lookup[codes]
+    return array
+
+
+def _build_tracks(rows: "_ExportRows") -> list[etree.Element | Exception]:
+    """Build GPX tracks for a chunk of trails, returning the exception in place of a track that failed."""
+    tracks: list[etree.Element | Exception] = []
+    for markup in _tracks_markup(rows):
+        if isinstance(markup, Exception):
+            tracks.append(markup)
+            continue
+        try:
+            tracks.append(etree.fromstring(markup))
+        except Exception as e:
+            tracks.append(e)
+    return tracks
+
+
+def _format_date(value: Any, parse: bool) -> str:
+    """Format a datetime value as a date, parsing other values first if requested and keeping them as is if that fails."""
+    if hasattr(value, "strftime"):
+        return str(value.strftime(DESC_DATE_FORMAT))
+    if parse:
+        try:
+            return str(pd.to_datetime(value).strftime(DESC_DATE_FORMAT))
+        except Exception:
+            pass
+    return str(value)
+
+
+def _description_values(gdf: gpd.GeoDataFrame, fields: list[str], format_dates: bool = False) -> np.ndarray:
+    """Build track descriptions ("field: value | ...") for all rows, with None where no field has a value.
+
+    With format_dates, datetime values and values of fields named like dates are written as dates.
+    """
+    desc = np.full(len(gdf), "", dtype=object)
+    for field in fields:
+        formatter = partial(_format_date, parse="date" in field.lower()) if format_dates else str
+        labels = _column_values(gdf, field, prefix=f"{field}: ", formatter=formatter)
+        if labels is None:
+            continue
+        present = pd.notna(labels)
+        desc[present & (desc != "")] += " | "
+        desc[present] += labels[present]
+    desc[desc == ""] = None
+    return desc
+
+
+class _ExportRows(NamedTuple):
+    """Per-trail arrays prepared for GPX export, with missing and empty geometries removed.
+
+    Coordinates are stored flat: segment j spans coords[coord_offsets[j]:coord_offsets[j + 1]]
+    and trail i owns segments segment_offsets[i] to segment_offsets[i + 1].
+    """
+
+    row_index: np.ndarray  # Original GeoDataFrame index labels
+    num_coords: np.ndarray  # Number of coordinates before simplification
+    names: np.ndarray
+    types: np.ndarray
+    descs: np.ndarray
+    coords: np.ndarray  # Simplified lon/lat coordinates of all segments in WGS84
+    coord_offsets: np.ndarray
+    segment_offsets: np.ndarray
+
+    def slice(self, start: int, stop: int) -> "_ExportRows":
+        """Return the rows of trails start to stop, with offsets rebased to the sliced coordinates."""
+        stop = min(stop, len(self.row_index))
+        first_segment, last_segment = self.segment_offsets[start], self.segment_offsets[stop]
+        first_coord, last_coord = self.coord_offsets[first_segment], self.coord_offsets[last_segment]
+        return _ExportRows(
+            row_index=self.row_index[start:stop],
+            num_coords=self.num_coords[start:stop],
+            names=self.names[start:stop],
+            types=self.types[start:stop],
+            descs=self.descs[start:stop],
+            coords=self.coords[first_coord:last_coord],
+            coord_offsets=self.coord_offsets[first_segment : last_segment + 1] - first_coord,
+            segment_offsets=self.segment_offsets[start : stop + 1] - first_segment,
+        )
+
+
+def _tracks_markup(rows: _ExportRows) -> list[str | Exception]:
+    """Format each trail as GPX <trk> markup, formatting all of its coordinates in one pass.
+
+    A trail whose name, description or type holds characters XML cannot represent gets a
+    ValueError in place of its markup.
+    """
+    latlons = rows.coords[:, ::-1].ravel().tolist()
+    coord_offsets = rows.coord_offsets.tolist()
+    segment_offsets = rows.segment_offsets.tolist()
+
+    tracks: list[str | Exception] = []
+    for i, (name, desc, trail_type) in enumerate(zip(rows.names, rows.descs, rows.types, strict=True)):
+        if any(text is not None and XML_INVALID_CHARS.search(text) for text in (name, desc, trail_type)):
+            tracks.append(ValueError("All strings must be XML compatible: Unicode or ASCII, no NULL bytes or control characters"))
+            continue
+        parts = ["<trk>"]
+        if name is not None:
+            parts.append(f"<name>{escape(name)}</name>")
+        if desc:
+            parts.append(f"<desc>{escape(desc)}</desc>")
+        if trail_type is not None:
+            parts.append(f"<type>{escape(trail_type)}</type>")
+        for j in range(segment_offsets[i], segment_offsets[i + 1]):
+            parts.append(f"<trkseg>{_trkpt_markup(latlons, coord_offsets[j], coord_offsets[j + 1])}</trkseg>")
+        parts.append("</trk>")
+        tracks.append("".join(parts))
+    return tracks
+
+
+def _prepare_export(
+    gdf: gpd.GeoDataFrame,
+    name_field: str,
+    desc_fields: list[str] | None,
+    simplify_tolerance: float | None,
+    max_trails: int | None,
+) -> tuple[_ExportRows, dict[str, Any]]:
+    """Reproject, limit and filter trails and extract the arrays needed to write one track per trail."""
+    # Limit trails if specified, before reprojecting so only exported trails are transformed
+    export_gdf = gdf.head(max_trails) if max_trails else gdf
+
+    # Ensure we're in WGS84
+    if export_gdf.crs and export_gdf.crs.to_epsg() != 4326:
+        export_gdf = export_gdf.to_crs(epsg=4326)
+
+    # Default description fields
+    if desc_fields is None:
+        desc_fields = ["maintenance_responsible", "difficulty", "marking"]
+
+    # Statistics
+    stats: dict[str, Any] = {
+        "total_trails": len(export_gdf),
+        "total_points": 0,
+        "skipped_trails": 0,
+    }
+
+    # Work on the underlying array of geometries with shapely ufuncs rather than per-row attribute access
+    geoms = export_gdf.geometry.to_numpy()
+
+    # Drop missing and empty geometries in one vectorized pass
+    valid_mask = ~(shapely.is_missing(geoms) | shapely.is_empty(geoms))
+    stats["skipped_trails"] = int((~valid_mask).sum())
+    export_gdf = export_gdf.loc[valid_mask]
+    geoms = geoms[valid_mask]
+
+    # Pull the needed columns out once so the loop indexes plain arrays instead of building a Series per row
+    index = export_gdf.index.to_numpy()
+    # Only line coordinates become track points, so other geometry types count as zero
+    is_line = np.isin(shapely.get_type_id(geoms), LINE_TYPE_IDS)
+    num_coords = np.where(is_line, shapely.get_num_coordinates(geoms), 0)
+    stats["total_points"] = int(num_coords.sum())
+
+    # Simplify all geometries in one vectorized call rather than per segment
+    if simplify_tolerance:
+        geoms = shapely.simplify(geoms, simplify_tolerance, preserve_topology=SIMPLIFY_PRESERVE_TOPOLOGY)
+
+    # Explode LineString parts into one flat coordinate array with offsets per segment and per trail
+    line_geoms = np.where(is_line, geoms, None)
+    parts, part_trails = shapely.get_parts(line_geoms, return_index=True)
+    coords = shapely.get_coordinates(parts)
+    coord_offsets = np.concatenate(([0], np.cumsum(shapely.get_num_coordinates(parts))))
+    segment_offsets = np.searchsorted(part_trails, np.arange(len(geoms) + 1))
+
+    names = _column_values(export_gdf, name_field)
+    if names is None:
+        names = np.array([f"Trail {idx}" for idx in index], dtype=object)
+    types = _column_values(export_gdf, "type")
+    if types is None:
+        types = np.full(len(export_gdf), None, dtype=object)
+    descs = _description_values(export_gdf, desc_fields)
+
+    return _ExportRows(index, num_coords, names, types, descs, coords, coord_offsets, segment_offsets), stats
+
+
+def _output_path(output_path: Path, compress: bool) -> Path:
+    """Return the file an export writes to, creating its directory."""
+    output_path = Path(output_path)
+    if compress:
+        output_path = output_path.with_name(f"{output_path.name}.gz")
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    return output_path
+
+
+def _open_output(output_path: Path, compress: bool) -> BinaryIO:
+    """Open an export file for binary writing, gzip-compressed if requested."""
+    if compress:
+        return gzip.open(output_path, "wb", compresslevel=GZIP_COMPRESS_LEVEL)  # type: ignore[return-value]
+    return open(output_path, "wb", buffering=WRITE_BUFFER_SIZE)
+
+
 def export_to_gpx(
     gdf: gpd.GeoDataFrame,
     output_path: Path,
@@ -123,9 +416,15 @@ def export_to_gpx(
     desc_fields: list[str] | None = None,
     simplify_tolerance: float | None = 0.00001,
     max_trails: int | None = None,
+    pretty_print: bool = False,
+    max_workers: int | None = None,
+    compress: bool = False,
 ) -> tuple[Path, dict[str, Any]]:
     """Export GeoDataFrame of trails to GPX file.
 
+    Tracks are built in chunks on a thread pool (GEOS and lxml release the GIL) and streamed to the
+    file in order, so the full document is never held in memory.
+
     Args:
         gdf: GeoDataFrame with trail data
         output_path: Path for output GPX file
@@ -133,80 +432,137 @@ def export_to_gpx(
         desc_fields: Fields to include in track descriptions
         simplify_tolerance: Tolerance for geometry simplification (degrees)
         max_trails: Maximum number of trails to export
+        pretty_print: Whether to indent the XML output
+        max_workers: Number of threads used to build tracks (None for one per CPU)
+        compress: Whether to gzip the output, written to output_path with a ".gz" suffix appended
 
     Returns:
         Tuple of (output_path, statistics_dict)
     """
-    # Ensure we're in WGS84
-    if gdf.crs and gdf.crs.to_epsg() != 4326:
-        gdf = gdf.to_crs(epsg=4326)
+    rows, stats = _prepare_export(gdf, name_field, desc_fields, simplify_tolerance, max_trails)
+
+    output_path = _output_path(output_path, compress)
+    workers = max_workers or os.cpu_count() or 1
+
+    # Build tracks in chunks on worker threads and stream them into the GPX document in order
+    with (
+        _open_output(output_path, compress) as f,
+        _gpx_writer(f, pretty_print) as xf,
+        ThreadPoolExecutor(max_workers=workers) as executor,
+    ):
+
+        def write_chunk(start: int, tracks: list[etree.Element | Exception]) -> None:
+            for i, track in enumerate(tracks, start):
+                if isinstance(track, Exception):
+                    print(f"Warning: Failed to export trail {rows.row_index[i]}: {track}")
+                    stats["skipped_trails"] += 1
+                    stats["total_points"] -= int(rows.num_coords[i])
+                    continue
+                xf.write(track, pretty_print=pretty_print)
+
+        # Keep a bounded number of chunks in flight so memory does not grow with the export size
+        pending: deque[tuple[int, Future[list[etree.Element | Exception]]]] = deque()
+        for start in range(0, len(rows.row_index), TRACK_CHUNK_SIZE):
+            pending.append((start, executor.submit(_build_tracks, rows.slice(start, start + TRACK_CHUNK_SIZE))))
+            if len(pending) > 2 * workers:
+                chunk_start, future = pending.popleft()
+                write_chunk(chunk_start, future.result())
+        while pending:
+            chunk_start, future = pending.popleft()
+            write_chunk(chunk_start, future.result())
 
-    # Default description fields
-    if desc_fields is None:
-        desc_fields = ["maintenance_responsible", "difficulty", "marking"]
+    stats["file_size_mb"] = float(output_path.stat().st_size) / (1024 * 1024)
 
-    # Limit trails if specified
-    export_gdf = gdf.head(max_trails) if max_trails else gdf
+    return output_path, stats
 
-    # Create GPX document
-    gpx = create_gpx_document()
 
-    # Statistics
-    stats: dict[str, Any] = {
-        "total_trails": len(export_gdf),
-        "total_points": 0,
-        "skipped_trails": 0,
-    }
+def export_to_gpx_fast(
+    gdf: gpd.GeoDataFrame,
+    output_path: Path,
+    name_field: str = "trail_name",
+    desc_fields: list[str] | None = None,
+    simplify_tolerance: float | None = 0.00001,
+    max_trails: int | None = None,
+    compress: bool = False,
+) -> tuple[Path, dict[str, Any]]:
+    """Export GeoDataFrame of trails to GPX file by writing the markup as text.
 
-    # Add each trail as a track
-    for idx, trail in export_gdf.iterrows():
-        try:
-            if trail.geometry is None or trail.geometry.is_empty:
-                stats["skipped_trails"] += 1
-                continue
+    Produces the same tracks as export_to_gpx without building lxml elements, writing each track
+    through a large buffered file handle instead.
 
-            track = trail_to_track(trail, name_field=name_field, desc_fields=desc_fields, simplify_tolerance=simplify_tolerance)
-            gpx.append(track)
+    Args:
+        gdf: GeoDataFrame with trail data
+        output_path: Path for output GPX file
+        name_field: Field to use for track names
+        desc_fields: Fields to include in track descriptions
+        simplify_tolerance: Tolerance for geometry simplification (degrees)
+        max_trails: Maximum number of trails to export
+        compress: Whether to gzip the output, written to output_path with a ".gz" suffix appended
 
-            # Count points
-            if isinstance(trail.geometry, LineString):
-                stats["total_points"] += len(trail.geometry.coords)
-            elif isinstance(trail.geometry, MultiLineString):
-                for line in trail.geometry.geoms:
-                    stats["total_points"] += len(line.coords)
+    Returns:
+        Tuple of (output_path, statistics_dict)
+    """
+    rows, stats = _prepare_export(gdf, name_field, desc_fields, simplify_tolerance, max_trails)
 
-        except Exception as e:
-            print(f"Warning: Failed to export trail {idx}: {e}")
-            stats["skipped_trails"] += 1
+    output_path = _output_path(output_path, compress)
 
-    # Write to file
-    output_path = Path(output_path)
-    output_path.parent.mkdir(parents=True, exist_ok=True)
+    # Document header and metadata, without the closing root tag
+    header = etree.tostring(create_gpx_document(), xml_declaration=True, encoding="UTF-8")
+    header = header[: -len(b"</gpx>")]
 
-    tree = etree.ElementTree(gpx)
-    tree.write(
-        str(output_path),
-        pretty_print=True,
-        xml_declaration=True,
-        encoding="UTF-8",
-    )
+    with _open_output(output_path, compress) as f:
+        f.write(header)
+        for start in range(0, len(rows.row_index), TRACK_CHUNK_SIZE):
+            for i, markup in enumerate(_tracks_markup(rows.slice(start, start + TRACK_CHUNK_SIZE)), start):
+                if isinstance(markup, Exception):
+                    print(f"Warning: Failed to export trail {rows.row_index[i]}: {markup}")
+                    stats["skipped_trails"] += 1
+                    stats["total_points"] -= int(rows.num_coords[i])
+                    continue
+                f.write(markup.encode())
+        f.write(b"</gpx>")
 
     stats["file_size_mb"] = float(output_path.stat().st_size) / (1024 * 1024)
 
     return output_path, stats
 
 
+@lru_cache(maxsize=16)
+def _transformer(from_crs: Any, to_crs: Any) -> Transformer:
+    """Return a cached lon/lat-ordered transformer between two CRSs."""
+    return Transformer.from_crs(from_crs, to_crs, always_xy=True)
+
+
+def _simplify_geometries(gdf: gpd.GeoDataFrame, simplify_tolerance: float | None) -> gpd.GeoDataFrame:
+    """Simplify all geometries of a GeoDataFrame in one vectorized call, if a tolerance is given."""
+    if not simplify_tolerance:
+        return gdf
+    return gdf.set_geometry(gdf.geometry.simplify(simplify_tolerance, preserve_topology=SIMPLIFY_PRESERVE_TOPOLOGY))
+
+
+def _transform_geometry(geometry: Polygon, transformer: Transformer) -> Polygon:
+    """Reproject the vertices of a single geometry without building a GeoDataFrame."""
+    projected: Polygon = shapely.transform(geometry, lambda coords: np.column_stack(transformer.transform(coords[:, 0], coords[:, 1])))
+    return projected
+
+
 def filter_trails_by_bbox(
     gdf: gpd.GeoDataFrame,
     bbox: tuple[float, float, float, float],
     buffer_m: float = 0,
+    sindex: SpatialIndex | None = None,
 ) -> gpd.GeoDataFrame:
     """Filter trails that intersect with a bounding box.
 
+    The spatial index is built lazily on first use and cached on gdf, so repeated calls on the same
+    GeoDataFrame reuse it. Pass sindex to reuse a tree built for another frame with the same rows
+    (e.g. a copy), which would otherwise build its own.
+
     Args:
         gdf: GeoDataFrame with trail data
         bbox: Bounding box as (minx, miny, maxx, maxy) in same CRS as gdf
         buffer_m: Optional buffer in meters around bbox
+        sindex: Optional prebuilt spatial index over the geometries of gdf, in row order
 
     Returns:
         Filtered GeoDataFrame
@@ -220,16 +576,16 @@ def filter_trails_by_bbox(
     if buffer_m > 0 and gdf.crs and gdf.crs.to_epsg() in [4326, 4258]:
         # Project to UTM for buffering
         utm_crs = "EPSG:25833"  # UTM 33N for Norway
-        bbox_gdf = gpd.GeoDataFrame([1], geometry=[bbox_geom], crs=gdf.crs)
-        bbox_gdf = bbox_gdf.to_crs(utm_crs)
-        bbox_geom = bbox_gdf.geometry[0].buffer(buffer_m)
+        bbox_geom = _transform_geometry(bbox_geom, _transformer(gdf.crs, utm_crs))
+        bbox_geom = bbox_geom.buffer(buffer_m)
         # Project back
-        bbox_gdf = gpd.GeoDataFrame([1], geometry=[bbox_geom], crs=utm_crs)
-        bbox_gdf = bbox_gdf.to_crs(gdf.crs)
-        bbox_geom = bbox_gdf.geometry[0]  # type: ignore[assignment]
+        bbox_geom = _transform_geometry(bbox_geom, _transformer(utm_crs, gdf.crs))
 
-    # Use spatial index for efficient filtering
-    return gdf[gdf.intersects(bbox_geom)].copy()
+    # Use spatial index for efficient filtering, keeping the original row order
+    if sindex is None:
+        sindex = gdf.sindex
+    positions = np.sort(sindex.query(bbox_geom, predicate="intersects"))
+    return gdf.iloc[positions].copy()
 
 
 def export_to_gpx_single_track(
@@ -240,6 +596,7 @@ def export_to_gpx_single_track(
     desc_fields: list[str] | None = None,
     simplify_tolerance: float | None = 0.00001,
     max_trails: int | None = None,
+    pretty_print: bool = False,
 ) -> tuple[Path, dict[str, Any]]:
     """Export GeoDataFrame as a single GPX track with multiple segments.
 
@@ -254,28 +611,22 @@ def export_to_gpx_single_track(
         desc_fields: Fields to include in track description
         simplify_tolerance: Tolerance for geometry simplification (degrees)
         max_trails: Maximum number of trails to export
+        pretty_print: Whether to indent the XML output
 
     Returns:
         Tuple of (output_path, statistics_dict)
     """
+    # Limit trails if specified, before reprojecting so only exported trails are transformed
+    export_gdf = gdf.head(max_trails) if max_trails else gdf
+
     # Ensure we're in WGS84
-    if gdf.crs and gdf.crs.to_epsg() != 4326:
-        gdf = gdf.to_crs(epsg=4326)
+    if export_gdf.crs and export_gdf.crs.to_epsg() != 4326:
+        export_gdf = export_gdf.to_crs(epsg=4326)
 
     # Default description fields
     if desc_fields is None:
         desc_fields = ["maintenance_responsible", "difficulty", "marking"]
 
-    # Limit trails if specified
-    export_gdf = gdf.head(max_trails) if max_trails else gdf
-
-    # Create GPX document
-    gpx = create_gpx_document()
-
-    # Create a single track element
-    trk = etree.Element("trk")
-    etree.SubElement(trk, "name").text = track_name
-
     # Build description with trail count and summary
     desc_parts = [f"Contains {len(export_gdf)} trail segments"]
 
@@ -285,8 +636,6 @@ def export_to_gpx_single_track(
         if not trail_types.empty:
             desc_parts.append("Types: " + ", ".join(f"{str(k)} ({v})" for k, v in trail_types.items() if k is not None))
 
-    etree.SubElement(trk, "desc").text = " | ".join(desc_parts)
-
     # Statistics
     stats: dict[str, Any] = {
         "total_trails": len(export_gdf),
@@ -295,62 +644,105 @@ def export_to_gpx_single_track(
         "skipped_trails": 0,
     }
 
-    # Add each trail as a segment
-    for idx, trail in export_gdf.iterrows():
-        try:
-            if trail.geometry is None or trail.geometry.is_empty:
-                stats["skipped_trails"] += 1
-                continue
-
-            # Get trail name for comment
-            trail_name = trail.get(name_field, f"Trail {idx}")
-
-            # Handle different geometry types
-            if isinstance(trail.geometry, LineString):
-                # Add comment before segment (not standard but helpful)
-                comment = etree.Comment(f" {trail_name} ")
-                trk.append(comment)
-
-                trkseg = linestring_to_track_segment(trail.geometry, simplify_tolerance)
-                trk.append(trkseg)
-                stats["total_segments"] += 1
-                stats["total_points"] += len(trail.geometry.coords)
-
-            elif isinstance(trail.geometry, MultiLineString):
-                for i, linestring in enumerate(trail.geometry.geoms):
-                    # Add comment for each part
-                    comment = etree.Comment(f" {trail_name} (part {i + 1}) ")
-                    trk.append(comment)
-
-                    trkseg = linestring_to_track_segment(linestring, simplify_tolerance)
-                    trk.append(trkseg)
-                    stats["total_segments"] += 1
-                    stats["total_points"] += len(linestring.coords)
+    # Count points and look up geometry types of all trails in one vectorized pass; points of
+    # trails that fail to export are subtracted again
+    geoms = export_gdf.geometry.to_numpy()
+    num_coords = shapely.get_num_coordinates(geoms)
+    type_ids = shapely.get_type_id(geoms)
+    stats["total_points"] = int(num_coords[np.isin(type_ids, LINE_TYPE_IDS)].sum())
 
-        except Exception as e:
-            print(f"Warning: Failed to export trail {idx}: {e}")
-            stats["skipped_trails"] += 1
+    # Simplify all geometries in one vectorized call rather than per segment
+    if simplify_tolerance:
+        geoms = shapely.simplify(geoms, simplify_tolerance, preserve_topology=SIMPLIFY_PRESERVE_TOPOLOGY)
 
-    # Add the single track to GPX
-    gpx.append(trk)
+    # Skip missing and empty geometries, and trails that are not lines, in one vectorized pass
+    missing = shapely.is_missing(geoms) | shapely.is_empty(geoms)
+    stats["skipped_trails"] = int(missing.sum())
+    line_positions = np.flatnonzero(~missing & np.isin(type_ids, LINE_TYPE_IDS))
 
-    # Write to file
     output_path = Path(output_path)
     output_path.parent.mkdir(parents=True, exist_ok=True)
 
-    tree = etree.ElementTree(gpx)
-    tree.write(
-        str(output_path),
-        pretty_print=True,
-        xml_declaration=True,
-        encoding="UTF-8",
-    )
+    # Stream a single track element, writing each trail's segments as they are built
+    with open(output_path, "wb", buffering=WRITE_BUFFER_SIZE) as f, _gpx_writer(f, pretty_print) as xf, xf.element("trk"):
+        header = etree.Element("trk")
+        etree.SubElement(header, "name").text = track_name
+        etree.SubElement(header, "desc").text = " | ".join(desc_parts)
+        for child in header:
+            xf.write(child, pretty_print=pretty_print)
+
+        # Add each trail as a segment, reading names from a plain array rather than a Series per row
+        names = export_gdf[name_field].to_numpy(dtype=object) if name_field in export_gdf.columns else None
+        for pos in line_positions:
+            idx = export_gdf.index[pos]
+            try:
+                geometry = geoms[pos]
+
+                # Get trail name for comment
+                trail_name = names[pos] if names is not None else f"Trail {idx}"
+                is_multi = type_ids[pos] == GeometryType.MULTILINESTRING
+
+                for i, linestring in enumerate(shapely.get_parts(geometry)):
+                    # Add comment before each segment, numbering the parts of multi-part trails (not standard but helpful)
+                    comment = etree.Comment(f" {trail_name} (part {i + 1}) " if is_multi else f" {trail_name} ")
+                    xf.write(comment, pretty_print=pretty_print)
+
+                    trkseg = linestring_to_track_segment(linestring)
+                    xf.write(trkseg, pretty_print=pretty_print)
+                    stats["total_segments"] += 1
+
+            except Exception as e:
+                print(f"Warning: Failed to export trail {idx}: {e}")
+                stats["skipped_trails"] += 1
+                stats["total_points"] -= int(num_coords[pos])
 
     stats["file_size_mb"] = float(output_path.stat().st_size) / (1024 * 1024)
 
     return output_path, stats
 
 
+def _gpx_envelope(pretty_print: bool, metadata: etree.Element) -> tuple[bytes, bytes]:
+    """Return the bytes a GPX document starts with up to its first track, and the bytes closing it."""
+    buffer = io.BytesIO()
+    with _gpx_writer(buffer, pretty_print, metadata):
+        pass
+    document = buffer.getvalue()
+    split = document.rindex(b"</gpx>")
+    return document[:split], document[split:]
+
+
+def _render_gpx_files(rows: _ExportRows, header: bytes, footer: bytes, pretty_print: bool) -> list[bytes | Exception]:
+    """Render each trail of a chunk as a complete GPX document, or the exception that prevented it."""
+    return [
+        track if isinstance(track, Exception) else header + etree.tostring(track, encoding="UTF-8", pretty_print=pretty_print) + footer
+        for track in _build_tracks(rows)
+    ]
+
+
+def _render_gpx_file_chunks(
+    rows: _ExportRows, header: bytes, footer: bytes, pretty_print: bool, max_workers: int | None
+) -> Iterator[tuple[int, list[bytes | Exception]]]:
+    """Yield (start, files) for each chunk of trails in order, rendering on worker processes for large exports."""
+    starts = range(0, len(rows.row_index), TRACK_CHUNK_SIZE)
+    if len(rows.row_index) < ZIP_PROCESS_POOL_MIN_TRAILS:
+        for start in starts:
+            yield start, _render_gpx_files(rows.slice(start, start + TRACK_CHUNK_SIZE), header, footer, pretty_print)
+        return
+
+    # Keep a bounded number of chunks in flight so memory does not grow with the export size
+    workers = max_workers or os.cpu_count() or 1
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        pending: deque[tuple[int, Future[list[bytes | Exception]]]] = deque()
+        for start in starts:
+            pending.append((start, executor.submit(_render_gpx_files, rows.slice(start, start + TRACK_CHUNK_SIZE), header, footer, pretty_print)))
+            if len(pending) > 2 * workers:
+                chunk_start, future = pending.popleft()
+                yield chunk_start, future.result()
+        while pending:
+            chunk_start, future = pending.popleft()
+            yield chunk_start, future.result()
+
+
 def export_to_gpx_zip(
     gdf: gpd.GeoDataFrame,
     output_path: Path,
@@ -359,6 +751,8 @@ def export_to_gpx_zip(
     simplify_tolerance: float | None = 0.00001,
     max_trails: int | None = None,
     group_by: str | None = None,
+    max_workers: int | None = None,
+    pretty_print: bool = False,
 ) -> tuple[Path, dict[str, Any]]:
     """Export GeoDataFrame as a ZIP file containing individual GPX files.
 
@@ -372,102 +766,114 @@ def export_to_gpx_zip(
         simplify_tolerance: Tolerance for geometry simplification (degrees)
         max_trails: Maximum number of trails to export
         group_by: Optional field to group trails into folders
+        max_workers: Number of processes used to render GPX files of large exports (None for one per CPU)
+        pretty_print: Whether to indent the XML of each GPX file
 
     Returns:
         Tuple of (output_path, statistics_dict)
     """
-    import re
-
-    # Ensure we're in WGS84
-    if gdf.crs and gdf.crs.to_epsg() != 4326:
-        gdf = gdf.to_crs(epsg=4326)
-
     # Default description fields
     if desc_fields is None:
         desc_fields = ["maintenance_responsible", "difficulty", "marking"]
 
-    # Limit trails if specified
+    # Limit trails if specified, then reproject, simplify and extract the tracks of all valid trails
     export_gdf = gdf.head(max_trails) if max_trails else gdf
+    rows, prepare_stats = _prepare_export(export_gdf, name_field, desc_fields, simplify_tolerance, None)
 
     # Statistics
     stats: dict[str, Any] = {
         "total_files": 0,
         "total_trails": len(export_gdf),
-        "skipped_trails": 0,
+        "skipped_trails": prepare_stats["skipped_trails"],
         "groups": [],
     }
 
+    # Pull the attributes used for file names and the manifest out of the valid trails as columns once
+    geoms = export_gdf.geometry.to_numpy()
+    valid_gdf = export_gdf.loc[~(shapely.is_missing(geoms) | shapely.is_empty(geoms))]
+    names = valid_gdf[name_field].to_numpy(dtype=object) if name_field in valid_gdf.columns else None
+    groups = _column_values(valid_gdf, group_by) if group_by else None
+    manifest_fields = [values for field in desc_fields if (values := _column_values(valid_gdf, field, prefix=f"  {field}: ")) is not None]
+
     # Create ZIP file
     output_path = Path(output_path)
     output_path.parent.mkdir(parents=True, exist_ok=True)
 
-    with zipfile.ZipFile(output_path, "w", zipfile.ZIP_DEFLATED) as zipf:
-        # Create manifest file
-        manifest_lines = ["Trail Export Manifest", "=" * 50, ""]
-        manifest_lines.append(f"Export date: {datetime.utcnow().strftime('%Y-%m-%d %H:%M:%S UTC')}")
-        manifest_lines.append(f"Total trails: {len(export_gdf)}")
-        manifest_lines.append("")
+    with zipfile.ZipFile(output_path, "w", zipfile.ZIP_DEFLATED, compresslevel=ZIP_COMPRESS_LEVEL) as zipf:
+        # Create manifest file, written incrementally rather than joined from a list of lines at the end
+        manifest = io.StringIO()
+        manifest.write(f"Trail Export Manifest\n{'=' * 50}\n\n")
+        manifest.write(f"Export date: {time.strftime(MANIFEST_TIME_FORMAT, time.gmtime())}\n")
+        manifest.write(f"Total trails: {len(export_gdf)}\n\n")
 
-        # Process each trail
-        for idx, trail in export_gdf.iterrows():
-            try:
-                if trail.geometry is None or trail.geometry.is_empty:
-                    stats["skipped_trails"] += 1
-                    continue
+        # Every file shares the same metadata, so render the document around the track once
+        header, footer = _gpx_envelope(pretty_print, metadata=create_gpx_metadata())
+
+        # Render GPX files in chunks, on worker processes for large exports, and write them in order
+        for start, files in _render_gpx_file_chunks(rows, header, footer, pretty_print, max_workers):
+            for pos, content in enumerate(files, start):
+                idx = rows.row_index[pos]
 
                 # Get trail name and sanitize for filename
-                trail_name = str(trail.get(name_field, f"Trail_{idx}"))
-                if pd.isna(trail_name) or trail_name == "nan":
+                trail_name = str(names[pos]) if names is not None else f"Trail_{idx}"
+                if trail_name == "nan":
                     trail_name = f"Trail_{idx}"
 
+                if isinstance(content, Exception):
+                    print(f"Warning: Failed to export trail {idx}: {content}")
+                    stats["skipped_trails"] += 1
+                    manifest.write(f"- SKIPPED: {trail_name} (Error: {content})\n")
+                    continue
+
                 # Sanitize filename
-                safe_name = re.sub(r'[<>:"/\\|?*]', "_", trail_name)
+                safe_name = UNSAFE_FILENAME_CHARS.sub("_", trail_name)
                 safe_name = safe_name[:100]  # Limit length
 
                 # Determine folder if grouping
                 folder = ""
-                if group_by and group_by in trail and pd.notna(trail[group_by]):
-                    group_value = str(trail[group_by])
-                    folder = re.sub(r'[<>:"/\\|?*]', "_", group_value) + "/"
+                if groups is not None and groups[pos] is not None:
+                    folder = UNSAFE_FILENAME_CHARS.sub("_", groups[pos]) + "/"
                     if folder not in stats["groups"]:
                         stats["groups"].append(folder)
 
-                # Create individual GPX
-                gpx = create_gpx_document()
-                track = trail_to_track(trail, name_field=name_field, desc_fields=desc_fields, simplify_tolerance=simplify_tolerance)
-                gpx.append(track)
-
-                # Write to ZIP
                 filename = f"{folder}{safe_name}.gpx"
-                tree = etree.ElementTree(gpx)
-                gpx_content = etree.tostring(tree, pretty_print=True, xml_declaration=True, encoding="UTF-8")
-                zipf.writestr(filename, gpx_content)
+                zipf.writestr(filename, content)
 
                 # Add to manifest
-                manifest_lines.append(f"- {filename}")
-                if desc_fields:
-                    for field in desc_fields:
-                        if field in trail and pd.notna(trail[field]):
-                            manifest_lines.append(f"  {field}: {trail[field]}")
+                manifest.write(f"- {filename}\n")
+                manifest.writelines(f"{values[pos]}\n" for values in manifest_fields if values[pos] is not None)
 
                 stats["total_files"] += 1
 
-            except Exception as e:
-                print(f"Warning: Failed to export trail {idx}: {e}")
-                stats["skipped_trails"] += 1
-                manifest_lines.append(f"- SKIPPED: {trail_name} (Error: {e})")
-
         # Add manifest to ZIP
-        manifest_lines.append("")
-        manifest_lines.append(f"Successfully exported: {stats['total_files']} files")
-        manifest_lines.append(f"Skipped: {stats['skipped_trails']} trails")
-        zipf.writestr("MANIFEST.txt", "\n".join(manifest_lines))
+        manifest.write(f"\nSuccessfully exported: {stats['total_files']} files\n")
+        manifest.write(f"Skipped: {stats['skipped_trails']} trails")
+        zipf.writestr("MANIFEST.txt", manifest.getvalue())
 
     stats["file_size_mb"] = float(output_path.stat().st_size) / (1024 * 1024)
 
     return output_path, stats
 
 
+def _component_labels(n: int, u: np.ndarray, v: np.ndarray) -> np.ndarray:
+    """Label the connected components of an undirected graph with n nodes and edges (u[k], v[k]).
+
+    A vectorized union-find: every root is hooked onto the smallest root it shares an edge with, and
+    pointer jumping then flattens the trees, until no root changes. Each node ends up labeled with the
+    smallest node of its component.
+    """
+    labels = np.arange(n)
+    while True:
+        hooked = labels.copy()
+        np.minimum.at(hooked, labels[u], labels[v])
+        np.minimum.at(hooked, labels[v], labels[u])
+        while not np.array_equal(jumped := hooked[hooked], hooked):
+            hooked = jumped
+        if np.array_equal(hooked, labels):
+            return labels
+        labels = hooked
+
+
 def find_connected_segments(
     segments: gpd.GeoDataFrame,
     tolerance_m: float = 50,
@@ -475,15 +881,13 @@ def find_connected_segments(
     """Find groups of connected trail segments.
 
     Args:
-        segments: GeoDataFrame with LineString or MultiLineString geometries
+        segments: GeoDataFrame with LineString or MultiLineString geometries; segments without
+            line geometry (missing, empty or of another type) form a group of their own
         tolerance_m: Maximum distance in meters to consider segments connected
 
     Returns:
-        List of lists, each containing indices of connected segments
+        List of lists, each containing indices of connected segments in ascending order, ordered by their first index
     """
-    import numpy as np
-    from shapely.geometry import Point
-
     if len(segments) == 0:
         return []
 
@@ -499,71 +903,32 @@ def find_connected_segments(
         # Use UTM 33N for Norway
         working_segments = working_segments.to_crs("EPSG:25833")
 
-    # Build connectivity matrix
     n_segments = len(working_segments)
-    connected = np.zeros((n_segments, n_segments), dtype=bool)
-
-    # Extract endpoints for each segment
-    endpoints: list[tuple[Point, Point] | tuple[None, None]] = []
-    for _idx, row in working_segments.iterrows():
-        geom = row.geometry
-        if geom and not geom.is_empty:
-            # Handle both LineString and MultiLineString
-            if geom.geom_type == "MultiLineString":
-                # For MultiLineString, use the first and last points of the entire geometry
-                first_line = geom.geoms[0]
-                last_line = geom.geoms[-1]
-                coords_first = list(first_line.coords)
-                coords_last = list(last_line.coords)
-                start_point = Point(coords_first[0])
-                end_point = Point(coords_last[-1])
-            else:  # LineString
-                coords = list(geom.coords)
-                start_point = Point(coords[0])
-                end_point = Point(coords[-1])
-            endpoints.append((start_point, end_point))
-        else:
-            endpoints.append((None, None))
-
-    # Check connectivity between all pairs
-    for i in range(n_segments):
-        ep_i = endpoints[i]
-        if ep_i[0] is None or ep_i[1] is None:
-            continue
 
-        for j in range(i + 1, n_segments):
-            ep_j = endpoints[j]
-            if ep_j[0] is None or ep_j[1] is None:
-                continue
-
-            # Check all endpoint combinations
-            distances = [
-                ep_i[0].distance(ep_j[0]),  # start-start
-                ep_i[0].distance(ep_j[1]),  # start-end
-                ep_i[1].distance(ep_j[0]),  # end-start
-                ep_i[1].distance(ep_j[1]),  # end-end
-            ]
-
-            if min(distances) <= tolerance_m:
-                connected[i, j] = True
-                connected[j, i] = True
-
-    # Find connected components using depth-first search
-    visited = np.zeros(n_segments, dtype=bool)
-    components = []
-
-    def dfs(node: int, component: list[int]) -> None:
-        visited[node] = True
-        component.append(node)
-        for neighbor in range(n_segments):
-            if connected[node, neighbor] and not visited[neighbor]:
-                dfs(neighbor, component)
-
-    for i in range(n_segments):
-        if not visited[i]:
-            component: list[int] = []
-            dfs(i, component)
-            components.append(component)
+    # Extract the start and end point of every non-empty line segment in vectorized calls; for a
+    # MultiLineString these are the first point of its first line and the last point of its last line
+    geoms = working_segments.geometry.to_numpy()
+    valid = np.flatnonzero(np.isin(shapely.get_type_id(geoms), LINE_TYPE_IDS) & ~shapely.is_empty(geoms))
+    starts = shapely.get_point(shapely.get_geometry(geoms[valid], 0), 0)
+    ends = shapely.get_point(shapely.get_geometry(geoms[valid], -1), -1)
+    endpoints = np.concatenate([starts, ends])
+    endpoint_segments = np.concatenate([valid, valid])
+
+    # Find candidate endpoint pairs with a spatial index query of a box around every endpoint instead of
+    # comparing every pair of segments, then keep the pairs within tolerance using plain NumPy distances
+    x, y = shapely.get_coordinates(endpoints).T
+    boxes = shapely.box(x - tolerance_m, y - tolerance_m, x + tolerance_m, y + tolerance_m)
+    left, right = shapely.STRtree(endpoints).query(boxes)
+    within = np.hypot(x[left] - x[right], y[left] - y[right]) <= tolerance_m
+    i, j = endpoint_segments[left[within]], endpoint_segments[right[within]]
+    distinct = i != j
+
+    # Label every segment with the smallest segment it is connected to, then list the members of each
+    # component in ascending order, with components ordered by their first segment
+    labels = _component_labels(n_segments, i[distinct], j[distinct])
+    order = np.argsort(labels, kind="stable")
+    bounds = np.flatnonzero(np.diff(labels[order])) + 1
+    components = [component.tolist() for component in np.split(order, bounds)]
 
     return components
 
@@ -577,6 +942,7 @@ def export_to_gpx_zip_smart(
     simplify_tolerance: float | None = 0.00001,
     max_trails: int | None = None,
     folder_by: str | None = None,
+    pretty_print: bool = False,
 ) -> tuple[Path, dict[str, Any]]:
     """Export GeoDataFrame as ZIP with smart trail grouping.
 
@@ -592,23 +958,27 @@ def export_to_gpx_zip_smart(
         simplify_tolerance: Tolerance for geometry simplification
         max_trails: Maximum number of trails to export
         folder_by: Optional field to organize into folders
+        pretty_print: Whether to indent the XML of each GPX file
 
     Returns:
         Tuple of (output_path, statistics_dict)
     """
-    import re
-    import zipfile
+    # Limit trails if specified, before reprojecting so only exported trails are transformed
+    export_gdf = gdf.head(max_trails) if max_trails else gdf
 
     # Ensure we're in WGS84
-    if gdf.crs and gdf.crs.to_epsg() != 4326:
-        gdf = gdf.to_crs(epsg=4326)
+    if export_gdf.crs and export_gdf.crs.to_epsg() != 4326:
+        export_gdf = export_gdf.to_crs(epsg=4326)
 
     # Default description fields
     if desc_fields is None:
         desc_fields = ["maintenance_responsible", "difficulty", "marking", "special_hiking_trail_type"]
 
-    # Limit trails if specified
-    export_gdf = gdf.head(max_trails) if max_trails else gdf
+    # Measure segment lengths for the descriptions before simplification shortens them, in one vectorized call
+    lengths = shapely.length(export_gdf.geometry.to_numpy())
+
+    # Simplify all geometries in one vectorized call
+    export_gdf = _simplify_geometries(export_gdf, simplify_tolerance)
 
     # Statistics
     stats: dict[str, Any] = {
@@ -624,74 +994,79 @@ def export_to_gpx_zip_smart(
     output_path = Path(output_path)
     output_path.parent.mkdir(parents=True, exist_ok=True)
 
-    with zipfile.ZipFile(output_path, "w", zipfile.ZIP_DEFLATED) as zipf:
-        # Create manifest
-        manifest_lines = ["Smart Trail Export Manifest", "=" * 50, ""]
-        manifest_lines.append(f"Export date: {datetime.utcnow().strftime('%Y-%m-%d %H:%M:%S UTC')}")
-        manifest_lines.append(f"Total segments: {len(export_gdf)}")
-        manifest_lines.append(f"Grouping by: {group_field}")
-        manifest_lines.append("")
+    with zipfile.ZipFile(output_path, "w", zipfile.ZIP_DEFLATED, compresslevel=ZIP_COMPRESS_LEVEL) as zipf:
+        # Create manifest, written incrementally rather than joined from a list of lines at the end
+        manifest = io.StringIO()
+        manifest.write(f"Smart Trail Export Manifest\n{'=' * 50}\n\n")
+        manifest.write(f"Export date: {time.strftime(MANIFEST_TIME_FORMAT, time.gmtime())}\n")
+        manifest.write(f"Total segments: {len(export_gdf)}\n")
+        manifest.write(f"Grouping by: {group_field}\n\n")
 
         # Track used filenames to avoid duplicates
         used_filenames = {}
 
-        # Group segments by trail identifier
-        grouped_trails: dict[str, list] = {}
-
-        for idx, segment in export_gdf.iterrows():
-            # Skip invalid geometries
-            if segment.geometry is None or segment.geometry.is_empty:
-                stats["skipped_segments"] += 1
-                continue
-
-            # Determine group key - use trail_number if available, else trail_name
-            group_key = None
-            if group_field in segment and pd.notna(segment[group_field]):
-                group_key = str(segment[group_field])
-            elif name_field in segment and pd.notna(segment[name_field]):
-                group_key = str(segment[name_field])
-            else:
-                group_key = f"Trail_{idx}"
-
-            # Add to grouped trails
-            if group_key not in grouped_trails:
-                grouped_trails[group_key] = []
-            grouped_trails[group_key].append((idx, segment))
+        # Every member shares the same metadata, so build it once
+        metadata = create_gpx_metadata()
 
-        # Process each trail group
-        for trail_id, segments in grouped_trails.items():
-            if not segments:
-                continue
+        # Compute the validity mask and key columns once instead of building a Series per segment
+        geoms = export_gdf.geometry.to_numpy()
+        missing = shapely.is_missing(geoms) | shapely.is_empty(geoms)
+
+        # Look up geometry types of all segments in one vectorized call rather than per segment
+        type_ids = shapely.get_type_id(geoms)
+
+        group_values = _column_values(export_gdf, group_field)
+        name_values = _column_values(export_gdf, name_field)
+        names = export_gdf[name_field].to_numpy(dtype=object) if name_field in export_gdf.columns else None
+        folder_values = _column_values(export_gdf, folder_by) if folder_by else None
+
+        # Convert the description attributes of all segments to text column-wise, each distinct value once
+        local_ids = _column_values(export_gdf, "local_id", prefix="local_id: ")
+        field_descs = _description_values(export_gdf, desc_fields, format_dates=True)
 
-            # Create GeoDataFrame for this trail's segments
-            indices = [s[0] for s in segments]
-            trail_segments = export_gdf.loc[indices].copy()
+        # Skip invalid geometries
+        stats["skipped_segments"] = int(missing.sum())
+        valid = np.flatnonzero(~missing)
+
+        # Determine group keys - use trail_number if available, else trail_name, else the row index
+        keys = np.array([f"Trail_{idx}" for idx in export_gdf.index[valid]], dtype=object)
+        for values in (name_values, group_values):
+            if values is not None:
+                keys = np.where(pd.notna(values[valid]), values[valid], keys)
+
+        # Group segment positions by key in one hash pass, with groups in order of first appearance
+        codes, group_keys = pd.factorize(keys)
+        order = np.argsort(codes, kind="stable")
+        bounds = np.searchsorted(codes[order], np.arange(len(group_keys) + 1))
+
+        # Process each trail group
+        for trail_id, start, stop in zip(group_keys, bounds[:-1], bounds[1:], strict=True):
+            segments = valid[order[start:stop]].tolist()
 
             # Group all segments with same trail_number into one component
-            components = [list(range(len(trail_segments)))]
+            components = [list(range(len(segments)))]
 
             # Get trail name for file naming
-            first_segment = segments[0][1]
-            trail_name = str(first_segment.get(name_field, trail_id))
-            if pd.isna(trail_name) or trail_name == "nan":
+            first = segments[0]
+            trail_name = str(names[first]) if names is not None else trail_id
+            if trail_name == "nan":
                 trail_name = trail_id
 
             # Sanitize base filename
-            safe_name = re.sub(r'[<>:"/\\|?*]', "_", trail_name)
+            safe_name = UNSAFE_FILENAME_CHARS.sub("_", trail_name)
             safe_name = safe_name[:80]  # Leave room for part suffix
 
             # Add trail_number to name if available and different from trail_name
-            if group_field in first_segment and pd.notna(first_segment[group_field]):
-                trail_num = str(first_segment[group_field])
+            if group_values is not None and group_values[first] is not None:
+                trail_num = group_values[first]
                 # Only add number if it's not already part of the name
                 if trail_num not in safe_name:
                     safe_name = f"{safe_name} ({trail_num})"
 
             # Determine folder
             folder = ""
-            if folder_by and folder_by in first_segment and pd.notna(first_segment[folder_by]):
-                folder_value = str(first_segment[folder_by])
-                folder = re.sub(r'[<>:"/\\|?*]', "_", folder_value) + "/"
+            if folder_values is not None and folder_values[first] is not None:
+                folder = UNSAFE_FILENAME_CHARS.sub("_", folder_values[first]) + "/"
                 if folder not in stats["groups"]:
                     stats["groups"].append(folder)
 
@@ -700,65 +1075,7 @@ def export_to_gpx_zip_smart(
                 # All segments in single file
                 stats["merged_trails"] += 1
 
-                # Create GPX with multiple tracks - one per segment to preserve metadata
-                gpx = create_gpx_document()
-
-                # Add each segment as a separate track to preserve individual metadata
-                for seg_idx, comp_idx in enumerate(components[0], 1):
-                    seg = trail_segments.iloc[comp_idx]
-
-                    # Create a track for this segment
-                    trk = etree.Element("trk")
-
-                    # Name the track with trail name and segment number
-                    segment_name = f"{trail_name} ({trail_num}) - Segment {seg_idx}/{len(components[0])}"
-                    etree.SubElement(trk, "name").text = segment_name
-
-                    # Build description with this segment's specific metadata
-                    desc_parts = []
-                    if group_field in seg and pd.notna(seg[group_field]):
-                        desc_parts.append(f"Trail #{seg[group_field]}")
-                    desc_parts.append(f"Segment {seg_idx} of {len(components[0])}")
-
-                    # Add segment-specific metadata
-                    if "local_id" in seg and pd.notna(seg["local_id"]):
-                        desc_parts.append(f"local_id: {seg['local_id']}")
-
-                    # Add all requested description fields for this specific segment
-                    for field in desc_fields:
-                        if field in seg and pd.notna(seg[field]):
-                            value = seg[field]
-                            # Format datetime fields nicely
-                            if hasattr(value, "strftime"):
-                                value = value.strftime("%Y-%m-%d")
-                            elif "date" in field.lower() and pd.notna(value):
-                                try:
-                                    value = pd.to_datetime(value).strftime("%Y-%m-%d")
-                                except Exception:
-                                    pass
-                            desc_parts.append(f"{field}: {value}")
-
-                    # Add geometry info
-                    if isinstance(seg.geometry, LineString):
-                        desc_parts.append(f"Length: {seg.geometry.length * 111000:.0f}m")  # Rough conversion
-                    elif isinstance(seg.geometry, MultiLineString):
-                        desc_parts.append(f"Length: {seg.geometry.length * 111000:.0f}m")
-
-                    if desc_parts:
-                        etree.SubElement(trk, "desc").text = " | ".join(desc_parts)
-
-                    # Add the geometry as track segments
-                    if isinstance(seg.geometry, LineString):
-                        trkseg = linestring_to_track_segment(seg.geometry, simplify_tolerance)
-                        trk.append(trkseg)
-                    elif isinstance(seg.geometry, MultiLineString):
-                        for line in seg.geometry.geoms:
-                            trkseg = linestring_to_track_segment(line, simplify_tolerance)
-                            trk.append(trkseg)
-
-                    gpx.append(trk)
-
-                # Write to ZIP
+                # Pick a unique file name within the ZIP
                 base_filename = f"{folder}{safe_name}"
                 filename = f"{base_filename}.gpx"
 
@@ -771,24 +1088,60 @@ def export_to_gpx_zip_smart(
 
                 used_filenames[filename] = True
 
-                tree = etree.ElementTree(gpx)
-                gpx_content = etree.tostring(tree, pretty_print=True, xml_declaration=True, encoding="UTF-8")
-                zipf.writestr(filename, gpx_content)
+                # Stream a GPX with multiple tracks into the ZIP - one per segment to preserve metadata
+                with zipf.open(filename, "w") as member, _gpx_writer(member, pretty_print, metadata=metadata) as xf:
+                    # Add each segment as a separate track to preserve individual metadata
+                    for seg_idx, comp_idx in enumerate(components[0], 1):
+                        seg_pos = segments[comp_idx]
+
+                        # Create a track for this segment
+                        trk = etree.Element("trk")
+
+                        # Name the track with trail name and segment number
+                        segment_name = f"{trail_name} ({trail_num}) - Segment {seg_idx}/{len(components[0])}"
+                        etree.SubElement(trk, "name").text = segment_name
+
+                        # Build description with this segment's specific metadata
+                        desc_parts = []
+                        if group_values is not None and group_values[seg_pos] is not None:
+                            desc_parts.append(f"Trail #{group_values[seg_pos]}")
+                        desc_parts.append(f"Segment {seg_idx} of {len(components[0])}")
+
+                        # Add segment-specific metadata
+                        if local_ids is not None and local_ids[seg_pos] is not None:
+                            desc_parts.append(local_ids[seg_pos])
+
+                        # Add all requested description fields for this specific segment, with dates formatted nicely
+                        if field_descs[seg_pos] is not None:
+                            desc_parts.append(field_descs[seg_pos])
+
+                        # Add geometry info
+                        is_line = type_ids[seg_pos] in LINE_TYPE_IDS
+                        if is_line:
+                            desc_parts.append(f"Length: {lengths[seg_pos] * 111000:.0f}m")  # Rough conversion
+
+                        if desc_parts:
+                            etree.SubElement(trk, "desc").text = " | ".join(desc_parts)
+
+                        # Add the geometry as track segments, one per LineString part
+                        if is_line:
+                            for line in shapely.get_parts(geoms[seg_pos]):
+                                trk.append(linestring_to_track_segment(line))
+
+                        xf.write(trk, pretty_print=pretty_print)
 
-                manifest_lines.append(f"✓ {filename} ({len(segments)} segments merged)")
+                manifest.write(f"✓ {filename} ({len(segments)} segments merged)\n")
                 stats["total_files"] += 1
 
         # Add summary to manifest
-        manifest_lines.append("")
-        manifest_lines.append("=" * 50)
-        manifest_lines.append("Summary:")
-        manifest_lines.append(f"  Total GPX files: {stats['total_files']}")
-        manifest_lines.append(f"  Merged trails: {stats['merged_trails']}")
-        manifest_lines.append(f"  Split trails: {stats['split_trails']}")
-        manifest_lines.append(f"  Skipped segments: {stats['skipped_segments']}")
+        manifest.write(f"\n{'=' * 50}\nSummary:\n")
+        manifest.write(f"  Total GPX files: {stats['total_files']}\n")
+        manifest.write(f"  Merged trails: {stats['merged_trails']}\n")
+        manifest.write(f"  Split trails: {stats['split_trails']}\n")
+        manifest.write(f"  Skipped segments: {stats['skipped_segments']}")
 
         # Write manifest
-        zipf.writestr("MANIFEST.txt", "\n".join(manifest_lines))
+        zipf.writestr("MANIFEST.txt", manifest.getvalue())
 
     stats["file_size_mb"] = float(output_path.stat().st_size) / (1024 * 1024)
 
@@ -3,22 +3,83 @@ Geonorge (Kartverket) data source loader.
 Norwegian government's official mapping authority data.
 """
 
+import hashlib
+import io
+import json
+import logging
+import os
+import shutil
+import tempfile
+import threading
+import time
+import weakref
 import zipfile
-from dataclasses import dataclass, field
+from collections.abc import Callable, Iterable, Iterator, Mapping
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass, field
+from functools import cached_property, lru_cache
 from pathlib import Path
-from typing import NamedTuple, TypeVar
+from typing import BinaryIO, NamedTuple, TypeVar
+from xml.sax.saxutils import escape
 
 import feedparser
 import geopandas as gpd
 import pandas as pd
+import pyarrow.parquet as pq
+import pyogrio
+import requests
+import shapely
+from lxml import etree
+from pyproj import CRS
 
 from trails.io import cache
 from trails.io.sources import geonorge_codes, geonorge_schema, geonorge_translations
 from trails.io.sources.language import Language
 
+logger = logging.getLogger(__name__)
+
 # TypeVar for DataFrame types
 T = TypeVar("T", gpd.GeoDataFrame, pd.DataFrame)
 
+# OGR VRT that reprojects a source layer while GDAL reads it
+WARPED_LAYER_VRT = (
+    "<OGRVRTDataSource><OGRVRTWarpedLayer>"
+    '<OGRVRTLayer name="{layer}"><SrcDataSource>{source}</SrcDataSource>{source_layer}</OGRVRTLayer>'
+    "<TargetSRS>{target_crs}</TargetSRS>"
+    "</OGRVRTWarpedLayer></OGRVRTDataSource>"
+)
+
+# XML namespace of ATOM feed elements, in lxml's Clark notation
+ATOM_NAMESPACE = "{http://www.w3.org/2005/Atom}"
+
+# File in the object cache holding the validators and selected entry of the last ATOM feed response
+ATOM_FEED_STATE_FILE = "geonorge_turrutebasen_atom_feed.json"
+
+# Seconds a Source reuses the download info from the ATOM feed before checking the feed again
+DOWNLOAD_INFO_TTL_SECONDS = 300
+
+# Seconds to wait for the ATOM feed server before giving up on the request
+ATOM_FEED_TIMEOUT_SECONDS = 30
+
+# Maximum number of FGDB layers read in parallel threads
+LAYER_READ_MAX_WORKERS = 8
+
+# Maximum number of layers processed (code expansion and translation) in parallel threads
+LAYER_PROCESS_MAX_WORKERS = 8
+
+# Maximum number of threads extracting ZIP members in parallel
+EXTRACT_MAX_WORKERS = 8
+
+# Metadata file and attribute table subdirectory of a TrailData Parquet directory
+PARQUET_DIR_METADATA_FILE = "metadata.json"
+PARQUET_DIR_TABLES = "tables"
+
+
+def _file_stamp(path: Path) -> tuple[int, int]:
+    """Return (mtime_ns, size) of a file, which changes whenever the file is rewritten."""
+    stat = path.stat()
+    return stat.st_mtime_ns, stat.st_size
+
 
 class AtomFeedEntry(NamedTuple):
     """Dataset entry from Geonorge ATOM feed."""
@@ -28,6 +89,262 @@ class AtomFeedEntry(NamedTuple):
     updated: str  # ISO format string
 
 
+def _nationwide_fgdb_entry(title: str, hrefs: Iterable[str], updated: str) -> AtomFeedEntry | None:
+    """Return the feed entry if it is the nationwide FGDB dataset.
+
+    Args:
+        title: Entry title
+        hrefs: Link targets of the entry
+        updated: Entry updated date
+
+    Returns:
+        AtomFeedEntry with the first FGDB ZIP link, or None if the entry is not the nationwide FGDB dataset
+    """
+    # Landsdekkende means nationwide in Norwegian
+    if ("Landsdekkende" in title or "_0000_" in title) and "FGDB" in title:
+        for href in hrefs:
+            if href and href.endswith(".zip") and "FGDB" in href:
+                return AtomFeedEntry(url=href, title=title, updated=updated)
+    return None
+
+
+def _scan_nationwide_entries(content: bytes) -> Iterator[AtomFeedEntry]:
+    """Find the nationwide FGDB entries of an ATOM feed in one streaming pass.
+
+    Args:
+        content: Raw ATOM feed document
+
+    Yields:
+        Nationwide FGDB entries in feed order
+
+    Raises:
+        lxml.etree.XMLSyntaxError: If the feed is not well-formed XML
+    """
+    for _event, entry in etree.iterparse(io.BytesIO(content), events=("end",), tag=f"{ATOM_NAMESPACE}entry"):
+        title = (entry.findtext(f"{ATOM_NAMESPACE}title") or "").strip()
+        hrefs = (link.get("href", "") for link in entry.iterfind(f"{ATOM_NAMESPACE}link"))
+        nationwide_entry = _nationwide_fgdb_entry(title, hrefs, (entry.findtext(f"{ATOM_NAMESPACE}updated") or "").strip())
+        # Entries are not needed once scanned
+        entry.clear()
+        if nationwide_entry is not None:
+            yield nationwide_entry
+
+
+def _newest_entry(entries: Iterable[AtomFeedEntry]) -> tuple[AtomFeedEntry | None, int]:
+    """Pick the most recently updated entry in a single pass.
+
+    Args:
+        entries: Feed entries
+
+    Returns:
+        Tuple of (newest entry, the first one on ties, or None if there are no entries; number of entries)
+    """
+    newest = None
+    count = 0
+    for entry in entries:
+        count += 1
+        if newest is None or entry.updated > newest.updated:
+            newest = entry
+    return newest, count
+
+
+def _extract_member_run(zip_path: Path, run: list[tuple[zipfile.ZipInfo, Path]]) -> None:
+    """Extract a run of ZIP members through a ZipFile handle of its own.
+
+    Args:
+        zip_path: Path to the ZIP file
+        run: Members and their target paths, in ZIP order
+    """
+    with open(zip_path, "rb") as f:
+        # Members are extracted front to back, so let the kernel read ahead aggressively
+        if hasattr(os, "posix_fadvise"):
+            os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        with zipfile.ZipFile(f, "r") as z:
+            for info, target in run:
+                with z.open(info) as src, open(target, "wb") as dst:
+                    shutil.copyfileobj(src, dst)
+
+
+def _extract_members_parallel(zip_path: Path, members: list[zipfile.ZipInfo], out_dir: Path, max_workers: int = EXTRACT_MAX_WORKERS) -> None:
+    """Extract ZIP members with several threads.
+
+    zlib releases the GIL while inflating, so members are decompressed concurrently.
+    ZipFile objects are not thread-safe; each thread opens its own and extracts a
+    contiguous run of members of about equal compressed size, so reads stay sequential.
+
+    Args:
+        zip_path: Path to the ZIP file
+        members: Members to extract
+        out_dir: Directory to extract to, keeping the paths inside the ZIP
+        max_workers: Maximum number of threads; 1 extracts in the calling thread
+
+    Raises:
+        ValueError: If a member would be extracted outside out_dir
+    """
+    # Create all directories up front so the threads only write files
+    out_root = out_dir.resolve()
+    files = []
+    for info in sorted(members, key=lambda info: info.header_offset):
+        target = (out_root / info.filename).resolve()
+        if not target.is_relative_to(out_root):
+            raise ValueError(f"ZIP member {info.filename!r} would be extracted outside {out_dir}")
+        if info.is_dir():
+            target.mkdir(parents=True, exist_ok=True)
+        else:
+            target.parent.mkdir(parents=True, exist_ok=True)
+            files.append((info, target))
+
+    # Start a new run each time the compressed bytes so far pass the next share
+    share = sum(info.compress_size for info, _ in files) / max(1, max_workers)
+    runs: list[list[tuple[zipfile.ZipInfo, Path]]] = [[]]
+    extracted = 0
+    for info, target in files:
+        if runs[-1] and extracted >= share * len(runs):
+            runs.append([])
+        runs[-1].append((info, target))
+        extracted += info.compress_size
+
+    if len(runs) == 1:
+        _extract_member_run(zip_path, runs[0])
+        return
+    with ThreadPoolExecutor(max_workers=len(runs), thread_name_prefix="trails-zip-extract") as executor:
+        for future in [executor.submit(_extract_member_run, zip_path, run) for run in runs]:
+            future.result()
+
+
+@lru_cache(maxsize=16)
+def _parse_crs(crs: str) -> CRS:
+    """Parse a CRS string once, so the target CRS and layers sharing a CRS reuse one object.
+
+    Args:
+        crs: Any CRS input pyproj accepts, e.g. "EPSG:4326"
+
+    Returns:
+        Parsed CRS
+    """
+    return CRS.from_user_input(crs)
+
+
+@lru_cache(maxsize=16)
+def _crs_to_auth(crs: CRS) -> str:
+    """Format a CRS consistently, e.g. as "EPSG:25833".
+
+    Args:
+        crs: CRS of a spatial layer; equal CRSs of several layers share one cached lookup
+
+    Returns:
+        "AUTHORITY:CODE" string, or the CRS string representation if it has no authority code
+    """
+    if hasattr(crs, "to_authority"):
+        auth = crs.to_authority()
+        if auth:
+            return f"{auth[0]}:{auth[1]}"
+    # Fallback to string representation
+    return str(crs)
+
+
+class LayerInfo(NamedTuple):
+    """What is known about a layer without reading its data."""
+
+    crs: CRS | None
+    features: int
+
+
+def _read_parquet_layer_info(file: BinaryIO) -> LayerInfo:
+    """Read the CRS and row count of a (Geo)Parquet file from its footer.
+
+    Args:
+        file: Open Parquet file written by geopandas or pandas
+
+    Returns:
+        LayerInfo with the CRS of the primary geometry column (None for plain tables) and the row count
+    """
+    file_metadata = pq.read_metadata(file)
+    geo = (file_metadata.metadata or {}).get(b"geo")
+    crs = None
+    if geo is not None:
+        geo_metadata = json.loads(geo)
+        crs_json = geo_metadata["columns"][geo_metadata["primary_column"]].get("crs")
+        if crs_json is not None:
+            crs = CRS.from_json_dict(crs_json)
+    return LayerInfo(crs=crs, features=file_metadata.num_rows)
+
+
+def _close_files(files: Iterable[BinaryIO]) -> None:
+    """Close files, e.g. the handles of layers that were never read."""
+    for file in files:
+        file.close()
+
+
+class LazyLayers(Mapping[str, T]):
+    """Read-only mapping of layer names to data that reads each layer on first access.
+
+    Every layer file is opened up front and later read through its open handle, so
+    replacing or clearing the files afterwards does not affect layers not read yet.
+    The CRS and feature count of every layer are known up front, so TrailData can
+    validate and count layers without reading them. Pickling reads all layers.
+    """
+
+    def __init__(self, files: dict[str, BinaryIO], reader: Callable[[BinaryIO], T]):
+        """Initialize lazy layers.
+
+        Args:
+            files: Open Parquet file of each layer, by layer name; the order is kept and
+                each file is closed once its layer is read
+            reader: Function reading a layer from its open file
+        """
+        self._files: dict[str, BinaryIO] = files
+        self._reader: Callable[[BinaryIO], T] = reader
+        self.info = {name: _read_parquet_layer_info(file) for name, file in files.items()}
+        self._loaded: dict[str, T] = {}
+        self._lock = threading.Lock()
+        # Close the handles of layers never read once the mapping is gone
+        weakref.finalize(self, _close_files, list(files.values()))
+
+    def __getitem__(self, name: str) -> T:
+        with self._lock:
+            if name not in self._loaded:
+                file = self._files[name]
+                self._loaded[name] = self._reader(file)
+                file.close()
+            return self._loaded[name]
+
+    def __contains__(self, name: object) -> bool:
+        # Mapping's default would read the layer to check for a KeyError
+        return name in self._files
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._files)
+
+    def __len__(self) -> int:
+        return len(self._files)
+
+    def __repr__(self) -> str:
+        return f"LazyLayers({list(self._files)}, loaded={list(self._loaded)})"
+
+    def __reduce__(self) -> tuple[type[dict], tuple[dict[str, T]]]:
+        # Open files cannot be pickled, so a pickled copy holds the data itself
+        return dict, (dict(self.items()),)
+
+    def is_loaded(self, name: str) -> bool:
+        """Whether a layer has been read."""
+        return name in self._loaded
+
+
+def _layer_crs(layers: Mapping[str, pd.DataFrame], name: str) -> CRS | None:
+    """Get the CRS of a layer, without reading it if it is lazily loaded."""
+    if isinstance(layers, LazyLayers):
+        return layers.info[name].crs
+    return getattr(layers[name], "crs", None)
+
+
+def _count_features(layers: Mapping[str, pd.DataFrame]) -> int:
+    """Count the features of all layers, without reading lazily loaded ones."""
+    if isinstance(layers, LazyLayers):
+        return sum(info.features for info in layers.info.values())
+    return sum(len(df) for df in layers.values())
+
+
 @dataclass(frozen=True)
 class Metadata:
     """Static metadata for a Geonorge dataset."""
@@ -53,8 +370,8 @@ class TrailData:
     """Loaded trail data with metadata."""
 
     metadata: Metadata
-    spatial_layers: dict[str, gpd.GeoDataFrame]  # Spatial geometry layers
-    attribute_tables: dict[str, pd.DataFrame]  # Non-spatial attribute tables
+    spatial_layers: Mapping[str, gpd.GeoDataFrame]  # Spatial geometry layers
+    attribute_tables: Mapping[str, pd.DataFrame]  # Non-spatial attribute tables
     source_url: str  # The actual download URL from ATOM feed
     version: str  # Current version from ATOM feed
     language: Language  # Language used for code expansion and translation
@@ -62,36 +379,36 @@ class TrailData:
 
     def __post_init__(self) -> None:
         """Validate and set CRS from spatial layers."""
-        # Collect all CRSs from spatial layers
-        crs_set = set()
-        for _name, gdf in self.spatial_layers.items():
-            if hasattr(gdf, "crs") and gdf.crs is not None:
-                # Use to_authority() for consistent format (e.g., "EPSG:25833")
-                if hasattr(gdf.crs, "to_authority"):
-                    auth = gdf.crs.to_authority()
-                    if auth:
-                        crs_set.add(f"{auth[0]}:{auth[1]}")
-                    else:
-                        # Fallback to string representation
-                        crs_set.add(str(gdf.crs))
-                else:
-                    crs_set.add(str(gdf.crs))
-
-        if not crs_set:
+        # Compare every layer's CRS with the first one found; layers without CRS are ignored
+        crs = None
+        first_layer = None
+        for name in self.spatial_layers:
+            crs_object = _layer_crs(self.spatial_layers, name)
+            if crs_object is None:
+                continue
+            layer_crs = _crs_to_auth(crs_object)
+            if crs is None:
+                crs, first_layer = layer_crs, name
+            elif layer_crs != crs:
+                raise ValueError(
+                    f"Inconsistent CRS across spatial layers: {first_layer!r} is {crs} but {name!r} is {layer_crs}. "
+                    "All spatial layers must have the same CRS."
+                )
+
+        if crs is None:
             raise ValueError("No spatial layers with CRS found in TrailData")
 
-        if len(crs_set) > 1:
-            raise ValueError(f"Inconsistent CRS across spatial layers: {crs_set}. All spatial layers must have the same CRS.")
-
         # Set the single CRS (frozen=True requires using object.__setattr__)
-        object.__setattr__(self, "crs", crs_set.pop())
+        object.__setattr__(self, "crs", crs)
 
-    @property
+    @cached_property
     def total_features(self) -> int:
-        """Total number of features across all layers and tables."""
-        spatial_count = sum(len(gdf) for gdf in self.spatial_layers.values())
-        table_count = sum(len(df) for df in self.attribute_tables.values())
-        return spatial_count + table_count
+        """Total number of features across all layers and tables, counted once.
+
+        cached_property stores the value in the instance __dict__ directly, which
+        works on the frozen dataclass.
+        """
+        return _count_features(self.spatial_layers) + _count_features(self.attribute_tables)
 
     @property
     def layer_names(self) -> list[str]:
@@ -108,6 +425,83 @@ class TrailData:
         """List of attribute table names."""
         return list(self.attribute_tables.keys())
 
+    def to_parquet_dir(self, path: str | Path) -> None:
+        """Write the data as a directory of (Geo)Parquet files.
+
+        The directory holds a metadata.json file, one GeoParquet file per spatial
+        layer and one Parquet file per attribute table in tables/. It is written
+        next to the target first and then moved into place, replacing any
+        existing directory.
+
+        Args:
+            path: Target directory
+        """
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_dir = Path(tempfile.mkdtemp(dir=path.parent, prefix=f".{path.name}."))
+        try:
+            os.chmod(tmp_dir, cache.DIR_MODE)
+            (tmp_dir / PARQUET_DIR_TABLES).mkdir()
+            for name, gdf in self.spatial_layers.items():
+                gdf.to_parquet(tmp_dir / f"{name}.parquet", compression="zstd", geometry_encoding="WKB")
+            for name, df in self.attribute_tables.items():
+                df.to_parquet(tmp_dir / PARQUET_DIR_TABLES / f"{name}.parquet", compression="zstd")
+
+            # Static metadata is stored in full so the object can be restored; layer lists keep their order
+            metadata = self.get_full_metadata()
+            metadata["metadata"] = asdict(self.metadata)
+            with open(tmp_dir / PARQUET_DIR_METADATA_FILE, "w") as f:
+                json.dump(metadata, f, indent=2)
+
+            shutil.rmtree(path, ignore_errors=True)
+            os.replace(tmp_dir, path)
+        finally:
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+
+    @classmethod
+    def from_parquet_dir(cls, path: str | Path) -> "TrailData":
+        """Read data written by to_parquet_dir.
+
+        Only the metadata and Parquet footers are read here; each layer is read on first
+        access. The layer files are opened here and read through their open handles, so
+        rewriting or clearing the directory afterwards does not affect the returned object.
+
+        Args:
+            path: Directory written by to_parquet_dir
+
+        Returns:
+            Restored TrailData object
+
+        Raises:
+            FileNotFoundError: If the directory has no metadata file
+        """
+        path = Path(path)
+        with open(path / PARQUET_DIR_METADATA_FILE) as f:
+            metadata = json.load(f)
+
+        spatial_paths = {name: path / f"{name}.parquet" for name in metadata["spatial_layers"]}
+        table_paths = {name: path / PARQUET_DIR_TABLES / f"{name}.parquet" for name in metadata["attribute_tables"]}
+
+        # Open every layer file now, so later changes to the directory cannot pull a file from under an unread layer
+        files: dict[Path, BinaryIO] = {}
+        try:
+            for file_path in [*spatial_paths.values(), *table_paths.values()]:
+                files[file_path] = open(file_path, "rb")
+            spatial_layers = LazyLayers({name: files[file_path] for name, file_path in spatial_paths.items()}, gpd.read_parquet)
+            attribute_tables = LazyLayers({name: files[file_path] for name, file_path in table_paths.items()}, pd.read_parquet)
+        except BaseException:
+            _close_files(files.values())
+            raise
+
+        return cls(
+            metadata=Metadata(**metadata["metadata"]),
+            spatial_layers=spatial_layers,
+            attribute_tables=attribute_tables,
+            source_url=metadata["source_url"],
+            version=metadata["version"],
+            language=Language(metadata["language"]),
+        )
+
     def get_description(self, column: str, value: str) -> str | None:
         """Get description for a value in the data's language.
 
@@ -190,12 +584,21 @@ class Source:
         """
         self.cache = cache.Object(f"{cache_dir}/objects")
         self.download_cache = cache.Download(f"{cache_dir}/downloads")
+        # Resolved ZIP path -> (stamp of the ZIP, path of the GDB folder inside it)
+        self._gdb_paths_in_zip: dict[Path, tuple[tuple[int, int], str]] = {}
+        # Resolved ZIP path -> (stamp of the ZIP, directory its GDB folder is extracted to)
+        self._extracted_gdbs: dict[Path, tuple[tuple[int, int], tempfile.TemporaryDirectory]] = {}
+        # (monotonic time it was fetched, download info) of the last ATOM feed check
+        self._download_info_cache: tuple[float, AtomFeedEntry] | None = None
 
     def load_turrutebasen(
         self,
         force_download: bool = False,
         target_crs: str | None = None,
         language: Language = Language.NO,
+        columns: dict[str, list[str]] | None = None,
+        bbox: tuple[float, float, float, float] | None = None,
+        mask: shapely.Geometry | None = None,
     ) -> TrailData:
         """
         Load Turrutebasen (trail database) from Geonorge with automatic code expansion.
@@ -209,6 +612,13 @@ class Source:
             force_download: Force re-download even if cached
             target_crs: Optional CRS to convert spatial layers to (e.g., "EPSG:4326")
             language: Language for values, layer names, and column names (NO or EN)
+            columns: Optional columns to read per layer, by the Norwegian layer and column
+                names in the FGDB (e.g. {"fotrute_senterlinje": ["lokalid", "gradering"]}).
+                Layers not listed are read with all columns.
+            bbox: Optional (xmin, ymin, xmax, ymax) box; only features of spatial layers that
+                intersect it are read. Given in target_crs, or the source CRS if not set.
+                Attribute tables are always read in full.
+            mask: Optional geometry used like bbox, in the same CRS. Cannot be combined with bbox.
 
         Returns:
             TrailData object with expanded codes and translations
@@ -226,15 +636,30 @@ class Source:
 
         Raises:
             FileNotFoundError: If automatic download fails
+            ValueError: If both bbox and mask are given
         """
-        # Include target CRS and language in cache key
+        if bbox is not None and mask is not None:
+            raise ValueError("Only one of bbox and mask can be given")
+
+        # Include target CRS, language and read filters in cache key
         cache_key = "geonorge_turrutebasen"
         if target_crs:
             crs_suffix = target_crs.replace(":", "_").lower()
             cache_key = f"{cache_key}_{crs_suffix}"
         if language != Language.NO:
             cache_key = f"{cache_key}_{language.value}"
+        if columns is not None:
+            columns_hash = hashlib.md5(json.dumps(columns, sort_keys=True).encode()).hexdigest()[:8]
+            cache_key = f"{cache_key}_columns_{columns_hash}"
+        if bbox is not None:
+            bbox_hash = hashlib.md5(json.dumps([float(value) for value in bbox]).encode()).hexdigest()[:8]
+            cache_key = f"{cache_key}_bbox_{bbox_hash}"
+        if mask is not None:
+            mask_hash = hashlib.md5(shapely.to_wkb(mask)).hexdigest()[:8]
+            cache_key = f"{cache_key}_mask_{mask_hash}"
         zip_filename = "turrutebasen.zip"
+        # Processed data is cached as a directory of (Geo)Parquet files
+        cache_path = self.cache.get_dir_path(cache_key)
 
         try:
             # Get download info from ATOM feed
@@ -250,18 +675,16 @@ class Source:
 
             # If we got fresh data, invalidate the processed cache
             if result.was_downloaded:
-                print("Got fresh data, clearing processed cache...")
+                logger.info("Got fresh data, clearing processed cache...")
                 self.cache.delete(cache_key)
-            elif self.cache.exists(cache_key):
+            elif (cache_path / PARQUET_DIR_METADATA_FILE).exists():
                 # ZIP wasn't re-downloaded AND we have cache = versions match
-                print("Loading Geonorge Turrutebasen from cache...")
-                data = self.cache.load(cache_key)
-                assert isinstance(data, TrailData)
-                return data
+                logger.info("Loading Geonorge Turrutebasen from cache...")
+                return TrailData.from_parquet_dir(cache_path)
 
             # If we get here: either fresh download OR no cache exists
-            print("Processing FGDB from ZIP file...")
-            spatial_layers, attribute_tables = self._load_fgdb_from_zip(result.path, target_crs=target_crs)
+            logger.info("Processing FGDB from ZIP file...")
+            spatial_layers, attribute_tables = self._load_fgdb_from_zip(result.path, target_crs=target_crs, columns=columns, bbox=bbox, mask=mask)
 
             # Process codes and translations
             spatial_layers = self._process_layers(spatial_layers, language)
@@ -278,23 +701,41 @@ class Source:
             )
 
             # Cache the TrailData object with its own metadata
-            print(f"Caching processed data with key: {cache_key}")
-            self.cache.save(cache_key, trail_data, metadata=trail_data.get_full_metadata())
+            logger.info("Caching processed data with key: %s", cache_key)
+            trail_data.to_parquet_dir(cache_path)
 
             return trail_data
 
         except Exception as e:
-            print(f"Error: {e}")
             # If anything fails but we have cached data, use it
-            if self.cache.exists(cache_key):
-                print("Using cached data instead...")
+            if (cache_path / PARQUET_DIR_METADATA_FILE).exists():
+                logger.warning("Error: %s. Using cached data instead...", e)
                 # Return cached TrailData object
-                data = self.cache.load(cache_key)
-                assert isinstance(data, TrailData)
-                return data
+                return TrailData.from_parquet_dir(cache_path)
             raise FileNotFoundError(f"Could not load data and no cache available.\nError: {e}") from e
 
     def _get_download_info(self) -> AtomFeedEntry:
+        """Get download information from the ATOM feed.
+
+        The result is reused for DOWNLOAD_INFO_TTL_SECONDS, so loading several variants
+        (e.g. other target CRS or language) checks the feed only once.
+
+        Returns:
+            AtomFeedEntry with url, title, and updated date
+
+        Raises:
+            ValueError: If the feed cannot be parsed or URL not found
+        """
+        if self._download_info_cache is not None:
+            fetched_at, entry = self._download_info_cache
+            if time.monotonic() - fetched_at < DOWNLOAD_INFO_TTL_SECONDS:
+                return entry
+
+        entry = self._fetch_download_info()
+        self._download_info_cache = (time.monotonic(), entry)
+        return entry
+
+    def _fetch_download_info(self) -> AtomFeedEntry:
         """Fetch download information from the ATOM feed.
 
         Returns:
@@ -303,113 +744,225 @@ class Source:
         Raises:
             ValueError: If the feed cannot be parsed or URL not found
         """
-        print("Fetching download URL from ATOM feed...")
-
-        # Parse the ATOM feed
-        feed = feedparser.parse(TURRUTEBASEN_METADATA.atom_feed_url)
-
-        # Check if feed has entries even if bozo is True (encoding issues are ok)
-        if not feed.entries:
-            error_msg = "No entries found in ATOM feed"
-            if feed.bozo:
-                error_msg += f" (parse warning: {feed.bozo_exception})"
-            raise ValueError(error_msg)
-
-        # Look for nationwide dataset (Landsdekkende means nationwide in Norwegian)
-        nationwide_entries = []
-
-        for entry in feed.entries:
-            title = entry.get("title", "")
-
-            # Check if this is the nationwide FGDB dataset
-            if ("Landsdekkende" in title or "_0000_" in title) and "FGDB" in title:
-                # Get the download link from entry.links
-                for link in entry.get("links", []):
-                    href = link.get("href", "")
-                    if href and href.endswith(".zip") and "FGDB" in href:
-                        nationwide_entries.append(AtomFeedEntry(url=href, title=title, updated=entry.get("updated", "")))
-                        break
-
-        if not nationwide_entries:
+        logger.info("Fetching download URL from ATOM feed...")
+
+        # Ask the server to skip the feed if it is unchanged since the last response we parsed
+        feed_url = TURRUTEBASEN_METADATA.atom_feed_url
+        state_path = self.cache.get_path(ATOM_FEED_STATE_FILE)
+        state = self._load_feed_state(state_path, feed_url)
+        headers = {}
+        if state is not None:
+            if state.get("etag"):
+                headers["If-None-Match"] = state["etag"]
+            if state.get("last_modified"):
+                headers["If-Modified-Since"] = state["last_modified"]
+
+        response = requests.get(feed_url, headers=headers, timeout=ATOM_FEED_TIMEOUT_SECONDS)
+        if response.status_code == 304 and state is not None:
+            cached_entry = AtomFeedEntry(**state["entry"])
+            logger.info("ATOM feed unchanged, using download URL: %s", cached_entry.url)
+            return cached_entry
+        response.raise_for_status()
+
+        # Scan the ATOM feed in a single streaming lxml pass; fall back to feedparser's
+        # lenient parsing if the feed is malformed or nothing is found
+        try:
+            selected, count = _newest_entry(_scan_nationwide_entries(response.content))
+        except etree.XMLSyntaxError:
+            selected = None
+
+        if selected is None:
+            feed = feedparser.parse(response.content)
+
+            # Check if feed has entries even if bozo is True (encoding issues are ok)
+            if not feed.entries:
+                error_msg = "No entries found in ATOM feed"
+                if feed.bozo:
+                    error_msg += f" (parse warning: {feed.bozo_exception})"
+                raise ValueError(error_msg)
+
+            candidates = (
+                _nationwide_fgdb_entry(entry.get("title", ""), (link.get("href", "") for link in entry.get("links", [])), entry.get("updated", ""))
+                for entry in feed.entries
+            )
+            selected, count = _newest_entry(candidate for candidate in candidates if candidate is not None)
+
+        if selected is None:
             raise ValueError("Could not find nationwide FGDB download URL in ATOM feed")
 
-        # If multiple entries, sort by updated date (newest first)
-        if len(nationwide_entries) > 1:
-            nationwide_entries.sort(key=lambda x: x.updated, reverse=True)
-            print(f"Found {len(nationwide_entries)} nationwide entries, using most recent")
+        # If multiple entries, use the most recently updated one
+        if count > 1:
+            logger.info("Found %d nationwide entries, using most recent", count)
 
-        selected = nationwide_entries[0]
-        print(f"Found download URL: {selected.url}")
-        print(f"  Dataset: {selected.title}")
-        print(f"  Updated: {selected.updated}")
+        logger.info("Found download URL: %s (dataset: %s, updated: %s)", selected.url, selected.title, selected.updated)
+
+        # Remember the response validators for the next conditional request
+        state = {
+            "url": feed_url,
+            "etag": response.headers.get("ETag"),
+            "last_modified": response.headers.get("Last-Modified"),
+            "entry": selected._asdict(),
+        }
+        with open(state_path, "w") as f:
+            json.dump(state, f, indent=2)
 
         return selected
 
-    def _load_fgdb_from_zip(self, zip_path: Path, target_crs: str | None = None) -> tuple[dict[str, gpd.GeoDataFrame], dict[str, pd.DataFrame]]:
+    def _load_feed_state(self, state_path: Path, feed_url: str) -> dict | None:
+        """Load the state saved from the last ATOM feed response.
+
+        Args:
+            state_path: File the state is stored in
+            feed_url: URL of the feed the state must belong to
+
+        Returns:
+            State with etag, last_modified and entry, or None if missing, unreadable or for another feed
+        """
+        try:
+            with open(state_path) as f:
+                state = json.load(f)
+            AtomFeedEntry(**state["entry"])
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+        return state if state.get("url") == feed_url else None
+
+    def _load_fgdb_from_zip(
+        self,
+        zip_path: Path,
+        target_crs: str | None = None,
+        columns: dict[str, list[str]] | None = None,
+        bbox: tuple[float, float, float, float] | None = None,
+        mask: shapely.Geometry | None = None,
+    ) -> tuple[dict[str, gpd.GeoDataFrame], dict[str, pd.DataFrame]]:
         """Load FGDB directly from ZIP file.
 
-        This is a pure function that only transforms data from ZIP to GeoDataFrames.
-        No caching or side effects.
+        Only transforms data from ZIP to GeoDataFrames; the sole state kept is the
+        extracted GDB folder, which is reused while the ZIP is unchanged.
 
         Args:
             zip_path: Path to the ZIP file containing FGDB
             target_crs: Optional CRS to convert ALL spatial layers to (e.g., "EPSG:4326")
+            columns: Optional columns to read per layer name; other layers are read with all columns
+            bbox: Optional box to filter spatial layers by, in target_crs or the source CRS
+            mask: Optional geometry to filter spatial layers by, in the same CRS as bbox
 
         Returns:
             Tuple of (spatial_layers, attribute_tables)
         """
-        print(f"Loading FGDB from {zip_path.name}")
+        logger.info("Loading FGDB from %s", zip_path.name)
 
         # Find the GDB path inside the ZIP
         gdb_path_in_zip = self._find_gdb_in_zip(zip_path)
 
-        # Construct GDAL virtual file system path
-        vsi_path = f"/vsizip/{zip_path}/{gdb_path_in_zip}"
-        print(f"Using virtual path: {vsi_path}")
+        # Extract the GDB folder once rather than letting /vsizip/ inflate it again for every layer
+        gdb_path = str(self._extract_gdb(zip_path, gdb_path_in_zip))
+        logger.debug("Using extracted path: %s", gdb_path)
 
-        # List available layers
+        # List available layers as (name, geometry_type) rows
         try:
-            layers_df = gpd.list_layers(vsi_path)
-            print(f"\nFound {len(layers_df)} layers in Geonorge dataset:")
-            for _, row in layers_df.iterrows():
-                print(f"  - {row['name']} ({row['geometry_type']})")
+            layers = pyogrio.list_layers(gdb_path)
         except Exception as e:
-            print(f"Error listing layers: {e}")
+            logger.error("Error listing layers: %s", e)
             raise
+        logger.info("Found %d layers in Geonorge dataset", len(layers))
+        # Skip the per-layer listing entirely unless debugging
+        if logger.isEnabledFor(logging.DEBUG):
+            for layer_name, geometry_type in layers:
+                logger.debug("  - %s (%s)", layer_name, geometry_type)
 
         # Load each layer and separate spatial from non-spatial
         spatial_layers = {}
         attribute_tables = {}
 
-        for _, row in layers_df.iterrows():
-            layer_name = row["name"]
-            print(f"\nLoading layer: {layer_name}")
-            try:
-                df = gpd.read_file(vsi_path, layer=layer_name)
-                print(f"  Loaded {len(df)} features")
+        # Read layers in parallel threads (GDAL releases the GIL and each read opens its own dataset);
+        # results are reported and collected in layer order
+        max_workers = max(1, min(LAYER_READ_MAX_WORKERS, len(layers)))
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="trails-fgdb-read") as executor:
+            futures = [
+                executor.submit(self._read_layer, gdb_path, layer_name, geometry_type, target_crs, (columns or {}).get(layer_name), bbox, mask)
+                for layer_name, geometry_type in layers
+            ]
+
+            for (layer_name, _geometry_type), future in zip(layers, futures, strict=True):
+                try:
+                    df, converted_from = future.result()
+                except Exception as e:
+                    logger.warning("Error loading layer %s: %s", layer_name, e)
+                    continue
+                if converted_from:
+                    logger.info("Converted layer %s from %s to %s", layer_name, converted_from, target_crs)
+                logger.info("Loaded layer %s: %d features", layer_name, len(df))
 
                 # Check if it's actually a spatial layer
                 if isinstance(df, gpd.GeoDataFrame) and df.crs:
                     # Spatial layer with geometry
-                    # Convert CRS if requested
-                    if target_crs:
-                        print(f"  Converting CRS from {df.crs} to {target_crs}")
-                        df = df.to_crs(target_crs)
                     spatial_layers[layer_name] = df
                 else:
                     # Non-spatial attribute table
                     # Convert to regular DataFrame to be explicit
                     attribute_tables[layer_name] = pd.DataFrame(df)
 
-            except Exception as e:
-                print(f"  Error loading layer {layer_name}: {e}")
-                continue
-
         if not spatial_layers and not attribute_tables:
             raise ValueError("No layers could be loaded from FGDB")
 
         return spatial_layers, attribute_tables
 
+    def _read_layer(
+        self,
+        gdb_path: str,
+        layer_name: str,
+        geometry_type: str | None,
+        target_crs: str | None,
+        columns: list[str] | None = None,
+        bbox: tuple[float, float, float, float] | None = None,
+        mask: shapely.Geometry | None = None,
+    ) -> tuple[pd.DataFrame, str | None]:
+        """Read a single FGDB layer.
+
+        Args:
+            gdb_path: Path of the FGDB folder
+            layer_name: Name of the layer to read
+            geometry_type: Geometry type of the layer, None for attribute tables
+            target_crs: Optional CRS to reproject spatial layers to
+            columns: Optional columns to read; unknown names are ignored. None reads all columns.
+            bbox: Optional box to filter spatial layers by, in the CRS of the returned data
+            mask: Optional geometry to filter spatial layers by, in the CRS of the returned data
+
+        Returns:
+            Tuple of (layer data, source CRS if it was reprojected while reading)
+        """
+        # Push spatial filters down to GDAL so the FGDB spatial index skips features outside them;
+        # attribute tables have no geometry to filter on
+        if geometry_type is None:
+            bbox = mask = None
+
+        # Let GDAL reproject while reading if requested, so only the target geometries are materialized;
+        # layers already in the target CRS are read as they are, without an identity transform
+        info = pyogrio.read_info(gdb_path, layer=layer_name) if target_crs and geometry_type else None
+        layer_crs = info["crs"] if info is not None else None
+        if info is not None and target_crs and layer_crs and not _parse_crs(layer_crs).equals(_parse_crs(target_crs)):
+            source_layer = f"<SrcLayer>{escape(layer_name)}</SrcLayer>"
+            fields = None
+            if columns is not None:
+                # Warped layers ignore pyogrio's column selection, so select the columns in the source query
+                fields = [name for name in info["fields"] if name in columns]
+                if fields:
+                    quoted_fields = ", ".join(f'"{name}"' for name in fields)
+                    query = f'SELECT {quoted_fields} FROM "{layer_name}"'
+                    source_layer = f"<SrcSQL>{escape(query)}</SrcSQL>"
+            warped_vrt = WARPED_LAYER_VRT.format(
+                source=escape(gdb_path), layer=escape(layer_name), source_layer=source_layer, target_crs=escape(target_crs)
+            )
+            # The warped layer transforms the filter back to the source CRS
+            df = pyogrio.read_dataframe(warped_vrt, bbox=bbox, mask=mask, use_arrow=True)
+            if fields == []:
+                # Only the geometry is left when none of the requested columns exist
+                df = df[[df.geometry.name]]
+            return df, layer_crs
+
+        # Read through GDAL's Arrow stream interface instead of building per-feature Python objects
+        return pyogrio.read_dataframe(gdb_path, layer=layer_name, columns=columns, bbox=bbox, mask=mask, use_arrow=True), None
+
     def _process_layers(
         self,
         layers: dict[str, T],
@@ -424,13 +977,15 @@ class Source:
         Returns:
             Processed layers with expanded codes and translated names
         """
-        processed: dict[str, T] = {}
-
-        for layer_name, df in layers.items():
-            # Process the dataframe
+        # Layers are independent, so process them in parallel threads (pandas' vectorized kernels
+        # release the GIL); threads share the frames instead of pickling them to other processes
+        max_workers = max(1, min(LAYER_PROCESS_MAX_WORKERS, len(layers)))
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="trails-layer-process") as executor:
             # _process_dataframe preserves the type
-            processed_df = self._process_dataframe(df, language)
+            processed_dfs = list(executor.map(self._process_dataframe, layers.values(), [language] * len(layers)))
 
+        processed: dict[str, T] = {}
+        for layer_name, processed_df in zip(layers, processed_dfs, strict=True):
             # Always translate - will return original if no translation exists
             translated_name = geonorge_translations.translate_layer_name(layer_name, language)
 
@@ -450,12 +1005,11 @@ class Source:
             language: Target language
 
         Returns:
-            Processed DataFrame with standardized types and expanded codes
+            Processed DataFrame with standardized types and expanded codes; code columns are
+            always of "string" dtype, whatever values they hold
         """
-        # Make a copy to avoid modifying the original
-        df = df.copy()
-
-        # Step 1: Standardize column types (converts numeric codes to strings)
+        # Step 1: Standardize column types (converts numeric codes to strings); returns a new
+        # frame that shares the unconverted columns, so the original is not modified
         df = geonorge_schema.standardize_types(df)
 
         # Step 2: Expand code columns to human-readable values
@@ -463,22 +1017,54 @@ class Source:
             col_name: str = str(column)
             # Check if this is a code column using the schema
             if geonorge_schema.get_column_type(col_name) == "code":
-                # Now codes are strings, so lookup will work correctly
-                df[col_name] = (
-                    df[col_name]
-                    .apply(lambda code, col=col_name: geonorge_codes.get_value(col, code, language) if pd.notna(code) else pd.NA)
-                    .astype("string")
-                )  # Ensure result is string dtype, not object
-
-        # Step 3: Translate column names - will return original if no translation
-        rename_dict = {}
-        for col_name in df.columns:
-            rename_dict[col_name] = geonorge_translations.translate_column_name(col_name, language)
+                # Now codes are strings, so lookup will work correctly. Expand with one vectorized dict
+                # lookup; codes without a table entry keep their value and NA stays NA
+                codes = df[col_name]
+                df[col_name] = codes.map(geonorge_codes.get_mapping(col_name, language)).fillna(codes).astype("string")
 
-        df = df.rename(columns=rename_dict)
+        # Step 3: Translate column names with the prebuilt per-language dict - columns without translation keep their name
+        column_translations = geonorge_translations.COLUMN_TRANSLATIONS_FLAT[language]
+        if column_translations:
+            # In place on our own frame, as rename would otherwise deep-copy every column
+            df.rename(columns=column_translations, inplace=True)
 
         return df
 
+    def _extract_gdb(self, zip_path: Path, gdb_path_in_zip: str) -> Path:
+        """Extract the GDB folder of a ZIP file to a temporary directory.
+
+        The extraction is reused as long as the ZIP file is unchanged, and removed
+        when the ZIP changes, the Source is garbage collected or the interpreter exits.
+
+        Args:
+            zip_path: Path to the ZIP file
+            gdb_path_in_zip: Path to the .gdb folder inside the ZIP
+
+        Returns:
+            Path to the extracted .gdb folder
+        """
+        stamp = _file_stamp(zip_path)
+        key = zip_path.resolve()
+        cached = self._extracted_gdbs.pop(key, None)
+        if cached is not None:
+            if cached[0] == stamp:
+                self._extracted_gdbs[key] = cached
+                return Path(cached[1].name) / gdb_path_in_zip
+            cached[1].cleanup()
+
+        logger.info("Extracting %s from %s", gdb_path_in_zip, zip_path.name)
+        scratch_dir = tempfile.TemporaryDirectory(prefix="trails-fgdb-")
+        try:
+            with zipfile.ZipFile(zip_path, "r") as z:
+                members = [info for info in z.infolist() if info.filename.startswith(f"{gdb_path_in_zip}/")]
+            _extract_members_parallel(zip_path, members, Path(scratch_dir.name))
+        except BaseException:
+            scratch_dir.cleanup()
+            raise
+
+        self._extracted_gdbs[key] = (stamp, scratch_dir)
+        return Path(scratch_dir.name) / gdb_path_in_zip
+
     def _find_gdb_in_zip(self, zip_path: Path) -> str:
         """Find the GDB folder path inside a ZIP file.
 
@@ -488,9 +1074,19 @@ class Source:
         Returns:
             Path to the .gdb folder inside the ZIP
         """
+        # Reuse the result while the ZIP is unchanged, so retries don't re-read the central directory
+        stamp = _file_stamp(zip_path)
+        key = zip_path.resolve()
+        cached = self._gdb_paths_in_zip.get(key)
+        if cached is not None and cached[0] == stamp:
+            return cached[1]
+
         with zipfile.ZipFile(zip_path, "r") as z:
-            for name in z.namelist():
-                if ".gdb/" in name:
+            for info in z.infolist():
+                idx = info.filename.find(".gdb/")
+                if idx != -1:
                     # Return the path up to and including .gdb
-                    return name.split(".gdb/")[0] + ".gdb"
+                    gdb_path_in_zip = info.filename[: idx + 4]
+                    self._gdb_paths_in_zip[key] = (stamp, gdb_path_in_zip)
+                    return gdb_path_in_zip
         raise FileNotFoundError(f"No .gdb folder found in {zip_path}")
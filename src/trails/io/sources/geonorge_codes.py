@@ -4,7 +4,10 @@ This module contains all the code tables used in the Norwegian Geonorge/Kartverk
 trail database (Turrutebasen), with Norwegian values and English translations.
 """
 
+from collections.abc import Mapping
 from dataclasses import dataclass
+from functools import cache
+from types import MappingProxyType
 
 from trails.io.sources.language import Language
 
@@ -1995,6 +1998,22 @@ def get_value(column: str, code: str, language: Language = Language.NO) -> str:
     return entry.value if entry else code
 
 
+@cache
+def get_mapping(column: str, language: Language = Language.NO) -> Mapping[str, str]:
+    """Get expanded values for all codes of a column in specified language.
+
+    The mapping is built once per column and language and shared between callers.
+
+    Args:
+        column: Column name (e.g., "gradering")
+        language: Target language
+
+    Returns:
+        Read-only mapping of code to expanded value, empty if the column has no code table
+    """
+    return MappingProxyType({code: entries[language].value for code, entries in CODE_TABLES.get(column, {}).items() if language in entries})
+
+
 def get_description(column: str, code: str, language: Language = Language.NO) -> str | None:
     """Get description for a code in specified language.
 
@@ -2025,17 +2044,24 @@ def get_code(column: str, value: str, language: Language = Language.NO) -> str |
         code = get_code("gradering", "Enkel (Grønn)", Language.NO)
         # Returns "G"
     """
-    if column not in CODE_TABLES:
-        return None
+    return _get_reverse_mapping(column, language).get(value)
 
-    # Search through all codes in this column's table
-    for code, lang_entries in CODE_TABLES[column].items():
-        if language in lang_entries:
-            entry = lang_entries[language]
-            if entry.value == value:
-                return code
 
-    return None
+@cache
+def _get_reverse_mapping(column: str, language: Language) -> Mapping[str, str]:
+    """Get codes by expanded value for a column, built once per column and language.
+
+    Args:
+        column: Column name (e.g., "gradering")
+        language: Language of the values
+
+    Returns:
+        Read-only mapping of expanded value to code; the first code in the table wins for shared values
+    """
+    reverse: dict[str, str] = {}
+    for code, value in get_mapping(column, language).items():
+        reverse.setdefault(value, code)
+    return MappingProxyType(reverse)
 
 
 def has_code_table(column: str) -> bool:
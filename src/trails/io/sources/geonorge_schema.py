@@ -98,7 +98,9 @@ def standardize_types(df: T) -> T:
     Returns:
         DataFrame with standardized types
     """
-    df = df.copy()
+    # Shallow copy: columns are only ever replaced, never modified in place, so the
+    # caller's frame is untouched and unconverted columns (e.g. geometry) are not copied
+    df = df.copy(deep=False)
 
     # Track columns without schema for warning
     unknown_columns = []
@@ -192,6 +192,27 @@ COLUMN_TRANSLATIONS = {
 }
 
 
+def _flatten_translations(translation_dict: dict[str, dict[Language, str]]) -> dict[Language, dict[str, str]]:
+    """
+    Regroup a translation dictionary by target language.
+
+    Args:
+        translation_dict: Dictionary with language mappings per name
+
+    Returns:
+        Dictionary of language -> {name: translated name}, with only the names translated to that language
+    """
+    return {
+        language: {name: translations[language] for name, translations in translation_dict.items() if language in translations}
+        for language in Language
+    }
+
+
+# Layer and column name translations per target language, built once for direct lookups and renames
+LAYER_TRANSLATIONS_FLAT = _flatten_translations(LAYER_TRANSLATIONS)
+COLUMN_TRANSLATIONS_FLAT = _flatten_translations(COLUMN_TRANSLATIONS)
+
+
 def translate_name(name: str, translation_dict: dict[str, dict[Language, str]], language: Language) -> str:
     """
     Translate a name using the translation dictionary.
@@ -221,7 +242,7 @@ def translate_layer_name(name: str, language: Language) -> str:
     Returns:
         Translated layer name or original if no translation exists
     """
-    return translate_name(name, LAYER_TRANSLATIONS, language)
+    return LAYER_TRANSLATIONS_FLAT[language].get(name, name)
 
 
 def translate_column_name(name: str, language: Language) -> str:
@@ -235,4 +256,4 @@ def translate_column_name(name: str, language: Language) -> str:
     Returns:
         Translated column name or original if no translation exists
     """
-    return translate_name(name, COLUMN_TRANSLATIONS, language)
+    return COLUMN_TRANSLATIONS_FLAT[language].get(name, name)
@@ -264,7 +264,7 @@ def create_turrutebasen_atom_fixture(output_path: Path) -> Path:
         <category term="EPSG:25833" scheme="http://www.opengis.net/def/crs/"/>
         <id>test-entry-id</id>
         <link rel="alternate"
-              href="https://test.example.com/turrutebasen_minimal.zip"
+              href="https://test.example.com/Basisdata_0000_Norge_25833_TurOgFriluftsruter_FGDB.zip"
               type="application/zip"
               title="FGDB-format, Landsdekkende"/>
         <published>2025-09-18T05:31:27+02:00</published>
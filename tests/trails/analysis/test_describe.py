@@ -2,6 +2,7 @@
 
 import pandas as pd
 
+from trails.analysis import describe
 from trails.analysis.describe import describe_column, describe_dataframe
 
 
@@ -32,6 +33,14 @@ class TestDescribeColumn:
         assert "- A: 3" in result
         assert "- B: 3" in result
 
+    def test_top_values_order_with_ties(self):
+        """Test top 5 values are most frequent first, ties in order of appearance."""
+        series = pd.Series(["F", "E", "D", "C", "B", "A", "G", "C", "A", "A"])
+        result = describe_column(series, "category")
+
+        top_lines = result.split("Top 5 values:\n")[1].splitlines()
+        assert top_lines == ["    - A: 3", "    - C: 2", "    - F: 1", "    - E: 1", "    - D: 1"]
+
     def test_int64_column(self):
         """Test Int64 numeric column."""
         series = pd.Series([1, 2, 3, 4, 5, None], dtype="Int64")
@@ -95,6 +104,16 @@ class TestDescribeColumn:
         assert "category [string]:" in result
         assert "Values: ['A (2)', 'B (1)', 'C (1)']" in result
 
+    def test_categorical_column(self):
+        """Test dictionary-encoded (categorical) column matches its string counterpart."""
+        values = ["Easy", "Hard", "Easy", None, "Medium", "Easy"]
+        result = describe_column(pd.Series(values, dtype="category"), "difficulty")
+
+        assert "difficulty [category]:" in result
+        assert "Unique values: 3" in result
+        assert "Values: ['Easy (3)', 'Hard (1)', 'Medium (1)']" in result
+        assert result.split("\n", 1)[1] == describe_column(pd.Series(values), "difficulty").split("\n", 1)[1]
+
     def test_no_name_provided(self):
         """Test when no name is provided, uses series name."""
         series = pd.Series([1, 2, 3], name="my_column")
@@ -194,3 +213,25 @@ class TestDescribeDataFrame:
 
         # Should maintain the original order: partial, complete, mostly_empty
         assert partial_pos < complete_pos < mostly_empty_pos
+
+    def test_describe_object_columns_in_worker_processes(self, monkeypatch):
+        """Test that large object columns described in worker processes match the in-thread result."""
+        df = pd.DataFrame({"name": ["A", "B", "A", None], "number": [1, 2, 3, 4]})
+        expected = describe_dataframe(df)
+
+        monkeypatch.setattr(describe, "PROCESS_POOL_MIN_ROWS", 0)
+        result = describe_dataframe(df, use_processes=True)
+
+        assert result == expected
+
+    def test_describe_uses_no_processes_by_default(self, monkeypatch):
+        """Test that no process pool is started unless requested."""
+        df = pd.DataFrame({"name": ["A", "B", "A", None]})
+
+        def fail(*args, **kwargs):
+            raise AssertionError("process pool started")
+
+        monkeypatch.setattr(describe, "PROCESS_POOL_MIN_ROWS", 0)
+        monkeypatch.setattr(describe, "ProcessPoolExecutor", fail)
+
+        assert "name [object]:" in describe_dataframe(df)
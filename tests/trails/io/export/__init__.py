@@ -0,0 +1 @@
+"""Tests for trails.io.export module."""
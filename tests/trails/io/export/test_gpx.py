@@ -0,0 +1,540 @@
+"""Tests for GPX export."""
+
+import gzip
+import re
+import zipfile
+
+import geopandas as gpd
+import pandas as pd
+import pytest
+from lxml import etree
+from shapely.geometry import LineString, MultiLineString, Point, Polygon
+
+from trails.io.export import gpx
+from trails.io.export.gpx import (
+    export_to_gpx,
+    export_to_gpx_fast,
+    export_to_gpx_single_track,
+    export_to_gpx_zip,
+    export_to_gpx_zip_smart,
+    filter_trails_by_bbox,
+    find_connected_segments,
+    linestring_to_track_segment,
+)
+
+GPX_NS = {"gpx": "http://www.topografix.com/GPX/1/1"}
+
+
+@pytest.fixture
+def trails_gdf():
+    """Small trail GeoDataFrame in WGS84 with a missing name, a multi-part trail and an empty geometry."""
+    return gpd.GeoDataFrame(
+        {
+            "trail_name": ["Ridge", None, "Loop", "Empty"],
+            "type": ["hiking", "skiing", None, "hiking"],
+            "difficulty": ["easy", None, "hard", "easy"],
+            "marking": [None, None, "red", None],
+        },
+        geometry=[
+            LineString([(10.0, 60.0), (10.1, 60.1), (10.2, 60.0)]),
+            LineString([(11.0, 61.0), (11.5, 61.5)]),
+            MultiLineString([[(12.0, 62.0), (12.1, 62.1)], [(12.2, 62.2), (12.3, 62.3)]]),
+            LineString(),
+        ],
+        crs="EPSG:4326",
+    )
+
+
+@pytest.fixture
+def numbered_trails_gdf():
+    """Trail segments where two segments share a trail number."""
+    return gpd.GeoDataFrame(
+        {
+            "trail_name": ["Ridge", "Ridge", "Lake/Loop", None],
+            "trail_number": ["12", "12", "7", None],
+            "local_id": ["a", "b", "c", "d"],
+            "difficulty": ["easy", "hard", None, "easy"],
+            "municipality": ["Oslo", "Oslo", "Bergen", None],
+        },
+        geometry=[
+            LineString([(10.0, 60.0), (10.1, 60.0)]),
+            LineString([(10.1, 60.0), (10.2, 60.0)]),
+            MultiLineString([[(12.0, 62.0), (12.1, 62.1)], [(12.2, 62.2), (12.3, 62.3)]]),
+            LineString([(11.0, 61.0), (11.5, 61.5)]),
+        ],
+        crs="EPSG:4326",
+    )
+
+
+def parse_tracks(path):
+    """Parse the tracks of a written GPX file."""
+    return etree.parse(str(path)).getroot().findall("gpx:trk", GPX_NS)
+
+
+class TestLinestringToTrackSegment:
+    """Tests for linestring_to_track_segment function."""
+
+    def test_points_in_order(self):
+        """Test that every coordinate becomes a trkpt in order, with lat before lon."""
+        trkseg = linestring_to_track_segment(LineString([(10.0, 60.0), (10.5, 60.25), (11.0, 60.5)]))
+
+        assert trkseg.tag == "trkseg"
+        assert [(p.tag, p.get("lat"), p.get("lon")) for p in trkseg] == [
+            ("trkpt", "60.0000000", "10.0000000"),
+            ("trkpt", "60.2500000", "10.5000000"),
+            ("trkpt", "60.5000000", "11.0000000"),
+        ]
+
+    def test_simplify(self):
+        """Test that the segment is simplified when a tolerance is given."""
+        line = LineString([(10.0, 60.0), (10.05, 60.000001), (10.1, 60.0)])
+
+        assert len(linestring_to_track_segment(line)) == 3
+        assert len(linestring_to_track_segment(line, simplify_tolerance=0.0001)) == 2
+
+
+class TestExportToGpx:
+    """Tests for export_to_gpx function."""
+
+    def test_statistics(self, trails_gdf, tmp_path):
+        """Test that exported trails, points and skipped trails are counted."""
+        path, stats = export_to_gpx(trails_gdf, tmp_path / "trails.gpx", simplify_tolerance=None)
+
+        assert path.exists()
+        assert stats["total_trails"] == 4
+        assert stats["total_points"] == 9
+        assert stats["skipped_trails"] == 1
+        assert stats["file_size_mb"] > 0
+
+    @pytest.mark.parametrize("export", [export_to_gpx, export_to_gpx_fast, export_to_gpx_single_track])
+    def test_statistics_count_only_line_points(self, export, trails_gdf, tmp_path):
+        """Test that points and polygons in a mixed layer add no track points."""
+        mixed_gdf = pd.concat(
+            [
+                trails_gdf,
+                gpd.GeoDataFrame(
+                    {"trail_name": ["Cabin", "Lake"]},
+                    geometry=[Point(10.5, 60.5), Polygon([(11.0, 61.0), (11.1, 61.0), (11.1, 61.1), (11.0, 61.0)])],
+                    crs="EPSG:4326",
+                ),
+            ],
+            ignore_index=True,
+        )
+        _, stats = export(mixed_gdf, tmp_path / "trails.gpx", simplify_tolerance=None)
+
+        assert stats["total_points"] == 9
+
+    def test_metadata_time(self, trails_gdf, tmp_path):
+        """Test that the metadata time is a UTC timestamp in GPX format."""
+        path, _ = export_to_gpx(trails_gdf, tmp_path / "trails.gpx")
+        timestamp = etree.parse(str(path)).getroot().findtext("gpx:metadata/gpx:time", namespaces=GPX_NS)
+
+        assert re.fullmatch(r"\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}Z", timestamp)
+
+    def test_track_content(self, trails_gdf, tmp_path):
+        """Test that names, descriptions, types and segments are written per trail."""
+        path, _ = export_to_gpx(trails_gdf, tmp_path / "trails.gpx", simplify_tolerance=None)
+        tracks = parse_tracks(path)
+
+        assert len(tracks) == 3
+        assert tracks[0].findtext("gpx:name", namespaces=GPX_NS) == "Ridge"
+        assert tracks[0].findtext("gpx:desc", namespaces=GPX_NS) == "difficulty: easy"
+        assert tracks[0].findtext("gpx:type", namespaces=GPX_NS) == "hiking"
+        assert tracks[1].find("gpx:name", GPX_NS) is None
+        assert tracks[1].find("gpx:desc", GPX_NS) is None
+        assert tracks[2].findtext("gpx:desc", namespaces=GPX_NS) == "difficulty: hard | marking: red"
+        assert tracks[2].find("gpx:type", GPX_NS) is None
+        assert len(tracks[2].findall("gpx:trkseg", GPX_NS)) == 2
+
+    def test_track_points(self, trails_gdf, tmp_path):
+        """Test that track points hold the trail coordinates as lat/lon."""
+        path, _ = export_to_gpx(trails_gdf, tmp_path / "trails.gpx", simplify_tolerance=None)
+        points = parse_tracks(path)[0].findall("gpx:trkseg/gpx:trkpt", GPX_NS)
+
+        assert [(float(p.get("lat")), float(p.get("lon"))) for p in points] == [(60.0, 10.0), (60.1, 10.1), (60.0, 10.2)]
+        assert (points[0].get("lat"), points[0].get("lon")) == ("60.0000000", "10.0000000")
+
+    def test_coordinate_precision(self, tmp_path):
+        """Test that coordinates are rounded to 7 decimals rather than written with full float repr."""
+        gdf = gpd.GeoDataFrame(geometry=[LineString([(10.123456789, 60.987654321), (-0.1, 1e-9)])], crs="EPSG:4326")
+        path, _ = export_to_gpx(gdf, tmp_path / "trails.gpx", simplify_tolerance=None)
+        points = parse_tracks(path)[0].findall("gpx:trkseg/gpx:trkpt", GPX_NS)
+
+        assert [(p.get("lat"), p.get("lon")) for p in points] == [("60.9876543", "10.1234568"), ("0.0000000", "-0.1000000")]
+
+    def test_missing_name_field(self, trails_gdf, tmp_path):
+        """Test that tracks are named after the row index when the name field does not exist."""
+        path, _ = export_to_gpx(trails_gdf, tmp_path / "trails.gpx", name_field="missing")
+
+        assert [t.findtext("gpx:name", namespaces=GPX_NS) for t in parse_tracks(path)] == ["Trail 0", "Trail 1", "Trail 2"]
+
+    def test_reprojects_to_wgs84(self, trails_gdf, tmp_path):
+        """Test that trails in a projected CRS are written in WGS84."""
+        path, _ = export_to_gpx(trails_gdf.to_crs("EPSG:25833"), tmp_path / "trails.gpx", simplify_tolerance=None)
+        point = parse_tracks(path)[0].find("gpx:trkseg/gpx:trkpt", GPX_NS)
+
+        assert float(point.get("lat")) == pytest.approx(60.0)
+        assert float(point.get("lon")) == pytest.approx(10.0)
+
+    def test_max_trails(self, trails_gdf, tmp_path):
+        """Test that only the first max_trails trails are exported."""
+        path, stats = export_to_gpx(trails_gdf, tmp_path / "trails.gpx", max_trails=2)
+
+        assert stats["total_trails"] == 2
+        assert len(parse_tracks(path)) == 2
+
+    def test_missing_geometry_skipped(self, trails_gdf, tmp_path):
+        """Test that rows without geometry are skipped and keep the remaining trails aligned."""
+        trails_gdf.loc[0, "geometry"] = None
+        path, stats = export_to_gpx(trails_gdf, tmp_path / "trails.gpx")
+
+        assert stats["skipped_trails"] == 2
+        assert stats["total_points"] == 6
+        assert [t.findtext("gpx:name", namespaces=GPX_NS) for t in parse_tracks(path)] == [None, "Loop"]
+
+    @pytest.mark.parametrize("export", [export_to_gpx, export_to_gpx_single_track])
+    def test_failed_trail_not_counted(self, export, trails_gdf, tmp_path):
+        """Test that a trail failing to export is skipped and its points are not counted."""
+        trails_gdf.loc[0, "trail_name"] = "Bad\x01name"
+        _, stats = export(trails_gdf, tmp_path / "trails.gpx", simplify_tolerance=None)
+
+        assert stats["skipped_trails"] == 2
+        assert stats["total_points"] == 6
+
+    def test_simplify_tolerance(self, tmp_path):
+        """Test that geometries are simplified before export while points are counted from the original."""
+        gdf = gpd.GeoDataFrame(geometry=[LineString([(10.0, 60.0), (10.05, 60.000001), (10.1, 60.0)])], crs="EPSG:4326")
+        path, stats = export_to_gpx(gdf, tmp_path / "trails.gpx", simplify_tolerance=0.0001)
+
+        assert stats["total_points"] == 3
+        assert len(parse_tracks(path)[0].findall("gpx:trkseg/gpx:trkpt", GPX_NS)) == 2
+
+    def test_pretty_print(self, trails_gdf, tmp_path):
+        """Test that output is flat by default and indented on request, with the same tracks."""
+        flat_path, _ = export_to_gpx(trails_gdf, tmp_path / "flat.gpx")
+        pretty_path, _ = export_to_gpx(trails_gdf, tmp_path / "pretty.gpx", pretty_print=True)
+
+        assert "\n  <trkseg>" not in flat_path.read_text()
+        assert "\n  <trkseg>" in pretty_path.read_text()
+        assert len(parse_tracks(flat_path)) == len(parse_tracks(pretty_path)) == 3
+
+    def test_tracks_in_order_across_chunks(self, monkeypatch, tmp_path):
+        """Test that tracks built in many chunks on worker threads are written in row order."""
+        monkeypatch.setattr(gpx, "TRACK_CHUNK_SIZE", 3)
+        gdf = gpd.GeoDataFrame(
+            {"trail_name": [f"Trail {i}" for i in range(50)]},
+            geometry=[LineString([(10.0, 60.0 + i / 100), (10.1, 60.1 + i / 100)]) for i in range(50)],
+            crs="EPSG:4326",
+        )
+        path, stats = export_to_gpx(gdf, tmp_path / "trails.gpx", max_workers=2)
+
+        assert stats["total_points"] == 100
+        assert [t.findtext("gpx:name", namespaces=GPX_NS) for t in parse_tracks(path)] == list(gdf["trail_name"])
+
+
+class TestExportToGpxFast:
+    """Tests for export_to_gpx_fast function."""
+
+    def test_matches_export_to_gpx(self, trails_gdf, tmp_path):
+        """Test that the text writer produces the same document and statistics as export_to_gpx."""
+        trails_gdf.loc[0, "trail_name"] = 'Ridge <north> & "south" – Ås'
+        path, stats = export_to_gpx(trails_gdf, tmp_path / "lxml.gpx")
+        fast_path, fast_stats = export_to_gpx_fast(trails_gdf, tmp_path / "fast.gpx")
+
+        def without_time(content):
+            return re.sub(rb"<time>.*?</time>", b"", content)
+
+        assert without_time(fast_path.read_bytes()) == without_time(path.read_bytes())
+        assert {k: v for k, v in fast_stats.items() if k != "file_size_mb"} == {k: v for k, v in stats.items() if k != "file_size_mb"}
+
+
+@pytest.mark.parametrize("export", [export_to_gpx, export_to_gpx_fast])
+def test_xml_invalid_name_skipped(export, trails_gdf, tmp_path):
+    """Test that a trail whose name XML cannot hold is skipped and counted, leaving a valid document."""
+    trails_gdf.loc[0, "trail_name"] = "Ridge\x01"
+    path, stats = export(trails_gdf, tmp_path / "trails.gpx", simplify_tolerance=None)
+
+    assert [t.findtext("gpx:name", namespaces=GPX_NS) for t in parse_tracks(path)] == [None, "Loop"]
+    assert stats["skipped_trails"] == 2
+    assert stats["total_points"] == 6
+
+
+@pytest.mark.parametrize("export", [export_to_gpx, export_to_gpx_fast])
+def test_compressed_export(export, trails_gdf, tmp_path):
+    """Test that compressed exports are written next to output_path as gzip with the same tracks."""
+    path, stats = export(trails_gdf, tmp_path / "trails.gpx", compress=True)
+
+    assert path == tmp_path / "trails.gpx.gz"
+    assert not (tmp_path / "trails.gpx").exists()
+    assert len(etree.fromstring(gzip.decompress(path.read_bytes())).findall("gpx:trk", GPX_NS)) == 3
+    assert stats["file_size_mb"] == path.stat().st_size / (1024 * 1024)
+
+
+@pytest.mark.parametrize("export", [export_to_gpx_single_track, export_to_gpx_zip, export_to_gpx_zip_smart])
+def test_fixed_coordinate_precision(export, tmp_path):
+    """Test that every exporter writes coordinates with 7 fixed decimals rather than full float repr."""
+    gdf = gpd.GeoDataFrame(
+        {"trail_name": ["Ridge"], "trail_number": ["1"]}, geometry=[LineString([(10.123456789, 60.987654321), (-0.1, 1e-9)])], crs="EPSG:4326"
+    )
+    path, _ = export(gdf, tmp_path / "trails.out", simplify_tolerance=None)
+
+    content = path.read_bytes()
+    if zipfile.is_zipfile(path):
+        with zipfile.ZipFile(path) as zipf:
+            content = zipf.read(next(name for name in zipf.namelist() if name.endswith(".gpx")))
+    points = etree.fromstring(content).findall("gpx:trk/gpx:trkseg/gpx:trkpt", GPX_NS)
+
+    assert [(p.get("lat"), p.get("lon")) for p in points] == [("60.9876543", "10.1234568"), ("0.0000000", "-0.1000000")]
+
+
+@pytest.mark.parametrize("export", [export_to_gpx_zip, export_to_gpx_zip_smart])
+def test_zip_members_compact_by_default(export, numbered_trails_gdf, tmp_path):
+    """Test that ZIP members are written without indentation unless pretty printing is requested."""
+    compact_path, _ = export(numbered_trails_gdf.iloc[1:], tmp_path / "compact.zip")
+    pretty_path, _ = export(numbered_trails_gdf.iloc[1:], tmp_path / "pretty.zip", pretty_print=True)
+
+    with zipfile.ZipFile(compact_path) as compact_zipf, zipfile.ZipFile(pretty_path) as pretty_zipf:
+        compact = compact_zipf.read("None.gpx")
+        pretty = pretty_zipf.read("None.gpx")
+
+    assert b"\n  <trkseg>" not in compact
+    assert b"\n  <trkseg>" in pretty
+    compact_track = etree.fromstring(compact).find("gpx:trk", GPX_NS)
+    pretty_track = etree.fromstring(pretty).find("gpx:trk", GPX_NS)
+    assert [p.attrib for p in compact_track.iter("{*}trkpt")] == [p.attrib for p in pretty_track.iter("{*}trkpt")]
+
+
+class TestExportToGpxSingleTrack:
+    """Tests for export_to_gpx_single_track function."""
+
+    def test_single_track_with_segments(self, trails_gdf, tmp_path):
+        """Test that all trails become segments of one track and are counted."""
+        path, stats = export_to_gpx_single_track(trails_gdf, tmp_path / "trails.gpx", track_name="Network")
+        tracks = parse_tracks(path)
+
+        assert len(tracks) == 1
+        assert tracks[0].findtext("gpx:name", namespaces=GPX_NS) == "Network"
+        assert len(tracks[0].findall("gpx:trkseg", GPX_NS)) == 4
+        assert [c.text for c in tracks[0] if isinstance(c, etree._Comment)] == [" Ridge ", " None ", " Loop (part 1) ", " Loop (part 2) "]
+        assert stats["total_segments"] == 4
+        assert stats["total_points"] == 9
+        assert stats["skipped_trails"] == 1
+
+
+class TestExportToGpxZip:
+    """Tests for export_to_gpx_zip function."""
+
+    def test_one_file_per_trail(self, trails_gdf, tmp_path):
+        """Test that each trail is written to its own GPX file and listed in the manifest."""
+        path, stats = export_to_gpx_zip(trails_gdf, tmp_path / "trails.zip")
+
+        with zipfile.ZipFile(path) as zipf:
+            assert sorted(zipf.namelist()) == ["Loop.gpx", "MANIFEST.txt", "None.gpx", "Ridge.gpx"]
+            manifest = zipf.read("MANIFEST.txt").decode()
+            loop_tracks = etree.fromstring(zipf.read("Loop.gpx")).findall("gpx:trk", GPX_NS)
+
+        assert stats["total_files"] == 3
+        assert stats["skipped_trails"] == 1
+        assert "- Loop.gpx\n  difficulty: hard\n  marking: red" in manifest
+        assert len(loop_tracks) == 1
+        assert len(loop_tracks[0].findall("gpx:trkseg", GPX_NS)) == 2
+
+    def test_group_by_folder(self, numbered_trails_gdf, tmp_path):
+        """Test that trails are placed in sanitized folders named after the group field."""
+        path, stats = export_to_gpx_zip(numbered_trails_gdf.iloc[1:], tmp_path / "trails.zip", group_by="municipality")
+
+        with zipfile.ZipFile(path) as zipf:
+            names = zipf.namelist()
+
+        assert stats["groups"] == ["Oslo/", "Bergen/"]
+        assert "Bergen/Lake_Loop.gpx" in names
+        assert "Oslo/Ridge.gpx" in names
+        assert "None.gpx" in names
+
+    def test_worker_processes(self, trails_gdf, tmp_path, monkeypatch):
+        """Test that files rendered in worker processes match the in-process result and keep their order."""
+        expected_path, expected_stats = export_to_gpx_zip(trails_gdf, tmp_path / "expected.zip")
+
+        monkeypatch.setattr(gpx, "ZIP_PROCESS_POOL_MIN_TRAILS", 0)
+        monkeypatch.setattr(gpx, "TRACK_CHUNK_SIZE", 1)
+        path, stats = export_to_gpx_zip(trails_gdf, tmp_path / "trails.zip", max_workers=2)
+
+        with zipfile.ZipFile(expected_path) as expected_zipf, zipfile.ZipFile(path) as zipf:
+            assert zipf.namelist() == expected_zipf.namelist()
+            for name in ("Loop.gpx", "Ridge.gpx"):
+                track = etree.fromstring(zipf.read(name)).find("gpx:trk", GPX_NS)
+                assert etree.tostring(track) == etree.tostring(etree.fromstring(expected_zipf.read(name)).find("gpx:trk", GPX_NS))
+        assert {k: v for k, v in stats.items() if k != "file_size_mb"} == {k: v for k, v in expected_stats.items() if k != "file_size_mb"}
+
+    def test_members_share_metadata(self, trails_gdf, tmp_path):
+        """Test that every member carries the same export metadata."""
+        path, _ = export_to_gpx_zip(trails_gdf, tmp_path / "trails.zip")
+
+        with zipfile.ZipFile(path) as zipf:
+            times = {
+                etree.fromstring(zipf.read(name)).findtext("gpx:metadata/gpx:time", namespaces=GPX_NS)
+                for name in zipf.namelist()
+                if name.endswith(".gpx")
+            }
+
+        assert len(times) == 1
+        assert None not in times
+
+
+class TestExportToGpxZipSmart:
+    """Tests for export_to_gpx_zip_smart function."""
+
+    def test_segments_grouped_by_trail_number(self, numbered_trails_gdf, tmp_path):
+        """Test that segments sharing a trail number are written as separate tracks of one file."""
+        path, stats = export_to_gpx_zip_smart(numbered_trails_gdf, tmp_path / "trails.zip", folder_by="municipality")
+
+        with zipfile.ZipFile(path) as zipf:
+            names = sorted(zipf.namelist())
+            ridge_tracks = etree.fromstring(zipf.read("Oslo/Ridge (12).gpx")).findall("gpx:trk", GPX_NS)
+            manifest = zipf.read("MANIFEST.txt").decode()
+
+        assert names == ["Bergen/Lake_Loop (7).gpx", "MANIFEST.txt", "None.gpx", "Oslo/Ridge (12).gpx"]
+        assert stats["total_files"] == 3
+        assert stats["merged_trails"] == 3
+        assert stats["groups"] == ["Oslo/", "Bergen/"]
+        assert "✓ Oslo/Ridge (12).gpx (2 segments merged)" in manifest
+        assert [t.findtext("gpx:name", namespaces=GPX_NS) for t in ridge_tracks] == ["Ridge (12) - Segment 1/2", "Ridge (12) - Segment 2/2"]
+        assert (
+            ridge_tracks[1].findtext("gpx:desc", namespaces=GPX_NS) == "Trail #12 | Segment 2 of 2 | local_id: b | difficulty: hard | Length: 11100m"
+        )
+
+    def test_length_measured_before_simplification(self, tmp_path):
+        """Test that the length in the description is that of the original segment, not the simplified one."""
+        gdf = gpd.GeoDataFrame(
+            {"trail_name": ["Bend"], "trail_number": ["1"]},
+            geometry=[LineString([(10.0, 60.0), (10.05, 60.01), (10.1, 60.0)])],
+            crs="EPSG:4326",
+        )
+        path, _ = export_to_gpx_zip_smart(gdf, tmp_path / "trails.zip", simplify_tolerance=0.05)
+
+        with zipfile.ZipFile(path) as zipf:
+            (track,) = etree.fromstring(zipf.read("Bend (1).gpx")).findall("gpx:trk", GPX_NS)
+
+        assert len(track.findall("gpx:trkseg/gpx:trkpt", GPX_NS)) == 2
+        assert track.findtext("gpx:desc", namespaces=GPX_NS).endswith("Length: 11320m")
+
+    def test_dates_in_description(self, numbered_trails_gdf, tmp_path):
+        """Test that datetime values and parseable values of date fields are written as dates, and others as is."""
+        numbered_trails_gdf["updated"] = pd.to_datetime(["2024-05-01 12:30", "2023-01-02 00:00", None, "2022-03-04 00:00"])
+        numbered_trails_gdf["survey_date"] = ["2021-06-07T08:00:00", "unknown", None, None]
+        path, _ = export_to_gpx_zip_smart(numbered_trails_gdf, tmp_path / "trails.zip", desc_fields=["updated", "survey_date"])
+
+        with zipfile.ZipFile(path) as zipf:
+            descs = [t.findtext("gpx:desc", namespaces=GPX_NS) for t in etree.fromstring(zipf.read("Ridge (12).gpx")).findall("gpx:trk", GPX_NS)]
+
+        assert descs == [
+            "Trail #12 | Segment 1 of 2 | local_id: a | updated: 2024-05-01 | survey_date: 2021-06-07 | Length: 11100m",
+            "Trail #12 | Segment 2 of 2 | local_id: b | updated: 2023-01-02 | survey_date: unknown | Length: 11100m",
+        ]
+
+
+class TestFindConnectedSegments:
+    """Tests for find_connected_segments function."""
+
+    def test_components(self):
+        """Test that segments with endpoints within tolerance are grouped, including through chains and multi-part ends."""
+        segments = gpd.GeoDataFrame(
+            geometry=[
+                LineString([(0, 0), (100, 0)]),
+                LineString([(130, 0), (300, 0)]),
+                LineString([(1000, 0), (1100, 0)]),
+                MultiLineString([[(300, 40), (300, 500)], [(600, 600), (700, 700)]]),
+                None,
+            ],
+            crs="EPSG:25833",
+        )
+
+        components = find_connected_segments(segments, tolerance_m=50)
+
+        assert components == [[0, 1, 3], [2], [4]]
+
+    def test_non_line_geometries(self):
+        """Test that points and polygons, even at a line end, form groups of their own."""
+        segments = gpd.GeoDataFrame(
+            geometry=[
+                LineString([(0, 0), (100, 0)]),
+                Point(100, 0),
+                LineString([(120, 0), (300, 0)]),
+                Polygon([(300, 0), (400, 0), (400, 100), (300, 0)]),
+            ],
+            crs="EPSG:25833",
+        )
+
+        assert find_connected_segments(segments, tolerance_m=50) == [[0, 2], [1], [3]]
+
+    def test_long_chain(self):
+        """Test that a chain of segments longer than the recursion limit forms one component in order."""
+        segments = gpd.GeoDataFrame(geometry=[LineString([(k * 100, 0), (k * 100 + 90, 0)]) for k in range(3000)], crs="EPSG:25833")
+
+        assert find_connected_segments(segments, tolerance_m=50) == [list(range(3000))]
+
+    def test_tolerance_in_meters_for_wgs84(self):
+        """Test that WGS84 segments are compared in meters."""
+        # 0.0005 degrees of longitude is about 28 m at 60 degrees north
+        segments = gpd.GeoDataFrame(
+            geometry=[LineString([(10.0, 60.0), (10.01, 60.0)]), LineString([(10.0105, 60.0), (10.02, 60.0)])], crs="EPSG:4326"
+        )
+
+        assert find_connected_segments(segments, tolerance_m=50) == [[0, 1]]
+        assert find_connected_segments(segments, tolerance_m=10) == [[0], [1]]
+
+    def test_trivial_inputs(self):
+        """Test that no segments give no components and a single segment gives one."""
+        line = LineString([(0, 0), (1, 0)])
+
+        assert find_connected_segments(gpd.GeoDataFrame(geometry=[], crs="EPSG:25833")) == []
+        assert find_connected_segments(gpd.GeoDataFrame(geometry=[line], crs="EPSG:25833")) == [[0]]
+
+
+class TestFilterTrailsByBbox:
+    """Tests for filter_trails_by_bbox function."""
+
+    def test_filter_intersecting(self, trails_gdf):
+        """Test that only trails intersecting the bounding box are kept."""
+        result = filter_trails_by_bbox(trails_gdf, (9.9, 59.9, 10.15, 60.05))
+
+        assert list(result["trail_name"]) == ["Ridge"]
+
+    def test_keeps_row_order(self, trails_gdf):
+        """Test that matching trails keep their original order and index."""
+        result = filter_trails_by_bbox(trails_gdf, (9.0, 59.0, 13.0, 63.0))
+
+        assert list(result.index) == [0, 1, 2]
+
+    def test_buffer_in_meters(self, trails_gdf):
+        """Test that the bounding box is buffered in meters for geographic CRSs."""
+        bbox = (10.3, 59.9, 10.4, 60.1)  # About 5.5 km east of the end of "Ridge"
+
+        assert filter_trails_by_bbox(trails_gdf, bbox, buffer_m=1000).empty
+        assert list(filter_trails_by_bbox(trails_gdf, bbox, buffer_m=10000)["trail_name"]) == ["Ridge"]
+
+    def test_spatial_index_reused(self, trails_gdf):
+        """Test that the spatial index is built on first use and kept on the GeoDataFrame for later calls."""
+        filter_trails_by_bbox(trails_gdf, (9.9, 59.9, 10.15, 60.05))
+        sindex = trails_gdf.sindex
+        result = filter_trails_by_bbox(trails_gdf, (10.9, 60.9, 11.6, 61.6))
+
+        assert trails_gdf.sindex is sindex
+        assert list(result["trail_name"]) == [None]
+
+    def test_zero_buffer_skips_reprojection(self, trails_gdf, monkeypatch):
+        """Test that the bounding box is only reprojected when it has to be buffered."""
+
+        def fail(*args):
+            raise AssertionError("bounding box was reprojected")
+
+        monkeypatch.setattr(gpx, "_transformer", fail)
+
+        assert list(filter_trails_by_bbox(trails_gdf, (9.9, 59.9, 10.15, 60.05))["trail_name"]) == ["Ridge"]
+
+    def test_prebuilt_sindex(self, trails_gdf):
+        """Test that a spatial index built for another frame with the same rows can be reused."""
+        bbox = (9.9, 59.9, 10.15, 60.05)
+        result = filter_trails_by_bbox(trails_gdf.copy(), bbox, sindex=trails_gdf.sindex)
+
+        assert list(result["trail_name"]) == ["Ridge"]
@@ -1,15 +1,28 @@
 """Tests for Geonorge/Kartverket trail data loader."""
 
+import logging
+import pickle
+import shutil
 from dataclasses import FrozenInstanceError
 from pathlib import Path
 from unittest.mock import Mock, patch
 
 import geopandas as gpd
+import numpy as np
 import pandas as pd
 import pytest
+import shapely
 
 from trails.io import cache
-from trails.io.sources.geonorge import TURRUTEBASEN_METADATA, Metadata, Source, TrailData
+from trails.io.sources.geonorge import (
+    ATOM_FEED_TIMEOUT_SECONDS,
+    DOWNLOAD_INFO_TTL_SECONDS,
+    TURRUTEBASEN_METADATA,
+    Metadata,
+    Source,
+    TrailData,
+    _extract_members_parallel,
+)
 from trails.io.sources.language import Language
 
 # Test data constants for error cases
@@ -60,6 +73,11 @@ def create_test_geodataframe(num_features=10, crs="EPSG:25833"):
     )
 
 
+def mock_feed_response(status_code=200, headers=None, content=b"<feed/>"):
+    """Create a mock HTTP response for the ATOM feed request; parsing is mocked separately unless content is a real feed."""
+    return Mock(status_code=status_code, headers=headers or {}, content=content)
+
+
 def create_test_dataframe(num_rows=10):
     """Create a simple test DataFrame (non-spatial)."""
     # Use real columns from our schema to avoid warnings
@@ -104,7 +122,7 @@ class TestTrailData:
             "layer2": create_test_geodataframe(3, "EPSG:4326"),  # Different CRS!
         }
 
-        with pytest.raises(ValueError, match="Inconsistent CRS"):
+        with pytest.raises(ValueError, match="Inconsistent CRS.*'layer1' is EPSG:25833 but 'layer2' is EPSG:4326"):
             TrailData(
                 metadata=TURRUTEBASEN_METADATA,
                 spatial_layers=spatial_layers,
@@ -207,6 +225,7 @@ class TestTrailData:
         )
 
         assert trail_data.total_features == 50  # 10 + 5 + 20 + 15
+        assert vars(trail_data)["total_features"] == 50  # Counted once and cached
 
     def test_layer_names_complete_list(self):
         """All layer names combined correctly."""
@@ -328,6 +347,74 @@ class TestTrailData:
             # CRS string should contain coordinate system info
             assert "proj" in trail_data.crs.lower() or "epsg" in trail_data.crs.lower()
 
+    def test_parquet_dir_round_trip(self, tmp_path):
+        """Test that data written with to_parquet_dir is restored unchanged."""
+        spatial = create_test_geodataframe(3)
+        spatial["gradering"] = spatial["gradering"].astype("string")
+        table = create_test_dataframe(2)
+        trail_data = TrailData(
+            metadata=TURRUTEBASEN_METADATA,
+            spatial_layers={"b_layer": spatial, "a_layer": create_test_geodataframe(1)},
+            attribute_tables={"table": table},
+            source_url="http://test.com/data.zip",
+            version="2025-01-01",
+            language=Language.EN,
+        )
+
+        path = tmp_path / "bundle"
+        trail_data.to_parquet_dir(path)
+        trail_data.to_parquet_dir(path)  # Replaces an existing directory
+        loaded = TrailData.from_parquet_dir(path)
+
+        assert loaded.metadata == trail_data.metadata
+        assert loaded.layer_names == ["b_layer", "a_layer", "table"]
+        assert (loaded.source_url, loaded.version, loaded.language, loaded.crs) == (
+            "http://test.com/data.zip",
+            "2025-01-01",
+            Language.EN,
+            "EPSG:25833",
+        )
+        pd.testing.assert_frame_equal(loaded.spatial_layers["b_layer"], spatial)
+        pd.testing.assert_frame_equal(loaded.attribute_tables["table"], table)
+
+    def test_parquet_dir_layers_read_on_access(self, tmp_path):
+        """Layers restored from a Parquet directory are read on access, even after the directory is rewritten."""
+
+        def trail_data(version, num_rows):
+            return TrailData(
+                metadata=TURRUTEBASEN_METADATA,
+                spatial_layers={"trails": create_test_geodataframe(num_rows), "points": create_test_geodataframe(2)},
+                attribute_tables={"table": create_test_dataframe(4)},
+                source_url="http://test.com/data.zip",
+                version=version,
+                language=Language.NO,
+            )
+
+        trail_data("old", 3).to_parquet_dir(tmp_path / "bundle")
+        loaded = TrailData.from_parquet_dir(tmp_path / "bundle")
+
+        # CRS validation and counting use the Parquet footers only
+        assert loaded.crs == "EPSG:25833"
+        assert loaded.total_features == 9
+        assert not any(loaded.spatial_layers.is_loaded(name) for name in loaded.spatial_layers)
+
+        trail_data("new", 5).to_parquet_dir(tmp_path / "bundle")
+
+        assert loaded.version == "old"
+        assert len(loaded.spatial_layers["trails"]) == 3
+        assert loaded.spatial_layers.is_loaded("trails")
+        assert not loaded.spatial_layers.is_loaded("points")
+        assert list(loaded.spatial_layers) == ["trails", "points"]
+        assert sorted(p.name for p in tmp_path.iterdir()) == ["bundle"]
+
+        # Unread layers are still read from the replaced files
+        shutil.rmtree(tmp_path / "bundle")
+        assert len(loaded.attribute_tables["table"]) == 4
+
+        # Pickling reads the remaining layers
+        unpickled = pickle.loads(pickle.dumps(loaded))
+        pd.testing.assert_frame_equal(unpickled.spatial_layers["points"], loaded.spatial_layers["points"])
+
     def test_get_full_metadata_dynamic_values(self):
         """Correct counts, lists, and calculated values."""
         spatial_layers = {
@@ -397,8 +484,9 @@ class TestSource:
         assert source.cache.cache_dir == custom_dir / "objects"
         assert source.download_cache.cache_dir == custom_dir / "downloads"
 
+    @patch("trails.io.sources.geonorge.requests.get", return_value=mock_feed_response())
     @patch("trails.io.sources.geonorge.feedparser.parse")
-    def test_get_download_info_valid_feed(self, mock_parse):
+    def test_get_download_info_valid_feed(self, mock_parse, mock_get, tmp_path):
         """Extract correct nationwide FGDB URL."""
         # Mock feedparser response
         mock_parse.return_value = Mock(
@@ -422,36 +510,39 @@ class TestSource:
             ],
         )
 
-        source = Source()
+        source = Source(cache_dir=str(tmp_path))
         result = source._get_download_info()
 
         assert result.url == "https://example.com/Friluftsliv_0000_Norge_25833_TurOgFriluftsruter_FGDB.zip"
         assert result.title == "FGDB-format, Landsdekkende"
         assert result.updated == "2025-09-18T05:31:27"
 
+    @patch("trails.io.sources.geonorge.requests.get", return_value=mock_feed_response())
     @patch("trails.io.sources.geonorge.feedparser.parse")
-    def test_get_download_info_no_entries(self, mock_parse):
+    def test_get_download_info_no_entries(self, mock_parse, mock_get, tmp_path):
         """Handle empty feed gracefully."""
         mock_parse.return_value = Mock(bozo=False, entries=[])
 
-        source = Source()
+        source = Source(cache_dir=str(tmp_path))
         with pytest.raises(ValueError, match="No entries found"):
             source._get_download_info()
 
+    @patch("trails.io.sources.geonorge.requests.get", return_value=mock_feed_response())
     @patch("trails.io.sources.geonorge.feedparser.parse")
-    def test_get_download_info_no_nationwide_entry(self, mock_parse):
+    def test_get_download_info_no_nationwide_entry(self, mock_parse, mock_get, tmp_path):
         """Error when no Landsdekkende/0000 entry."""
         mock_parse.return_value = Mock(
             bozo=False,
             entries=[{"title": "FGDB-format, Oslo", "links": [{"href": "https://example.com/oslo.zip"}]}],
         )
 
-        source = Source()
+        source = Source(cache_dir=str(tmp_path))
         with pytest.raises(ValueError, match="Could not find nationwide"):
             source._get_download_info()
 
+    @patch("trails.io.sources.geonorge.requests.get", return_value=mock_feed_response())
     @patch("trails.io.sources.geonorge.feedparser.parse")
-    def test_get_download_info_multiple_nationwide_entries(self, mock_parse):
+    def test_get_download_info_multiple_nationwide_entries(self, mock_parse, mock_get, tmp_path):
         """Choose most recent by updated date."""
         mock_parse.return_value = Mock(
             bozo=False,
@@ -469,12 +560,110 @@ class TestSource:
             ],
         )
 
-        source = Source()
+        source = Source(cache_dir=str(tmp_path))
         result = source._get_download_info()
 
         assert result.url == "https://example.com/new_FGDB.zip"
         assert result.updated == "2025-09-18T05:31:27"
 
+    @patch("trails.io.sources.geonorge.requests.get")
+    @patch("trails.io.sources.geonorge.feedparser.parse")
+    def test_get_download_info_not_modified(self, mock_parse, mock_get, tmp_path):
+        """Reuse the last parsed entry when the server reports the feed unchanged."""
+        mock_parse.return_value = Mock(
+            bozo=False,
+            entries=[
+                {
+                    "title": "FGDB-format, Landsdekkende",
+                    "updated": "2025-09-18T05:31:27",
+                    "links": [{"href": "https://example.com/Norge_FGDB.zip", "rel": "alternate"}],
+                }
+            ],
+        )
+        mock_get.return_value = mock_feed_response(headers={"ETag": '"v1"', "Last-Modified": "Thu, 18 Sep 2025 05:31:27 GMT"})
+        source = Source(cache_dir=str(tmp_path))
+        first = source._get_download_info()
+
+        # A new Source (e.g. in another process) sends the conditional request
+        mock_get.return_value = mock_feed_response(status_code=304)
+        second = Source(cache_dir=str(tmp_path))._get_download_info()
+
+        assert second == first
+        assert mock_get.call_args.kwargs["headers"] == {"If-None-Match": '"v1"', "If-Modified-Since": "Thu, 18 Sep 2025 05:31:27 GMT"}
+        assert mock_get.call_args.kwargs["timeout"] == ATOM_FEED_TIMEOUT_SECONDS
+        mock_parse.assert_called_once()
+
+    @patch("trails.io.sources.geonorge.time.monotonic")
+    @patch("trails.io.sources.geonorge.requests.get", return_value=mock_feed_response())
+    @patch("trails.io.sources.geonorge.feedparser.parse")
+    def test_get_download_info_reused_within_ttl(self, mock_parse, mock_get, mock_monotonic, tmp_path):
+        """The feed is checked again only after the download info has expired."""
+        mock_parse.return_value = Mock(
+            bozo=False,
+            entries=[
+                {
+                    "title": "FGDB-format, Landsdekkende",
+                    "updated": "2025-09-18T05:31:27",
+                    "links": [{"href": "https://example.com/Norge_FGDB.zip", "rel": "alternate"}],
+                }
+            ],
+        )
+        source = Source(cache_dir=str(tmp_path))
+
+        mock_monotonic.return_value = 1000.0
+        first = source._get_download_info()
+        mock_monotonic.return_value = 1000.0 + DOWNLOAD_INFO_TTL_SECONDS - 1
+        assert source._get_download_info() == first
+        assert mock_get.call_count == 1
+
+        mock_monotonic.return_value = 1000.0 + DOWNLOAD_INFO_TTL_SECONDS
+        assert source._get_download_info() == first
+        assert mock_get.call_count == 2
+
+    @patch("trails.io.sources.geonorge.requests.get")
+    def test_get_download_info_scans_feed_with_lxml(self, mock_get, tmp_path):
+        """Find the newest nationwide entry without feedparser, with the same result feedparser gives."""
+        content = b"""<?xml version="1.0" encoding="UTF-8"?>
+<feed xmlns="http://www.w3.org/2005/Atom">
+    <entry>
+        <title>FGDB-format, Oslo</title>
+        <link href="https://example.com/Friluftsliv_0301_Oslo_FGDB.zip"/>
+        <updated>2025-09-19T05:31:27</updated>
+    </entry>
+    <entry>
+        <title>FGDB-format, Landsdekkende</title>
+        <link rel="describedby" href="https://example.com/metadata.xml"/>
+        <link rel="alternate" href="https://example.com/old_FGDB.zip"/>
+        <updated>2025-09-17T05:31:27</updated>
+    </entry>
+    <entry>
+        <title>FGDB-format, Landsdekkende</title>
+        <link rel="alternate" href="https://example.com/new_FGDB.zip"/>
+        <updated>2025-09-18T05:31:27</updated>
+    </entry>
+</feed>"""
+        mock_get.return_value = Mock(status_code=200, headers={}, content=content)
+        source = Source(cache_dir=str(tmp_path))
+
+        with patch("trails.io.sources.geonorge.feedparser.parse") as mock_parse:
+            result = source._get_download_info()
+            mock_parse.assert_not_called()
+
+        assert result == ("https://example.com/new_FGDB.zip", "FGDB-format, Landsdekkende", "2025-09-18T05:31:27")
+
+        # feedparser, used as fallback, finds the same entry
+        with patch("trails.io.sources.geonorge._scan_nationwide_entries", return_value=[]):
+            assert source._get_download_info() == result
+
+    @patch("trails.io.sources.geonorge.requests.get")
+    def test_get_download_info_malformed_feed(self, mock_get, tmp_path):
+        """Malformed feeds fall back to feedparser, which reports the parse problem."""
+        mock_get.return_value = Mock(status_code=200, headers={}, content=ATOM_FEED_MALFORMED.encode())
+
+        source = Source(cache_dir=str(tmp_path))
+        with pytest.raises(ValueError, match="No entries found in ATOM feed"):
+            source._get_download_info()
+
     def test_find_gdb_in_simple_zip(self, tmp_path):
         """Find .gdb folder in root."""
         import zipfile
@@ -505,6 +694,24 @@ class TestSource:
 
         assert result == "data/TestData.gdb"
 
+    def test_find_gdb_cached_until_zip_changes(self, tmp_path):
+        """The GDB path is looked up again only when the ZIP changes."""
+        import zipfile
+
+        zip_path = tmp_path / "test.zip"
+        with zipfile.ZipFile(zip_path, "w") as zf:
+            zf.writestr("Old.gdb/file1.txt", "content")
+
+        source = Source()
+        assert source._find_gdb_in_zip(zip_path) == "Old.gdb"
+        with patch("trails.io.sources.geonorge.zipfile.ZipFile") as mock_zipfile:
+            assert source._find_gdb_in_zip(zip_path) == "Old.gdb"
+            mock_zipfile.assert_not_called()
+
+        with zipfile.ZipFile(zip_path, "w") as zf:
+            zf.writestr("NewData.gdb/file1.txt", "content")
+        assert source._find_gdb_in_zip(zip_path) == "NewData.gdb"
+
     def test_no_gdb_raises_error(self, tmp_path):
         """FileNotFoundError when .gdb missing."""
         import zipfile
@@ -518,20 +725,15 @@ class TestSource:
         with pytest.raises(FileNotFoundError, match="No .gdb folder"):
             source._find_gdb_in_zip(zip_path)
 
-    @patch("trails.io.sources.geonorge.gpd.list_layers")
-    @patch("trails.io.sources.geonorge.gpd.read_file")
+    @patch("trails.io.sources.geonorge.pyogrio.list_layers")
+    @patch("trails.io.sources.geonorge.pyogrio.read_dataframe")
     def test_load_fgdb_spatial_vs_attribute_separation(self, mock_read, mock_list, tmp_path):
         """Correctly separate spatial and attribute layers."""
         # Mock layer listing
-        mock_list.return_value = pd.DataFrame(
-            {
-                "name": ["fotrute_senterlinje", "fotruteinfo_tabell"],
-                "geometry_type": ["Line String", "None"],
-            }
-        )
+        mock_list.return_value = np.array([["fotrute_senterlinje", "MultiLineString"], ["fotruteinfo_tabell", None]], dtype=object)
 
         # Mock reading layers
-        def read_side_effect(path, layer=None):
+        def read_side_effect(path, layer=None, columns=None, bbox=None, mask=None, use_arrow=False):
             if layer == "fotrute_senterlinje":
                 return create_test_geodataframe(5)
             else:
@@ -554,42 +756,212 @@ class TestSource:
         assert isinstance(spatial_layers["fotrute_senterlinje"], gpd.GeoDataFrame)
         assert isinstance(attribute_tables["fotruteinfo_tabell"], pd.DataFrame)
 
-    @patch("trails.io.sources.geonorge.gpd.list_layers")
-    @patch("trails.io.sources.geonorge.gpd.read_file")
-    def test_load_fgdb_crs_conversion(self, mock_read, mock_list, tmp_path):
-        """Apply target_crs to all spatial layers."""
-        mock_list.return_value = pd.DataFrame({"name": ["layer1", "layer2"], "geometry_type": ["Line String", "Point"]})
+    @patch("trails.io.sources.geonorge.pyogrio.list_layers")
+    @patch("trails.io.sources.geonorge.pyogrio.read_info")
+    @patch("trails.io.sources.geonorge.pyogrio.read_dataframe")
+    def test_load_fgdb_crs_conversion(self, mock_read, mock_info, mock_list, tmp_path):
+        """Apply target_crs to spatial layers while GDAL reads them."""
+        mock_list.return_value = np.array([["layer1", "MultiLineString"], ["layer2", "Point"], ["table", None]], dtype=object)
+        mock_info.side_effect = lambda path, layer=None: {"crs": "EPSG:4326" if layer == "layer2" else "EPSG:25833"}
+
+        def read_side_effect(path, layer=None, columns=None, bbox=None, mask=None, use_arrow=False):
+            if "<TargetSRS>EPSG:4326</TargetSRS>" in path:
+                return create_test_geodataframe(5, "EPSG:4326")
+            if layer == "table":
+                return pd.DataFrame({"ruteinfoid": ["info_1"]})
+            return create_test_geodataframe(3, "EPSG:4326")
 
-        # Mock GeoDataFrames with CRS conversion
-        mock_gdf1 = create_test_geodataframe(5, "EPSG:25833")
-        mock_gdf1_converted = create_test_geodataframe(5, "EPSG:4326")
-        mock_gdf1.to_crs = Mock(return_value=mock_gdf1_converted)
+        mock_read.side_effect = read_side_effect
 
-        mock_gdf2 = create_test_geodataframe(3, "EPSG:25833")
-        mock_gdf2_converted = create_test_geodataframe(3, "EPSG:4326")
-        mock_gdf2.to_crs = Mock(return_value=mock_gdf2_converted)
+        # Create dummy zip
+        import zipfile
 
-        def read_side_effect(path, layer=None):
-            if layer == "layer1":
-                return mock_gdf1
-            else:
-                return mock_gdf2
+        zip_path = tmp_path / "test.zip"
+        with zipfile.ZipFile(zip_path, "w") as zf:
+            zf.writestr("Test.gdb/dummy", "content")
+
+        source = Source()
+        spatial_layers, attribute_tables = source._load_fgdb_from_zip(zip_path, target_crs="EPSG:4326")
+
+        # Only the layer in another CRS is read through a warped VRT
+        assert len(spatial_layers["layer1"]) == 5
+        assert len(spatial_layers["layer2"]) == 3
+        assert "table" in attribute_tables
+        paths = sorted(call.args[0] for call in mock_read.call_args_list)
+        assert ["<OGRVRTDataSource>" in path for path in paths] == [False, False, True]
+        assert "<SrcLayer>layer1</SrcLayer>" in paths[2]
+        assert mock_info.call_count == 2
+
+    @patch("trails.io.sources.geonorge.pyogrio.list_layers")
+    @patch("trails.io.sources.geonorge.pyogrio.read_dataframe")
+    def test_load_fgdb_skips_failing_layer(self, mock_read, mock_list, tmp_path):
+        """A layer that fails to load is skipped; the others keep their order."""
+        mock_list.return_value = np.array([["layer1", "Point"], ["broken", "Point"], ["layer3", "Point"]], dtype=object)
+
+        def read_side_effect(path, layer=None, columns=None, bbox=None, mask=None, use_arrow=False):
+            if layer == "broken":
+                raise RuntimeError("corrupt layer")
+            return create_test_geodataframe(2)
 
         mock_read.side_effect = read_side_effect
 
-        # Create dummy zip
         import zipfile
 
         zip_path = tmp_path / "test.zip"
         with zipfile.ZipFile(zip_path, "w") as zf:
             zf.writestr("Test.gdb/dummy", "content")
 
+        spatial_layers, _ = Source()._load_fgdb_from_zip(zip_path)
+
+        assert list(spatial_layers) == ["layer1", "layer3"]
+
+    def test_process_layers_keeps_layer_order(self):
+        """Layers processed in parallel keep their order and get translated names."""
+        layers = {
+            "ruteinfopunkt_posisjon": create_test_geodataframe(1),
+            "fotrute_senterlinje": create_test_geodataframe(3),
+            "unknown_layer": create_test_geodataframe(2),
+        }
+
+        processed = Source()._process_layers(layers, Language.EN)
+
+        assert list(processed) == ["trail_info_point_position", "hiking_trail_centerline", "unknown_layer"]
+        assert [len(gdf) for gdf in processed.values()] == [1, 3, 2]
+        assert processed["hiking_trail_centerline"]["difficulty"].tolist() == ["Easy (Green)", "Medium (Blue)", "Strenuous (Red)"]
+
+    def test_process_dataframe_code_columns_are_strings(self):
+        """Code columns are expanded to string columns whatever they hold; unknown codes and NA are kept."""
+        gdf = create_test_geodataframe(4)
+        gdf.loc[1, "gradering"] = None
+        # An unknown code that happens to equal an expanded value
+        gdf.loc[2, "gradering"] = "Enkel (Grønn)"
+        gdf["merking"] = None
+
+        processed = Source()._process_dataframe(gdf, Language.NO)
+
+        assert processed["gradering"].dtype == "string"
+        assert processed["gradering"].tolist()[::2] == ["Enkel (Grønn)", "Enkel (Grønn)"]
+        assert processed["gradering"].isna().tolist() == [False, True, False, False]
+        assert processed["merking"].dtype == "string"
+
+    @pytest.mark.parametrize("language", list(Language))
+    def test_process_dataframe_leaves_input_unchanged(self, language):
+        """Processing returns a new frame and does not modify the layer it was given."""
+        gdf = create_test_geodataframe(4)
+        original = gdf.copy()
+
+        processed = Source()._process_dataframe(gdf, language)
+
+        pd.testing.assert_frame_equal(gdf, original)
+        assert processed["gradering" if language == Language.NO else "difficulty"].iloc[0] != "G"
+        assert processed.geometry.name == "geometry"
+
+    @pytest.mark.parametrize("target_crs", [None, "EPSG:4326"])
+    def test_load_fgdb_selected_columns(self, geonorge_zip_fixture, target_crs):
+        """Only the requested columns are read, with or without reprojection."""
+        columns = {"fotrute_senterlinje": ["datafangstdato", "lokalid"], "ruteinfopunkt_posisjon": ["unknown"], "fotruteinfo_tabell": ["rutenavn"]}
+        source = Source()
+        all_layers, all_tables = source._load_fgdb_from_zip(geonorge_zip_fixture, target_crs=target_crs)
+        spatial_layers, attribute_tables = source._load_fgdb_from_zip(geonorge_zip_fixture, target_crs=target_crs, columns=columns)
+
+        # Columns keep the layer's field order; unknown names are ignored
+        trails = spatial_layers["fotrute_senterlinje"]
+        assert list(trails.columns) == ["lokalid", "datafangstdato", "geometry"]
+        pd.testing.assert_frame_equal(trails, all_layers["fotrute_senterlinje"][["lokalid", "datafangstdato", "geometry"]])
+        assert list(spatial_layers["ruteinfopunkt_posisjon"].columns) == ["geometry"]
+        assert list(attribute_tables["fotruteinfo_tabell"].columns) == ["rutenavn"]
+        pd.testing.assert_frame_equal(attribute_tables["annenruteinfo_tabell"], all_tables["annenruteinfo_tabell"])
+
+    @pytest.mark.parametrize("target_crs", [None, "EPSG:4326"])
+    def test_load_fgdb_spatial_filter(self, geonorge_zip_fixture, target_crs):
+        """Spatial layers are filtered by bbox or mask in the CRS of the returned data."""
+        source = Source()
+        all_layers, all_tables = source._load_fgdb_from_zip(geonorge_zip_fixture, target_crs=target_crs)
+        points = all_layers["ruteinfopunkt_posisjon"]
+        xmin, ymin, xmax, ymax = points.total_bounds
+        bbox = (xmin, ymin, (xmin + xmax) / 2, (ymin + ymax) / 2)
+
+        for spatial_filter in [{"bbox": bbox}, {"mask": shapely.box(*bbox)}]:
+            spatial_layers, attribute_tables = source._load_fgdb_from_zip(geonorge_zip_fixture, target_crs=target_crs, **spatial_filter)
+
+            expected = points[points.intersects(shapely.box(*bbox))]
+            assert 0 < len(expected) < len(points)
+            pd.testing.assert_frame_equal(spatial_layers["ruteinfopunkt_posisjon"].reset_index(drop=True), expected.reset_index(drop=True))
+            # Attribute tables are not filtered
+            for name, table in all_tables.items():
+                pd.testing.assert_frame_equal(attribute_tables[name], table)
+
+    def test_load_turrutebasen_rejects_bbox_and_mask(self, tmp_path):
+        """bbox and mask cannot be combined."""
+        with pytest.raises(ValueError, match="Only one of bbox and mask"):
+            Source(cache_dir=str(tmp_path)).load_turrutebasen(bbox=(0, 0, 1, 1), mask=shapely.box(0, 0, 1, 1))
+
+    def test_extract_gdb_reused_until_zip_changes(self, geonorge_zip_fixture, tmp_path):
+        """The GDB folder is extracted once per ZIP version."""
+        import os
+        import shutil
+
+        zip_path = tmp_path / "turrutebasen.zip"
+        shutil.copy(geonorge_zip_fixture, zip_path)
         source = Source()
-        spatial_layers, _ = source._load_fgdb_from_zip(zip_path, target_crs="EPSG:4326")
+        gdb_in_zip = source._find_gdb_in_zip(zip_path)
+
+        gdb_path = source._extract_gdb(zip_path, gdb_in_zip)
+        assert gdb_path.is_dir()
+        assert source._extract_gdb(zip_path, gdb_in_zip) == gdb_path
+
+        # A changed ZIP is extracted again and the previous extraction removed
+        stat = zip_path.stat()
+        os.utime(zip_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        new_gdb_path = source._extract_gdb(zip_path, gdb_in_zip)
+        assert new_gdb_path != gdb_path
+        assert new_gdb_path.is_dir()
+        assert not gdb_path.exists()
+
+    @pytest.mark.parametrize("max_workers", [1, 3])
+    def test_extract_members_parallel(self, tmp_path, max_workers):
+        """Members are extracted with their paths and contents, with one or several threads."""
+        import zipfile
+
+        contents = {f"Test.gdb/a{i:08x}.gdbtable": bytes([i]) * (i * 1000) for i in range(10)}
+        contents["Test.gdb/sub/nested.txt"] = b"nested"
+        zip_path = tmp_path / "test.zip"
+        with zipfile.ZipFile(zip_path, "w", compression=zipfile.ZIP_DEFLATED) as zf:
+            zf.writestr("Test.gdb/", "")
+            for name, data in contents.items():
+                zf.writestr(name, data)
+            members = zf.infolist()
+
+        _extract_members_parallel(zip_path, members, tmp_path / "out", max_workers=max_workers)
 
-        # Verify CRS conversion was called
-        mock_gdf1.to_crs.assert_called_once_with("EPSG:4326")
-        mock_gdf2.to_crs.assert_called_once_with("EPSG:4326")
+        for name, data in contents.items():
+            assert (tmp_path / "out" / name).read_bytes() == data
+
+    def test_extract_members_parallel_rejects_unsafe_paths(self, tmp_path):
+        """Members are never written outside the target directory."""
+        import zipfile
+
+        zip_path = tmp_path / "test.zip"
+        with zipfile.ZipFile(zip_path, "w") as zf:
+            zf.writestr("Test.gdb/../../evil.txt", "evil")
+            members = zf.infolist()
+
+        with pytest.raises(ValueError, match="outside"):
+            _extract_members_parallel(zip_path, members, tmp_path / "out")
+        assert not (tmp_path.parent / "evil.txt").exists()
+
+    def test_load_fgdb_crs_conversion_with_real_fixture(self, geonorge_zip_fixture):
+        """Reprojecting while reading matches reprojecting after reading."""
+        source = Source()
+        native_layers, _ = source._load_fgdb_from_zip(geonorge_zip_fixture)
+        spatial_layers, attribute_tables = source._load_fgdb_from_zip(geonorge_zip_fixture, target_crs="EPSG:4326")
+
+        assert attribute_tables
+        for name, gdf in spatial_layers.items():
+            expected = native_layers[name].to_crs("EPSG:4326")
+            assert gdf.crs == expected.crs
+            assert gdf.geometry.geom_equals_exact(expected.geometry, tolerance=1e-9).all()
+            pd.testing.assert_frame_equal(pd.DataFrame(gdf.drop(columns="geometry")), pd.DataFrame(expected.drop(columns="geometry")))
 
     @patch("trails.io.cache.requests")
     @patch("trails.io.sources.geonorge.feedparser.parse")
@@ -607,7 +979,7 @@ class TestSource:
             version="cached-version",
             language=Language.NO,
         )
-        source.cache.save("geonorge_turrutebasen", cached_data)
+        cached_data.to_parquet_dir(source.cache.get_dir_path("geonorge_turrutebasen"))
 
         # Make download fail
         mock_requests.get.side_effect = Exception("Network error")
@@ -640,7 +1012,7 @@ class TestSource:
 
                     # Verify the cache key includes CRS
                     expected_key = "geonorge_turrutebasen_epsg_4326"
-                    assert source.cache.exists(expected_key)
+                    assert (source.cache.get_dir_path(expected_key) / "metadata.json").exists()
 
                     # Verify target_crs was passed to load function
                     mock_load.assert_called_once()
@@ -660,7 +1032,7 @@ class TestSource:
             version="cached-version",
             language=Language.NO,
         )
-        source.cache.save("geonorge_turrutebasen", cached_data)
+        cached_data.to_parquet_dir(source.cache.get_dir_path("geonorge_turrutebasen"))
 
         with patch.object(source, "_get_download_info") as mock_info:
             mock_info.return_value = Mock(url="http://test.com/data.zip", title="Test Data", updated="2025-01-01")
@@ -695,7 +1067,7 @@ class TestSource:
             version="old-version",
             language=Language.NO,
         )
-        source.cache.save("geonorge_turrutebasen", old_cached)
+        old_cached.to_parquet_dir(source.cache.get_dir_path("geonorge_turrutebasen"))
 
         with patch.object(source, "_get_download_info") as mock_info:
             mock_info.return_value = Mock(url="http://test.com/data.zip", title="Test Data", updated="2025-01-01")
@@ -777,8 +1149,9 @@ class TestSource:
                     assert "layer_v1" not in result2.spatial_layers
                     assert result2.version == "2025-02-01"
 
+    @patch("trails.io.sources.geonorge.requests.get", return_value=mock_feed_response())
     @patch("trails.io.sources.geonorge.feedparser.parse")
-    def test_get_download_info_with_feed_parse_error(self, mock_parse):
+    def test_get_download_info_with_feed_parse_error(self, mock_parse, mock_get, tmp_path):
         """Test handling of feed parse errors."""
         # Make feedparser return a bozo feed (parse error)
         mock_parse.return_value = Mock(
@@ -787,16 +1160,16 @@ class TestSource:
             entries=[],  # Need entries for iteration
         )
 
-        source = Source()
+        source = Source(cache_dir=str(tmp_path))
         with pytest.raises(ValueError, match="No entries found in ATOM feed"):
             source._get_download_info()
 
-    def test_progress_callback_is_called(self, tmp_path):
-        """Test that progress messages are printed during loading."""
+    def test_progress_callback_is_called(self, tmp_path, caplog):
+        """Test that progress messages are logged during loading."""
         source = Source(cache_dir=str(tmp_path))
 
         # Since load_turrutebasen doesn't have progress_callback parameter,
-        # we verify that downloading/loading messages are printed
+        # we verify that downloading/loading messages are logged
         with patch.object(source, "_get_download_info") as mock_info:
             mock_info.return_value = Mock(url="http://test.com/data.zip", title="Test Data", updated="2025-01-01")
 
@@ -808,22 +1181,13 @@ class TestSource:
                 with patch.object(source, "_load_fgdb_from_zip") as mock_load:
                     mock_load.return_value = ({"layer1": create_test_geodataframe(1)}, {})
 
-                    # Capture print output to verify progress messages
-                    import io
-                    import sys
-
-                    captured_output = io.StringIO()
-                    sys.stdout = captured_output
-
-                    try:
+                    with caplog.at_level(logging.INFO, logger="trails.io.sources.geonorge"):
                         source.load_turrutebasen()
-                        output = captured_output.getvalue()
-                        # Verify some progress indication was shown
-                        assert "Loading" in output or "FGDB" in output
-                    finally:
-                        sys.stdout = sys.__stdout__
 
-    @patch("trails.io.sources.geonorge.gpd.list_layers")
+                    # Verify some progress indication was shown
+                    assert "Loading" in caplog.text or "FGDB" in caplog.text
+
+    @patch("trails.io.sources.geonorge.pyogrio.list_layers")
     def test_load_fgdb_with_empty_layers_list(self, mock_list, tmp_path):
         """Test handling of FGDB with no layers."""
         import zipfile
@@ -834,7 +1198,7 @@ class TestSource:
             zf.writestr("Test.gdb/dummy", "content")
 
         # Mock empty layers list
-        mock_list.return_value = pd.DataFrame({"name": [], "geometry_type": []})
+        mock_list.return_value = np.empty((0, 2), dtype=object)
 
         source = Source()
         # Should raise ValueError when no layers found
@@ -845,8 +1209,9 @@ class TestSource:
 class TestIntegration:
     """End-to-end integration tests."""
 
+    @patch("trails.io.sources.geonorge.requests.get")
     @patch("trails.io.cache.requests")
-    def test_load_with_real_fixtures(self, mock_requests, geonorge_zip_fixture, geonorge_atom_fixture, tmp_path):
+    def test_load_with_real_fixtures(self, mock_requests, mock_feed_get, geonorge_zip_fixture, geonorge_atom_fixture, tmp_path, caplog):
         """Test with real fixture files (if they exist)."""
         if not geonorge_zip_fixture.exists() or not geonorge_atom_fixture.exists():
             pytest.skip("Fixtures not found. Run 'command make fixtures' to generate them.")
@@ -860,45 +1225,25 @@ class TestIntegration:
             zip_content = f.read()
 
         # Mock HTTP responses to return our fixture content
-        mock_atom_response = Mock()
-        mock_atom_response.text = atom_content
-        mock_atom_response.raise_for_status = Mock()
+        mock_feed_get.return_value = mock_feed_response(content=atom_content.encode())
 
         mock_zip_response = Mock()
         mock_zip_response.headers = {"content-length": str(len(zip_content))}
         mock_zip_response.iter_content = Mock(return_value=[zip_content[i : i + 8192] for i in range(0, len(zip_content), 8192)])
         mock_zip_response.raise_for_status = Mock()
 
-        def get_side_effect(url, stream=False):
-            if "ATOM" in url:
-                return mock_atom_response
-            else:
-                return mock_zip_response
-
-        mock_requests.get.side_effect = get_side_effect
+        mock_requests.get.return_value = mock_zip_response
 
         # Now test with real geopandas/GDAL processing
-        # Capture stdout to verify progress messages
-        import io
-        import sys
-
-        captured_output = io.StringIO()
-        old_stdout = sys.stdout
-        sys.stdout = captured_output
-
-        try:
+        # Capture log records to verify progress messages
+        with caplog.at_level(logging.INFO, logger="trails.io.sources.geonorge"):
             source = Source(cache_dir=str(tmp_path))
             trail_data = source.load_turrutebasen()
 
-            # Get the captured output
-            output = captured_output.getvalue()
-
-            # Verify progress messages were shown
-            assert "Fetching download URL" in output or "Loading" in output, "Should show progress about fetching/loading"
-            assert "Download" in output or "Processing" in output or "FGDB" in output, "Should show progress about download/processing"
-
-        finally:
-            sys.stdout = old_stdout
+        # Verify progress messages were shown
+        output = caplog.text
+        assert "Fetching download URL" in output or "Loading" in output, "Should show progress about fetching/loading"
+        assert "Download" in output or "Processing" in output or "FGDB" in output, "Should show progress about download/processing"
 
         # Verify we got real data
         assert isinstance(trail_data, TrailData)
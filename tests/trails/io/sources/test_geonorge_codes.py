@@ -8,6 +8,7 @@ from trails.io.sources.geonorge_codes import (
     get_code,
     get_description,
     get_entry,
+    get_mapping,
     get_value,
     has_code_table,
 )
@@ -152,6 +153,32 @@ class TestGetValue:
         assert value == "Asfalt/betong"
 
 
+class TestGetMapping:
+    """Test get_mapping function."""
+
+    def test_mapping_matches_get_value(self):
+        """Test get_mapping gives the same values as get_value for every code."""
+        for language in Language:
+            mapping = get_mapping("gradering", language)
+            assert set(mapping) == set(CODE_TABLES["gradering"])
+            for code, value in mapping.items():
+                assert value == get_value("gradering", code, language)
+
+    def test_invalid_column(self):
+        """Test get_mapping with invalid column returns an empty mapping."""
+        assert get_mapping("invalid_column", Language.NO) == {}
+
+    def test_mapping_built_once(self):
+        """Test get_mapping returns the same mapping on repeated calls."""
+        assert get_mapping("gradering", Language.EN) is get_mapping("gradering", Language.EN)
+
+    def test_mapping_read_only(self):
+        """Test the shared mapping cannot be modified by a caller."""
+        with pytest.raises(TypeError):
+            get_mapping("gradering", Language.NO)["G"] = "Changed"  # type: ignore[index]
+        assert get_value("gradering", "G", Language.NO) != "Changed"
+
+
 class TestGetDescription:
     """Test get_description function."""
 
@@ -1,10 +1,16 @@
 """Tests for cache implementations."""
 
+import hashlib
 import json
+import pickle
 from dataclasses import dataclass
 from unittest.mock import Mock, patch
 
+import geopandas as gpd
+import numpy as np
+import pandas as pd
 import pytest
+from shapely.geometry import LineString
 
 from trails.io import cache
 
@@ -131,6 +137,194 @@ class TestObject:
         object_cache.save(key, {"type": "dict now"})
         assert object_cache.load(key) == {"type": "dict now"}
 
+    def test_save_and_load_dataframe_as_parquet(self, object_cache):
+        """DataFrames are stored as Parquet and round-trip unchanged."""
+        df = pd.DataFrame({"name": ["a", "b", None], "length": [1.5, 2.0, 3.25]}, index=[10, 20, 30])
+
+        object_cache.save("test_df", df)
+
+        assert (object_cache.cache_dir / "test_df.parquet").exists()
+        assert not (object_cache.cache_dir / "test_df.pkl").exists()
+        pd.testing.assert_frame_equal(object_cache.load("test_df"), df)
+
+    def test_save_and_load_geodataframe_as_parquet(self, object_cache):
+        """GeoDataFrames are stored as GeoParquet and keep geometry and CRS."""
+        gdf = gpd.GeoDataFrame(
+            {"name": ["a", "b"]},
+            geometry=[LineString([(0, 0), (1, 1)]), LineString([(1, 1), (2, 0)])],
+            crs="EPSG:25833",
+        )
+
+        object_cache.save("test_gdf", gdf)
+
+        assert (object_cache.cache_dir / "test_gdf.parquet").exists()
+        loaded = object_cache.load("test_gdf")
+        assert isinstance(loaded, gpd.GeoDataFrame)
+        assert loaded.crs == gdf.crs
+        assert loaded.geometry.equals(gdf.geometry)
+
+    def test_dataframe_not_representable_falls_back_to_pickle(self, object_cache):
+        """DataFrames Parquet cannot store (mixed-type object columns) are pickled."""
+        df = pd.DataFrame({"mixed": [1, "a"]})
+
+        object_cache.save("test_mixed_column", df)
+
+        assert (object_cache.cache_dir / "test_mixed_column.pkl").exists()
+        assert not (object_cache.cache_dir / "test_mixed_column.parquet").exists()
+        pd.testing.assert_frame_equal(object_cache.load("test_mixed_column"), df)
+
+    @pytest.mark.parametrize("values", [[[1, 2], [3]], [(1, 2), (3,)], ["a", float("nan")]])
+    def test_dataframe_changed_by_parquet_falls_back_to_pickle(self, object_cache, values):
+        """DataFrames Parquet would return changed (lists, tuples, NaN in strings) are pickled."""
+        df = pd.DataFrame({"values": values})
+
+        object_cache.save("changed", df)
+
+        assert (object_cache.cache_dir / "changed.pkl").exists()
+        loaded = object_cache.load("changed")
+        pd.testing.assert_frame_equal(loaded, df)
+        assert type(loaded["values"].iloc[0]) is type(values[0])
+
+    @pytest.mark.parametrize(
+        "values",
+        [
+            pd.Categorical([1, 2, 1]),
+            pd.Series(pd.to_datetime(["2025-01-01", "2025-06-01"])).astype("datetime64[s]"),
+            pd.array(["a", None], dtype="string[pyarrow]"),
+            pd.array(["a", None], dtype=pd.StringDtype("python", na_value=np.nan)),
+        ],
+        ids=["int_categories", "datetime_seconds", "pyarrow_string", "nan_string"],
+    )
+    def test_dtype_changed_by_parquet_falls_back_to_pickle(self, object_cache, values):
+        """DataFrames whose dtypes Parquet would change are pickled and load with the same dtypes."""
+        df = pd.DataFrame({"values": values})
+
+        object_cache.save("changed", df)
+
+        assert (object_cache.cache_dir / "changed.pkl").exists()
+        pd.testing.assert_frame_equal(object_cache.load("changed"), df)
+
+    @pytest.mark.parametrize(
+        "values",
+        [
+            pd.Categorical(["b", "a", None], categories=["b", "a", "c"], ordered=True),
+            pd.Series(pd.to_datetime(["2025-01-01", "2025-06-01"])).astype("datetime64[us]"),
+            pd.Series(pd.to_datetime(["2025-01-01", "2025-06-01"])).dt.tz_localize("Europe/Oslo"),
+            pd.array(["a", None], dtype="string[python]"),
+        ],
+        ids=["string_categories", "datetime_microseconds", "datetime_tz", "python_string"],
+    )
+    def test_dtype_kept_by_parquet_stored_as_parquet(self, object_cache, values):
+        """DataFrames whose dtypes Parquet keeps are stored as Parquet."""
+        df = pd.DataFrame({"values": values})
+
+        object_cache.save("kept", df)
+
+        assert (object_cache.cache_dir / "kept.parquet").exists()
+        pd.testing.assert_frame_equal(object_cache.load("kept"), df)
+
+    def test_save_replaces_entry_in_other_format(self, object_cache):
+        """Overwriting a pickled entry with a DataFrame leaves no stale file."""
+        object_cache.save("switch", "pickled value")
+        object_cache.save("switch", pd.DataFrame({"a": [1]}))
+
+        assert not (object_cache.cache_dir / "switch.pkl").exists()
+        assert isinstance(object_cache.load("switch"), pd.DataFrame)
+
+    def test_load_returns_fresh_object_by_default(self, object_cache):
+        """Without a memory cache, each load returns its own object."""
+        object_cache.save("df", pd.DataFrame({"a": [1, 2]}))
+
+        first = object_cache.load("df")
+        first.loc[0, "a"] = 99
+
+        assert object_cache.load("df")["a"].tolist() == [1, 2]
+
+    def test_load_returns_memoized_object(self, temp_cache_dir):
+        """Repeated loads of an unchanged entry are served from memory when enabled."""
+        object_cache = cache.Object(str(temp_cache_dir / "objects"), memory_cache_size=8)
+        object_cache.save("memo", {"data": [1, 2, 3]})
+
+        first = object_cache.load("memo")
+        with patch("trails.io.cache.pickle.load") as mock_load:
+            second = object_cache.load("memo")
+
+        assert second is first
+        mock_load.assert_not_called()
+
+    def test_load_after_save_returns_new_data(self, temp_cache_dir):
+        """Saving a key invalidates its in-memory copy."""
+        object_cache = cache.Object(str(temp_cache_dir / "objects"), memory_cache_size=8)
+        object_cache.save("memo", "old")
+        assert object_cache.load("memo") == "old"
+
+        object_cache.save("memo", "new")
+        assert object_cache.load("memo") == "new"
+
+    def test_memory_cache_is_bounded(self, temp_cache_dir):
+        """Least recently loaded entries are evicted from memory."""
+        object_cache = cache.Object(str(temp_cache_dir / "objects"), memory_cache_size=2)
+        for i in range(3):
+            object_cache.save(f"key_{i}", i)
+            object_cache.load(f"key_{i}")
+
+        assert list(object_cache._memcache) == ["key_1", "key_2"]
+
+    def test_save_leaves_no_temporary_files(self, object_cache):
+        """Atomic writes move their temporary files into place."""
+        object_cache.save("atomic", {"data": 1}, metadata={"source": "test"})
+        object_cache.save("atomic_df", pd.DataFrame({"a": [1, 2]}))
+
+        names = sorted(p.name for p in object_cache.cache_dir.iterdir())
+        assert names == ["atomic.meta.json", "atomic.pkl", "atomic_df.parquet"]
+
+    def test_saved_files_follow_umask(self, object_cache):
+        """Cache files get the same permissions as files created with open()."""
+        object_cache.save("df", pd.DataFrame({"a": [1]}), metadata={"source": "test"})
+        object_cache.save("obj", {"a": 1})
+        reference = object_cache.cache_dir / "reference"
+        reference.write_text("")
+        expected = reference.stat().st_mode & 0o777
+
+        for name in ["df.parquet", "df.meta.json", "obj.pkl"]:
+            assert (object_cache.cache_dir / name).stat().st_mode & 0o777 == expected
+
+    def test_umask_read_without_changing_it(self, monkeypatch):
+        """Reading the umask does not set it, which would briefly change it for every thread."""
+
+        def set_umask(mask):
+            raise AssertionError("os.umask called")
+
+        monkeypatch.setattr(cache.os, "umask", set_umask)
+
+        assert 0o666 & ~cache._current_umask() == cache.FILE_MODE
+
+    def test_failed_save_keeps_previous_entry(self, object_cache):
+        """A save that fails midway leaves the previous value intact."""
+        object_cache.save("keep", "old value")
+
+        with pytest.raises((AttributeError, pickle.PicklingError)):
+            object_cache.save("keep", lambda: None)  # lambdas cannot be pickled
+
+        assert object_cache.load("keep") == "old value"
+        assert not list(object_cache.cache_dir.glob("*.tmp"))
+
+    def test_async_save(self, object_cache):
+        """async_save returns a future and the entry is available once it completes."""
+        metadata = {"index": 1}
+        future = object_cache.save("async_key", {"data": "value"}, metadata=metadata, async_save=True)
+
+        assert future is not None
+        future.result(timeout=10)
+        assert object_cache.load("async_key") == {"data": "value"}
+        assert object_cache.get_metadata("async_key")["index"] == 1
+        # The background save does not write into the caller's dict
+        assert metadata == {"index": 1}
+
+    def test_sync_save_returns_none(self, object_cache):
+        """Synchronous saves return None."""
+        assert object_cache.save("sync_key", "data") is None
+
     def test_load_nonexistent_raises_error(self, object_cache):
         """FileNotFoundError for missing keys."""
         with pytest.raises(FileNotFoundError) as exc_info:
@@ -233,6 +427,29 @@ class TestObject:
         assert not pkl_file.exists()
         assert not meta_file.exists()
 
+    def test_delete_removes_directory_entry(self, object_cache):
+        """A directory entry from get_dir_path(key) is removed with the entry."""
+        key = "test_directory"
+        directory = object_cache.get_dir_path(key)
+        (directory / "tables").mkdir(parents=True)
+        (directory / "tables" / "layer.parquet").write_bytes(b"data")
+        assert object_cache.exists(key) is True
+
+        object_cache.delete(key)
+
+        assert not directory.exists()
+        assert object_cache.exists(key) is False
+
+    def test_delete_keeps_unrelated_directory(self, object_cache):
+        """A directory the cache did not create survives deleting the key of the same name."""
+        directory = object_cache.get_path("unrelated")
+        directory.mkdir()
+        (directory / "file.txt").write_text("keep")
+
+        object_cache.delete("unrelated")
+
+        assert (directory / "file.txt").exists()
+
     def test_delete_nonexistent_entry(self, object_cache):
         """No error when deleting missing key."""
         # Should not raise any exception
@@ -290,6 +507,32 @@ class TestObject:
         files = list(object_cache.cache_dir.iterdir())
         assert len(files) == 0
 
+    def test_clear_keeps_files_being_written(self, object_cache):
+        """Temporary files of in-progress saves survive a clear."""
+        tmp_file = object_cache.cache_dir / f".key.pkl.abc{cache.TEMP_SUFFIX}"
+        tmp_file.write_bytes(b"partial")
+        object_cache.save("key", "data")
+
+        object_cache.clear()
+
+        assert not object_cache.exists("key")
+        assert tmp_file.exists()
+
+    def test_clear_removes_only_directory_entries(self, object_cache):
+        """Directory entries are cleared; other subdirectories of the cache directory survive."""
+        object_cache.get_dir_path("stored").mkdir()
+        (object_cache.get_dir_path("stored") / "metadata.json").write_text("{}")
+        unrelated = object_cache.cache_dir / "unrelated"
+        unrelated.mkdir()
+        in_progress = object_cache.cache_dir / f".stored{cache.Object.DIR_SUFFIX}.abc"
+        in_progress.mkdir()
+
+        object_cache.clear()
+
+        assert not object_cache.exists("stored")
+        assert unrelated.exists()
+        assert in_progress.exists()
+
     def test_clear_preserves_directory(self, object_cache):
         """Cache directory remains after clear."""
         object_cache.save("test", "data")
@@ -378,6 +621,7 @@ class TestDownload:
             metadata = json.load(f)
         assert metadata["url"] == "http://example.com/file.zip"
         assert metadata["file_size"] == 18  # len(b"chunk1chunk2chunk3")
+        assert metadata["blake2b"] == hashlib.blake2b(b"chunk1chunk2chunk3", digest_size=16).hexdigest()
 
     @patch("trails.io.cache.requests")
     def test_use_cached_file(self, mock_requests, download_cache):